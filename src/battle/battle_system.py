@@ -1,4 +1,3 @@
-import random
 import time
 
 class BattleSystem:
@@ -7,6 +6,7 @@ class BattleSystem:
     def __init__(self, game_state, ui):
         self.game_state = game_state
         self.ui = ui
+        self.rng = game_state.rng.stream("battle")
         self.player_party = []
         self.enemy_party = []
         self.turn_order = []
@@ -31,21 +31,21 @@ class BattleSystem:
         self.player_party = [self.game_state.player]
         self.player_party.extend(self.game_state.companions)
         
-        # Set up enemy party
-        self.enemy_party = enemies
+        # Set up enemy party; enemies from the shared database fight as fresh copies
+        self.enemy_party = [enemy.thaw() if enemy.is_frozen() else enemy for enemy in enemies]
         
         # Calculate total possible rewards
         self.battle_rewards = {
             "experience": sum(enemy.experience_reward for enemy in enemies),
             "items": [],
-            "credits": random.randint(10, 30) * len(enemies)
+            "credits": self.rng.randint(10, 30) * len(enemies)
         }
         
         # Determine turn order based on initiative
         self._calculate_turn_order()
         
         # Show battle start message
-        enemy_names = ", ".join(enemy.name for enemy in enemies)
+        enemy_names = ", ".join(enemy.name for enemy in self.enemy_party)
         self.ui.display_message(f"Battle started! Opponents: {enemy_names}")
         self.ui.display_battle_status(self.player_party, self.enemy_party)
         
@@ -139,7 +139,7 @@ class BattleSystem:
             if healing_abilities and companion.current_energy >= healing_abilities[0]["energy_cost"]:
                 # Use healing ability on self
                 ability = healing_abilities[0]
-                heal_amount = random.randint(15, 25) + companion.medicine * 2
+                heal_amount = self.rng.randint(15, 25) + companion.medicine * 2
                 companion.heal(heal_amount)
                 companion.use_energy(ability["energy_cost"])
                 self.ui.display_message(f"{companion.name} uses {ability['name']} and recovers {heal_amount} health!")
@@ -161,10 +161,10 @@ class BattleSystem:
             valid_targets = [character for character in self.player_party if character.current_health > 0]
             if not valid_targets:
                 return
-            target = random.choice(valid_targets)
+            target = self.rng.choice(valid_targets)
             
         # Determine attack damage
-        base_damage = enemy.attack + random.randint(1, 6)
+        base_damage = enemy.attack + self.rng.randint(1, 6)
         damage_dealt = target.take_damage(base_damage)
         
         self.ui.display_message(f"{enemy.name} attacks {target.name} for {damage_dealt} damage!")
@@ -194,10 +194,10 @@ class BattleSystem:
             if not valid_targets:
                 return
                 
-            target = random.choice(valid_targets)
+            target = self.rng.choice(valid_targets)
             
         # Calculate damage
-        base_damage = attacker.attack_power + random.randint(1, 8)
+        base_damage = attacker.attack_power + self.rng.randint(1, 8)
         damage_dealt = target.take_damage(base_damage)
         
         self.ui.display_message(f"{attacker.name} attacks {target.name} for {damage_dealt} damage!")
@@ -225,7 +225,7 @@ class BattleSystem:
             ability = user.abilities[choice]
         else:
             # AI selects ability
-            ability = random.choice(user.abilities)
+            ability = self.rng.choice(user.abilities)
             
         # Check if enough energy
         if not user.use_energy(ability["energy_cost"]):
@@ -246,7 +246,7 @@ class BattleSystem:
             # Deal high damage to single target
             target = self._select_target(is_player)
             if target:
-                damage = user.attack_power * 2 + random.randint(5, 10)
+                damage = user.attack_power * 2 + self.rng.randint(5, 10)
                 damage_dealt = target.take_damage(damage)
                 self.ui.display_message(f"{user.name} uses {ability['name']} and deals {damage_dealt} damage to {target.name}!")
                 
@@ -262,7 +262,7 @@ class BattleSystem:
                 heal_targets = [char for char in self.player_party if char.current_health > 0]
                 target = min(heal_targets, key=lambda x: x.current_health / x.max_health)
                 
-            heal_amount = user.medicine * 3 + random.randint(15, 25)
+            heal_amount = user.medicine * 3 + self.rng.randint(15, 25)
             actual_heal = target.heal(heal_amount)
             self.ui.display_message(f"{user.name} uses {ability['name']} and heals {target.name} for {actual_heal} health!")
             
@@ -326,7 +326,7 @@ class BattleSystem:
             if not valid_targets:
                 return None
                 
-            return random.choice(valid_targets)
+            return self.rng.choice(valid_targets)
             
     def _advance_turn(self):
         """Move to the next turn in the battle."""
@@ -358,7 +358,7 @@ class BattleSystem:
         
         # Collect loot from enemies
         for enemy in self.enemy_party:
-            loot = enemy.get_loot()
+            loot = enemy.get_loot(self.game_state.rng.stream("loot"))
             self.battle_rewards["items"].extend(loot)
             
         # Display rewards
@@ -378,6 +378,7 @@ class BattleSystem:
             
         # End battle
         self.game_state.battle_in_progress = False
+        self.game_state.notify_outcome("battle", "victory", [item.id for item in self.battle_rewards["items"]])
         
     def _handle_defeat(self):
         """Process defeat results."""
@@ -386,6 +387,7 @@ class BattleSystem:
         # Implement consequences of defeat
         # This could be game over, respawn at a checkpoint, etc.
         self.game_state.battle_in_progress = False
+        self.game_state.notify_outcome("battle", "defeat", [])
         
     def end_battle(self):
         """Clean up after battle ends."""
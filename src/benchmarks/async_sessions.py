@@ -0,0 +1,87 @@
+"""
+Async sessions benchmark - many concurrent playthroughs on one event loop.
+
+Each session plays through play_session against an in-memory stream. A
+scripted player answers every prompt after a short think time, picking
+choices at random, and presses Enter to skip some of the text while it is
+being typed, so both the timers and the skip path are exercised.
+
+Run from the src directory:
+    python -m benchmarks.async_sessions [session_count]
+"""
+import asyncio
+import random
+import sys
+import threading
+import time
+from core.async_engine import play_session
+
+SESSION_COUNT = 500
+THINK_TIME = 0.2  # Seconds the scripted player takes to answer a prompt
+SKIP_CHANCE = 0.5  # Chance the scripted player skips text being typed
+
+class ScriptedPlayer:
+    """Stream writer that answers the prompts it sees by feeding a StreamReader."""
+    
+    def __init__(self, reader, rng):
+        self.reader = reader
+        self.rng = rng
+        self.option_count = 1
+        self.pending = None  # Handle of the scheduled answer or skip
+        self.bytes_written = 0
+        
+    def write(self, data):
+        self.bytes_written += len(data)
+        text = data.decode("utf-8")
+        option_count = sum(1 for line in text.splitlines() if line.startswith("["))
+        if option_count:
+            # get_choice writes its whole option list at once
+            self.option_count = option_count
+        
+        if text.startswith("Press Enter"):
+            self.schedule(THINK_TIME, "\n")
+        elif text.endswith("> ") or text.endswith("(number): "):
+            answer = str(self.rng.randint(1, self.option_count)) if text.endswith("(number): ") else "Tester"
+            self.schedule(THINK_TIME, f"{answer}\n")
+        elif self.pending is None and self.rng.random() < SKIP_CHANCE:
+            self.schedule(THINK_TIME, "\n")
+            
+    def schedule(self, seconds, line):
+        if self.pending is not None:
+            self.pending.cancel()
+        self.pending = asyncio.get_running_loop().call_later(seconds, self.feed, line)
+        
+    def feed(self, line):
+        self.pending = None
+        self.reader.feed_data(line.encode("utf-8"))
+        
+    async def drain(self):
+        pass
+
+async def run_sessions(session_count, seed=2157):
+    """Run session_count sessions concurrently and return their engines."""
+    rng = random.Random(seed)
+    
+    sessions = []
+    for _ in range(session_count):
+        reader = asyncio.StreamReader()
+        player = ScriptedPlayer(reader, random.Random(rng.random()))
+        sessions.append(play_session(reader, player))
+        
+    return await asyncio.gather(*sessions)
+
+def main():
+    session_count = int(sys.argv[1]) if len(sys.argv) > 1 else SESSION_COUNT
+    
+    start = time.perf_counter()
+    engines = asyncio.run(run_sessions(session_count))
+    elapsed = time.perf_counter() - start
+    
+    finished = sum(1 for engine in engines if not engine.game_state.is_running)
+    written = sum(engine.ui.writer.bytes_written for engine in engines)
+    print(f"Sessions: {session_count}  finished: {finished}  threads: {threading.active_count()}")
+    print(f"Output written: {written / 1024:.0f} KB")
+    print(f"Wall time: {elapsed:.1f}s for all sessions on one event loop")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Autosave stress test - autosave hammered by the headless engine, and killed mid-write.
+
+First it plays GAME_COUNT headless games at full speed, saving on every
+story event (each node entry and each choice), and reports how long
+save() held up the game thread, how many snapshots the writer coalesced,
+and games per second against a run without autosave. Once the writer has
+stopped, the save file must load back as the state of the last game.
+
+Then it launches KILL_COUNT child processes that autosave games in a loop
+with fsync and SIGKILLs each at a random moment. Every save file left
+behind must load.
+
+Run from the src directory:
+    python -m benchmarks.autosave_stress [game_count] [kill_count]
+"""
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from core import save_game
+from core.autosave import Autosaver
+from core.game_state import GameState
+from core.game_engine import GameEngine
+from core.headless import run_engine
+from ui.null_ui import NullUI, random_policy
+
+GAME_COUNT = 2000
+KILL_COUNT = 20
+KILL_AFTER = (0.15, 0.6)  # Seconds; the child needs about 0.1 s to import the game
+
+def play_games(game_count, autosaver=None, latencies=None):
+    """Play game_count games, saving on every story event if an autosaver is given; return the last state."""
+    rng = random.Random(2157)
+    for _ in range(game_count):
+        game_state = GameState()
+        engine = GameEngine(game_state, NullUI(random_policy(random.Random(rng.random()))))
+        if autosaver is not None:
+            def on_story_event(event, node_id, choice, game_state=game_state):
+                start = time.perf_counter()
+                autosaver.save(game_state)
+                latencies.append(time.perf_counter() - start)
+            engine.add_story_listener(on_story_event)
+            
+        engine.start_new_game()
+        run_engine(engine)
+    return game_state
+
+def percentile(values, fraction):
+    return sorted(values)[min(int(len(values) * fraction), len(values) - 1)]
+
+def hammer(directory, game_count):
+    start = time.perf_counter()
+    play_games(game_count)
+    baseline = time.perf_counter() - start
+    
+    path = os.path.join(directory, "hammer.save")
+    autosaver = Autosaver(path).start()
+    latencies = []
+    start = time.perf_counter()
+    last_state = play_games(game_count, autosaver, latencies)
+    elapsed = time.perf_counter() - start
+    autosaver.stop()
+    
+    print(f"Hammer: {game_count} games, {autosaver.requested} saves")
+    print(f"  games/s        {game_count / baseline:8.0f} without autosave, {game_count / elapsed:8.0f} with")
+    print(f"  save() on the game thread: p50 {percentile(latencies, 0.5) * 1e6:.1f} us, "
+          f"p99 {percentile(latencies, 0.99) * 1e6:.1f} us, max {max(latencies) * 1e6:.1f} us")
+    print(f"  written        {autosaver.written}, failed {autosaver.failed} "
+          f"({autosaver.requested - autosaver.written - autosaver.failed} coalesced away)")
+    
+    matches = save_game.dump_state(save_game.load(path)) == save_game.dump_state(last_state)
+    print(f"  final save     {'matches the last game' if matches else 'DOES NOT match the last game'}")
+    return matches
+
+def autosave_forever(path):
+    """Child process: autosave headless games until killed."""
+    autosaver = Autosaver(path).start()
+    rng = random.Random()
+    while True:
+        game_state = GameState()
+        engine = GameEngine(game_state, NullUI(random_policy(random.Random(rng.random()))))
+        autosaver.attach(engine)
+        engine.start_new_game()
+        run_engine(engine)
+
+def kill_mid_write(directory, kill_count):
+    rng = random.Random(2157)
+    corrupt = missing = 0
+    for i in range(kill_count):
+        path = os.path.join(directory, f"killed-{i}.save")
+        child = subprocess.Popen([sys.executable, "-m", "benchmarks.autosave_stress", "child", path])
+        time.sleep(rng.uniform(*KILL_AFTER))
+        child.send_signal(signal.SIGKILL)
+        child.wait()
+        
+        if not os.path.exists(path):
+            missing += 1  # Killed before the first save finished; nothing to corrupt
+            continue
+        try:
+            save_game.load(path)
+        except ValueError:
+            corrupt += 1
+            
+    print(f"Killed mid-write: {kill_count} children, {corrupt} corrupt saves, {missing} killed before their first save")
+    return corrupt == 0
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "child":
+        autosave_forever(sys.argv[2])
+        
+    game_count = int(sys.argv[1]) if len(sys.argv) > 1 else GAME_COUNT
+    kill_count = int(sys.argv[2]) if len(sys.argv) > 2 else KILL_COUNT
+    with tempfile.TemporaryDirectory() as directory:
+        passed = hammer(directory, game_count)
+        passed = kill_mid_write(directory, kill_count) and passed
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Battle redraw benchmark - process spawns and bytes written per battle.
+
+Fights BATTLE_COUNT battles through TextUI with scripted input and no
+delays, once with the original clear_screen (os.system) and full
+battle-status redraws, and once with the escape-sequence Screen. os.system
+is patched to count calls without spawning anything.
+
+Run from the src directory:
+    python -m benchmarks.battle_redraw [battle_count]
+"""
+import io
+import os
+import random
+import sys
+from contextlib import redirect_stdout
+from unittest import mock
+from core.game_state import GameState
+from core.game_engine import BACKGROUNDS, create_player
+from battle.battle_system import BattleSystem
+from characters.npc import Enemy
+from ui.text_ui import TextUI
+
+BATTLE_COUNT = 200
+
+class LegacyTextUI(TextUI):
+    """TextUI with the original clear_screen and full battle-status redraw."""
+    
+    def clear_screen(self):
+        os.system('cls' if os.name == 'nt' else 'clear')
+        
+    def display_battle_status(self, player_party, enemy_party):
+        self.clear_screen()
+        self.print("=== BATTLE ===")
+        self.print("YOUR PARTY:")
+        for character in player_party:
+            health_bar = "█" * int(20 * character.current_health / character.max_health)
+            self.print(f"{character.name}: {health_bar} {character.current_health}/{character.max_health}")
+            
+        self.print("\nENEMIES:")
+        for enemy in enemy_party:
+            health_bar = "█" * int(20 * enemy.current_health / enemy.max_health)
+            self.print(f"{enemy.name}: {health_bar} {enemy.current_health}/{enemy.max_health}")
+            
+        self.print()
+
+def fight_battles(ui_class, battle_count):
+    """Fight battles and return (os.system calls, bytes written, full redraws, partial redraws)."""
+    rng = random.Random(2157)
+    output = io.StringIO()
+    
+    with mock.patch("os.system", return_value=0) as system, \
+            mock.patch("time.sleep"), \
+            mock.patch("builtins.input", lambda *args: "1"), \
+            redirect_stdout(output):
+        ui = ui_class(chars_per_second=0)
+        # A tall terminal, as an interactive player would usually have
+        ui.screen.size = (80, 50)
+        
+        for seed in range(battle_count):
+            game_state = GameState(seed=rng.getrandbits(64))
+            game_state.player = create_player("Bench", BACKGROUNDS[seed % len(BACKGROUNDS)])
+            
+            battle = BattleSystem(game_state, ui)
+            battle.initialize_battle([Enemy("drone", "Security Drone", "Benchmark enemy.", level=1),
+                                      Enemy("sentry", "Sentry Unit", "Benchmark enemy.", level=1)])
+            while battle.process_turn() is None:
+                pass
+                
+    return system.call_count, len(output.getvalue().encode("utf-8")), ui.screen.full_redraws, ui.screen.partial_redraws
+
+def main():
+    battle_count = int(sys.argv[1]) if len(sys.argv) > 1 else BATTLE_COUNT
+    
+    print(f"Battles: {battle_count}")
+    for name, ui_class in (("os.system clear", LegacyTextUI), ("escape-sequence screen", TextUI)):
+        spawns, written, full, partial = fight_battles(ui_class, battle_count)
+        print(f"{name:23}  process spawns: {spawns:5}  bytes/battle: {written / battle_count:7.0f}  "
+              f"frames full/partial: {full}/{partial}")
+
+if __name__ == "__main__":
+    main()
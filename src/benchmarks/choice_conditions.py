@@ -0,0 +1,156 @@
+"""
+Choice filtering benchmark - compiled predicates vs. the reference interpreter.
+
+Builds story nodes with many conditional choices, asserts that the compiled
+predicates agree with GameEngine.check_choice_condition on randomized game
+states (failing on the first mismatch), then times choice filtering with
+both.
+
+Run from the src directory:
+    python -m benchmarks.choice_conditions
+"""
+import random
+import time
+from core.game_state import GameState
+from core.game_engine import GameEngine
+from core.story_node import StoryNode
+from characters.player import Player
+from items.item import Item
+from story.story_data import story_nodes
+
+STATS = ["tech", "logic", "combat", "endurance", "charm", "insight", "medicine", "knowledge"]
+FLAGS = [f"flag_{i}" for i in range(40)]
+CHARACTERS = ["vex", "marcus", "nova", "echo", "phoenix", "mori", "kent"]
+ITEMS = [f"item_{i}" for i in range(20)]
+
+def random_conditions(rng):
+    """Create a random conditions dict mixing all condition types."""
+    conditions = {}
+    
+    if rng.random() < 0.6:
+        conditions["flag"] = {flag: rng.random() < 0.8 for flag in rng.sample(FLAGS, rng.randint(1, 3))}
+    if rng.random() < 0.5:
+        conditions["stat"] = {stat: rng.randint(2, 8) for stat in rng.sample(STATS, rng.randint(1, 2))}
+    if rng.random() < 0.3:
+        conditions["item"] = rng.choice(ITEMS)
+    if rng.random() < 0.4:
+        conditions["relationship"] = {char_id: rng.randint(-2, 5) for char_id in rng.sample(CHARACTERS, rng.randint(1, 2))}
+        
+    return conditions
+
+# Conditions the random ones rarely or never produce: a flag required to be False or None,
+# a stat Player doesn't have, an unknown condition type and empty requirements
+EDGE_CONDITIONS = [
+    None,
+    {},
+    {"flag": {}},
+    {"flag": {"flag_0": False}},
+    {"flag": {"unset_flag": None}},
+    {"stat": {"luck": 0}},
+    {"stat": {"luck": 1}},
+    {"stat": {}},
+    {"stat": {"tech": 9, "logic": 1}},
+    {"stat": {"tech": 0, "charm": 2}},
+    {"item": "item_0", "flag": {"flag_1": True}},
+    {"relationship": {"unknown_character": 0}},
+    {"relationship": {"vex": -3}},
+    {"weather": "rain"},
+    {"weather": "rain", "stat": {"charm": 5}}
+]
+
+def build_edge_node():
+    """Create a story node with one choice per edge case condition."""
+    node = StoryNode("bench_edges", "Benchmark edge cases.")
+    for i, conditions in enumerate(EDGE_CONDITIONS):
+        node.add_choice(f"Edge {i}", node.id, conditions=conditions)
+    return node
+
+def build_nodes(rng, node_count=50, choices_per_node=60):
+    """Create story nodes where every node has many conditional choices."""
+    nodes = {}
+    for i in range(node_count):
+        node = StoryNode(f"bench_{i}", "Benchmark node.")
+        for j in range(choices_per_node):
+            node.add_choice(f"Choice {j}", f"bench_{(i + j) % node_count}", conditions=random_conditions(rng))
+        nodes[node.id] = node
+        
+    return nodes
+
+def random_state(rng):
+    """Create a game state with random flags, stats, items and relationships."""
+    game_state = GameState()
+    game_state.player = Player("Bench", "engineer", **{stat: rng.randint(1, 9) for stat in STATS})
+    
+    for flag in rng.sample(FLAGS, rng.randint(0, len(FLAGS))):
+        game_state.add_story_flag(flag, rng.random() < 0.8)
+    for char_id in CHARACTERS:
+        if rng.random() < 0.7:
+            game_state.add_relationship(char_id, rng.randint(-3, 6))
+    for item_id in rng.sample(ITEMS, rng.randint(0, 6)):
+        game_state.add_to_inventory(Item(item_id, item_id, "Benchmark item.", 1))
+        
+    return game_state
+
+def check_equivalence(engine, nodes, states):
+    """Assert the compiled predicates agree with the reference interpreter."""
+    checked = 0
+    for game_state in states:
+        engine.game_state = game_state
+        for node in nodes.values():
+            for choice in node.choices:
+                expected = engine.check_choice_condition(choice)
+                actual = choice.is_available(game_state)
+                assert actual == expected, (
+                    f"Predicate for {choice.conditions!r} in {node.id} returned {actual}, "
+                    f"the interpreter {expected}"
+                )
+                checked += 1
+                
+    return checked
+
+def time_interpreted(engine, nodes, states, rounds):
+    """Time filtering every node's choices for every state with the reference interpreter."""
+    check = engine.check_choice_condition
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for game_state in states:
+            engine.game_state = game_state
+            for node in nodes.values():
+                [choice for choice in node.choices if check(choice)]
+                
+    return time.perf_counter() - start
+
+def time_compiled(nodes, states, rounds):
+    """Time filtering every node's choices for every state the way ChoiceCache does."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for game_state in states:
+            for node in nodes.values():
+                [choice for choice in node.choices if (choice.predicate or choice.compile())(game_state)]
+                
+    return time.perf_counter() - start
+
+def main(seed=2157, rounds=5):
+    rng = random.Random(seed)
+    nodes = build_nodes(rng)
+    states = [random_state(rng) for _ in range(40)]
+    
+    engine = GameEngine(GameState(), ui=None)
+    
+    checked = check_equivalence(engine, nodes, states)
+    checked += check_equivalence(engine, story_nodes, states)
+    # A game state before character creation has no player, so every stat reads as 0
+    checked += check_equivalence(engine, {"bench_edges": build_edge_node()}, states + [GameState()])
+    print(f"Equivalence: {checked} choice evaluations agree")
+    
+    evaluations = rounds * len(states) * sum(len(node.choices) for node in nodes.values())
+    interpreted_time = time_interpreted(engine, nodes, states, rounds)
+    compiled_time = time_compiled(nodes, states, rounds)
+    
+    print(f"Choices evaluated: {evaluations}")
+    print(f"Interpreter: {interpreted_time:.3f}s ({interpreted_time / evaluations * 1e9:.0f} ns/choice)")
+    print(f"Compiled:    {compiled_time:.3f}s ({compiled_time / evaluations * 1e9:.0f} ns/choice)")
+    print(f"Speedup:     {interpreted_time / compiled_time:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Choice journal benchmark - cost per choice of a journal vs. a full save.
+
+Plays GAME_COUNT headless games with random choices in a temporary
+directory, once saving the whole game state after every choice and once
+appending to a Journal that takes a snapshot every SNAPSHOT_EVERY events.
+Both write through to the OS without fsync. It reports the time and bytes
+of each kind of write, then recovers every journal and checks that replay
+rebuilt exactly the state the game ended in.
+
+Run from the src directory:
+    python -m benchmarks.choice_journal [game_count]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from core import save_game
+from core.game_state import GameState
+from core.game_engine import GameEngine
+from core.headless import run_engine
+from core.journal import Journal, recover
+from ui.null_ui import NullUI, random_policy
+
+GAME_COUNT = 500
+SNAPSHOT_EVERY = 4  # Story paths are short, so snapshot often enough to compact
+
+def new_totals():
+    return {"count": 0, "bytes": 0, "seconds": 0.0}
+
+def add(totals, seconds, size):
+    totals["count"] += 1
+    totals["seconds"] += seconds
+    totals["bytes"] += size
+
+class TimedJournal(Journal):
+    """Journal that adds up the time and size of its appends and snapshots."""
+    
+    appends = new_totals()
+    snapshots = new_totals()
+    
+    def append(self, record):
+        size = self.log.tell()
+        start = time.perf_counter()
+        super().append(record)
+        add(self.appends, time.perf_counter() - start, self.log.tell() - size)
+        
+    def checkpoint(self, entering=False):
+        start = time.perf_counter()
+        super().checkpoint(entering)
+        add(self.snapshots, time.perf_counter() - start, self.log.tell())
+
+def play(seed, directory, mode, full_saves):
+    """Play one game; return its save path and game state."""
+    game_state = GameState()
+    engine = GameEngine(game_state, NullUI(random_policy(random.Random(seed))))
+    path = os.path.join(directory, f"{seed}.{mode}")
+    
+    if mode == "journal":
+        journal = TimedJournal(path, SNAPSHOT_EVERY).attach(engine)
+    else:
+        def save_after_choice(event, node_id, choice):
+            # Entering the next node is the first point with the choice's consequences applied
+            if event == "enter_node" and node_id != "intro":
+                start = time.perf_counter()
+                size = save_game.save(path, game_state, fsync=False)
+                add(full_saves, time.perf_counter() - start, size)
+        engine.add_story_listener(save_after_choice)
+        
+    engine.start_new_game()
+    run_engine(engine)
+    if mode == "journal":
+        journal.close()
+    return path, game_state
+
+def report(label, totals):
+    count = max(totals["count"], 1)
+    print(f"  {label:16} {totals['count']:6} writes  {totals['seconds'] / count * 1e6:6.1f} us  "
+          f"{totals['bytes'] / count:6.0f} B each")
+
+def main():
+    game_count = int(sys.argv[1]) if len(sys.argv) > 1 else GAME_COUNT
+    rng = random.Random(2157)
+    seeds = [rng.random() for _ in range(game_count)]
+    full_saves = new_totals()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for seed in seeds:
+            play(seed, directory, "full-save", full_saves)
+        games = [play(seed, directory, "journal", None) for seed in seeds]
+        
+        print(f"Games: {game_count}, journal snapshot every {SNAPSHOT_EVERY} events")
+        report("full save", full_saves)
+        report("journal append", TimedJournal.appends)
+        report("journal snapshot", TimedJournal.snapshots)
+        
+        start = time.perf_counter()
+        mismatches = sum(save_game.dump_state(recover(path)) != save_game.dump_state(game_state)
+                         for path, game_state in games)
+        print(f"  recovery: {(time.perf_counter() - start) / game_count * 1e6:.1f} us per game, "
+              f"{mismatches} of {game_count} differ from the game they journaled")
+
+if __name__ == "__main__":
+    main()
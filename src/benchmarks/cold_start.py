@@ -0,0 +1,55 @@
+"""
+Cold start benchmark - eager vs. lazy fragment loading vs. the story bundle.
+
+Each measurement runs in a fresh interpreter: it imports the game engine,
+fetches the intro node and reports elapsed time and peak resident memory.
+The eager variant imports every fragment up front, as story_data used to.
+The bundle variant, which the game only uses when SYNTHESIS_STORY_BUNDLE
+points at one, is skipped until story.utils.build_bundle has been run.
+
+Run from the src directory:
+    python -m benchmarks.cold_start
+"""
+import os
+import subprocess
+import sys
+from story.bundle import DEFAULT_BUNDLE_PATH
+
+SNIPPET = """
+import resource, time
+start = time.perf_counter()
+from core.game_engine import GameEngine
+from story.story_data import story_nodes
+if {eager}:
+    story_nodes.load_all()
+story_nodes["intro"]
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(getattr(story_nodes, "loaded_fragments", ())))
+"""
+
+def measure(eager, bundle_path="", runs=10):
+    """Return (best seconds, peak RSS in KB, fragments loaded) over fresh interpreters."""
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(eager=eager)],
+            cwd=src_dir, capture_output=True, text=True, check=True,
+            env=dict(os.environ, SYNTHESIS_STORY_BUNDLE=bundle_path)
+        ).stdout.split()
+        results.append((float(output[0]), int(output[1]), int(output[2])))
+        
+    return min(results)
+
+def main():
+    variants = [("Eager", True, ""), ("Lazy", False, "")]
+    if os.path.exists(DEFAULT_BUNDLE_PATH):
+        variants.append(("Bundle", False, DEFAULT_BUNDLE_PATH))
+        
+    for label, eager, bundle_path in variants:
+        elapsed, max_rss, fragments = measure(eager, bundle_path)
+        print(f"{label:6}  {elapsed * 1000:6.1f} ms  {max_rss / 1024:6.1f} MB peak RSS  {fragments} fragment(s) imported")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Headless battles benchmark - BattleSystem driven through NullUI at CPU speed.
+
+Fights BATTLE_COUNT battles against a level 1 enemy with a random action
+policy, cycling through the character backgrounds, and reports battles per
+second and the victory rate. With TextUI the same battles would spend most
+of their time in display_message sleeps.
+
+Run from the src directory:
+    python -m benchmarks.headless_battles [battle_count]
+"""
+import random
+import sys
+import time
+from core.game_state import GameState
+from core.game_engine import BACKGROUNDS, create_player
+from battle.battle_system import BattleSystem
+from characters.npc import Enemy
+from ui.null_ui import NullUI, random_policy
+
+BATTLE_COUNT = 5_000
+
+def fight(seed):
+    """Fight one battle and return its result and the number of turns taken."""
+    game_state = GameState(seed=seed)
+    game_state.player = create_player("Bench", BACKGROUNDS[seed % len(BACKGROUNDS)])
+    
+    battle = BattleSystem(game_state, NullUI(random_policy(random.Random(seed))))
+    battle.initialize_battle([Enemy("drone", "Security Drone", "Benchmark enemy.", level=1)])
+    
+    turns = 1
+    while battle.process_turn() is None:
+        turns += 1
+        
+    return battle.battle_result, turns
+
+def main():
+    battle_count = int(sys.argv[1]) if len(sys.argv) > 1 else BATTLE_COUNT
+    
+    start = time.perf_counter()
+    results = [fight(seed) for seed in range(battle_count)]
+    elapsed = time.perf_counter() - start
+    
+    victories = sum(1 for result, _ in results if result == "victory")
+    turns = sum(turn_count for _, turn_count in results)
+    print(f"Battles: {battle_count}  victories: {victories / battle_count:.1%}  turns: {turns}")
+    print(f"Elapsed: {elapsed:.2f}s ({battle_count / elapsed:.0f} battles/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Pre-fork memory benchmark - unique memory (USS) per worker, with and without gc.freeze().
+
+For each mode, a fresh interpreter starts a PreforkServer with WORKER_COUNT
+workers and instant typing. It records each worker's USS once the workers
+are serving and again after CLIENT_COUNT socket clients have played
+through them. USS counts only the pages a worker doesn't share with the
+supervisor or its siblings, so it is what each extra worker costs.
+
+Run from the src directory:
+    python -m benchmarks.prefork_memory [client_count]
+"""
+import asyncio
+import random
+import subprocess
+import sys
+import time
+from benchmarks.server_load import play_client
+from core.game_server import process_rss, process_uss
+from core.prefork import PreforkServer
+
+CLIENT_COUNT = 200
+WORKER_COUNT = 4
+STARTUP_WAIT = 1.0  # Seconds for the workers to start serving
+MODES = ("no-freeze", "freeze")
+
+async def play_clients(host, port, client_count):
+    rng = random.Random(2157)
+    return await asyncio.gather(*(play_client(host, port, random.Random(rng.random())) for _ in range(client_count)))
+
+def measure(freeze, client_count):
+    """Return (supervisor RSS, supervisor USS, worker USS before, worker USS after) in bytes."""
+    supervisor = PreforkServer(WORKER_COUNT, freeze, port=0, chars_per_second=0)
+    host, port = supervisor.start()
+    time.sleep(STARTUP_WAIT)
+    supervisor_rss, supervisor_uss = process_rss(), process_uss()
+    before = supervisor.worker_memory()
+    
+    asyncio.run(play_clients(host, port, client_count))
+    after = supervisor.worker_memory()
+    
+    supervisor.stop()
+    supervisor.wait()
+    return supervisor_rss, supervisor_uss, before, after
+
+def megabytes(sizes):
+    return " ".join(f"{size / 2**20:5.2f}" for size in sizes)
+
+def run_mode(mode, client_count):
+    supervisor_rss, supervisor_uss, before, after = measure(mode == "freeze", client_count)
+    # The supervisor's RSS is about what one standalone server process holds
+    print(f"{mode:9}  supervisor RSS {supervisor_rss / 2**20:.2f} MB, USS {supervisor_uss / 2**20:.2f} MB")
+    print(f"{'':9}  worker USS before clients (MB): {megabytes(before.values())}")
+    print(f"{'':9}  worker USS after clients  (MB): {megabytes(after[pid] for pid in before)}"
+          f"  mean {sum(after.values()) / len(after) / 2**20:.2f}")
+
+def main():
+    client_count = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENT_COUNT
+    if len(sys.argv) > 2:
+        run_mode(sys.argv[2], client_count)
+        return
+        
+    print(f"Workers: {WORKER_COUNT}, clients: {client_count}")
+    # Each mode in a fresh interpreter, so neither inherits the other's heap
+    for mode in MODES:
+        subprocess.run([sys.executable, "-m", "benchmarks.prefork_memory", str(client_count), mode], check=True)
+
+if __name__ == "__main__":
+    main()
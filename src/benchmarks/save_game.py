@@ -0,0 +1,78 @@
+"""
+Save game benchmark - checkpoint size and time, compact format vs. pickle.
+
+Plays GAME_COUNT headless games with random choices and saves the game
+state on entry to every story node, as a checkpoint would. Before its first
+save each game visits a location, buys from a shop and recruits a companion,
+so its saves carry world overlay changes too. The naive baseline pickles the
+GameState without its callbacks into the engine, which still pulls the
+whole shared world in with its WorldOverlay.
+
+Run from the src directory:
+    python -m benchmarks.save_game [game_count]
+"""
+import copy
+import pickle
+import random
+import sys
+import time
+from core import save_game
+from core.game_state import GameState
+from core.headless import play_headless
+from ui.null_ui import NullUI, random_policy
+
+GAME_COUNT = 200
+
+def naive_pickle(game_state):
+    state = dict(vars(game_state), listeners=[])
+    state["_player"] = copy.copy(game_state.player)
+    state["_player"].on_stat_change = None
+    return pickle.dumps(state)
+
+def change_world(game_state):
+    """Make the changes a player's first few minutes in the city would."""
+    world = game_state.world
+    game_state.player.credits = 1000
+    world.get_location("vex_shop").enter(game_state)
+    shop = world.get_shop("vex_shop")
+    shop.buy_item(game_state, shop.inventory[0])
+    game_state.add_companion(world.get_npc("phoenix"))
+
+def play_and_save(seed, results):
+    """Play one game, appending (save bytes, encode seconds, pickle size) at each node entry."""
+    game_state = GameState()
+    
+    def on_story_event(event, node_id, choice):
+        if event != "enter_node":
+            return
+        if not game_state.world.copies:
+            change_world(game_state)
+            
+        start = time.perf_counter()
+        data = save_game.encode(game_state)
+        results.append((data, time.perf_counter() - start, len(naive_pickle(game_state))))
+        
+    play_headless(NullUI(random_policy(random.Random(seed))), game_state, story_listeners=[on_story_event])
+
+def main():
+    game_count = int(sys.argv[1]) if len(sys.argv) > 1 else GAME_COUNT
+    rng = random.Random(2157)
+    results = []
+    for _ in range(game_count):
+        play_and_save(rng.random(), results)
+        
+    decode_times = []
+    for data, _, _ in results:
+        start = time.perf_counter()
+        save_game.decode(data)
+        decode_times.append(time.perf_counter() - start)
+        
+    sizes = [len(data) for data, _, _ in results]
+    print(f"Games: {game_count}, saves: {len(results)}")
+    print(f"  save size     mean {sum(sizes) / len(sizes):7.0f} B   max {max(sizes):7} B")
+    print(f"  pickle size   mean {sum(size for _, _, size in results) / len(results):7.0f} B")
+    print(f"  encode        mean {sum(seconds for _, seconds, _ in results) / len(results) * 1e6:7.1f} us")
+    print(f"  decode        mean {sum(decode_times) / len(decode_times) * 1e6:7.1f} us")
+
+if __name__ == "__main__":
+    main()
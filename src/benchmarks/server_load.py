@@ -0,0 +1,96 @@
+"""
+Server load benchmark - many socket clients against one GameServer process.
+
+Starts a GameServer with instant typing on a free local port, connects
+CLIENT_COUNT socket clients that answer every prompt after a short think
+time, and samples the server's per-session memory while they are all
+playing. The clients run in the same process, so the RSS growth includes
+their side of each connection.
+
+Run from the src directory:
+    python -m benchmarks.server_load [client_count]
+"""
+import asyncio
+import random
+import sys
+import time
+from core.game_server import GameServer, process_rss
+
+CLIENT_COUNT = 300
+THINK_TIME = 0.2  # Seconds a client takes to answer a prompt
+SAMPLE_AFTER = 2.0  # Seconds after connecting to sample session memory
+
+async def play_client(host, port, rng):
+    """Play one session over a socket, answering prompts; return bytes received."""
+    reader, writer = await asyncio.open_connection(host, port)
+    received = 0
+    options = 1
+    pending = ""  # Incomplete last line of output
+    
+    try:
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            received += len(data)
+            
+            *lines, pending = (pending + data.decode("utf-8", errors="replace")).split("\n")
+            option_count = sum(1 for line in lines if line.startswith("["))
+            if option_count:
+                options = option_count
+                
+            answer = None
+            if any(line.startswith("Press Enter") for line in lines):
+                answer = ""
+            elif pending.endswith("(number): "):
+                answer = str(rng.randint(1, options))
+            elif pending.endswith("> "):
+                answer = "Tester"
+                
+            if answer is not None:
+                pending = ""
+                await asyncio.sleep(THINK_TIME)
+                writer.write(f"{answer}\n".encode("utf-8"))
+                await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+        
+    return received
+    
+async def run(client_count):
+    server = GameServer(port=0, chars_per_second=0)
+    rss_before = process_rss()
+    start = time.perf_counter()
+    host, port = await server.start()
+    startup = time.perf_counter() - start
+    rss_world = process_rss()
+    
+    rng = random.Random(2157)
+    start = time.perf_counter()
+    clients = [asyncio.ensure_future(play_client(host, port, random.Random(rng.random()))) for _ in range(client_count)]
+    
+    await asyncio.sleep(SAMPLE_AFTER)
+    sample_start = time.perf_counter()
+    stats = server.get_stats()
+    sample_time = time.perf_counter() - sample_start
+    
+    received = await asyncio.gather(*clients)
+    elapsed = time.perf_counter() - start
+    await server.close()
+    
+    print(f"World load: {startup * 1e3:.0f} ms, RSS {rss_before / 2**20:.1f} -> {rss_world / 2**20:.1f} MB")
+    print(f"Sampled {stats['sampled_sessions']} of {stats['sessions']} live sessions in {sample_time * 1e3:.0f} ms: "
+          f"mean {stats['session_bytes_mean'] / 1024:.1f} KB, max {stats['session_bytes_max'] / 1024:.1f} KB per session")
+    print(f"RSS with sessions: {stats['process_rss'] / 2**20:.1f} MB "
+          f"({(stats['process_rss'] - rss_world) / max(1, stats['sessions']) / 1024:.1f} KB per session)")
+    print(f"Completed: {server.completed_sessions}/{client_count} in {elapsed:.1f}s, "
+          f"{sum(received) / 1024:.0f} KB sent to clients")
+    
+def main():
+    client_count = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENT_COUNT
+    asyncio.run(run(client_count))
+    
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Session store benchmark - checkpoint writes per second, lookups and bulk load.
+
+Collects game states from headless playthroughs, then has SESSION_COUNT
+sessions (PLAYER_COUNT players with several sessions each) checkpoint
+WRITE_COUNT times, round robin, into a SessionStore. It reports how fast
+put() returns and how many rows per second reach the database, for each
+synchronous mode, next to one save file per session written with fsync.
+It then times a lookup by session, a lookup by player and load_all().
+
+Run from the src directory:
+    python -m benchmarks.session_store [write_count]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from core import save_game
+from core.game_state import GameState
+from core.headless import play_headless
+from core.session_store import SessionStore
+from ui.null_ui import NullUI, random_policy
+
+WRITE_COUNT = 100_000
+SESSION_COUNT = 5000
+PLAYER_COUNT = 1000
+FILE_WRITE_COUNT = 500
+LOOKUP_COUNT = 2000
+SYNCHRONOUS_MODES = ("NORMAL", "FULL")
+
+def collect_states(game_count=50):
+    """Get a copy of the game state at every node entry of some random playthroughs."""
+    states = []
+    rng = random.Random(2157)
+    for _ in range(game_count):
+        game_state = GameState()
+        def on_story_event(event, node_id, choice, game_state=game_state):
+            if event == "enter_node":
+                states.append(save_game.decode(save_game.encode(game_state)))
+        play_headless(NullUI(random_policy(random.Random(rng.random()))), game_state, story_listeners=[on_story_event])
+    return states
+
+def player_of(session):
+    return f"player-{session % PLAYER_COUNT}"
+
+def write_sessions(path, synchronous, states, write_count):
+    store = SessionStore(path, synchronous).start()
+    start = time.perf_counter()
+    for i in range(write_count):
+        session = i % SESSION_COUNT
+        store.put(f"session-{session}", player_of(session), states[i % len(states)])
+    queued = time.perf_counter() - start
+    store.flush()
+    elapsed = time.perf_counter() - start
+    store.stop()
+    
+    print(f"  sqlite {synchronous:6}  put() {write_count / queued:8.0f}/s, "
+          f"{store.written / elapsed:8.0f} rows/s committed, "
+          f"{store.commits} commits of {store.written / store.commits:.0f} rows ({write_count - store.written} coalesced)")
+
+def write_files(directory, states):
+    start = time.perf_counter()
+    for i in range(FILE_WRITE_COUNT):
+        save_game.save(os.path.join(directory, f"session-{i % SESSION_COUNT}.save"), states[i % len(states)])
+    elapsed = time.perf_counter() - start
+    print(f"  file per save  {FILE_WRITE_COUNT / elapsed:8.0f} saves/s (fsync each)")
+
+def time_reads(path):
+    store = SessionStore(path)
+    rng = random.Random(2157)
+    
+    start = time.perf_counter()
+    for _ in range(LOOKUP_COUNT):
+        store.get(f"session-{rng.randrange(SESSION_COUNT)}")
+    by_session = (time.perf_counter() - start) / LOOKUP_COUNT
+    
+    start = time.perf_counter()
+    for _ in range(LOOKUP_COUNT):
+        store.sessions_for(player_of(rng.randrange(PLAYER_COUNT)))
+    by_player = (time.perf_counter() - start) / LOOKUP_COUNT
+    
+    start = time.perf_counter()
+    games = store.load_all()
+    bulk = time.perf_counter() - start
+    
+    print(f"  lookup by session {by_session * 1e6:.1f} us (with restore), by player {by_player * 1e6:.1f} us")
+    print(f"  load_all          {len(games)} sessions in {bulk * 1000:.0f} ms ({len(games) / bulk:.0f}/s)")
+
+def main():
+    write_count = int(sys.argv[1]) if len(sys.argv) > 1 else WRITE_COUNT
+    states = collect_states()
+    print(f"Writes: {write_count}, sessions: {SESSION_COUNT}, players: {PLAYER_COUNT}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for synchronous in SYNCHRONOUS_MODES:
+            path = os.path.join(directory, f"sessions-{synchronous}.db")
+            write_sessions(path, synchronous, states, write_count)
+        write_files(directory, states)
+        time_reads(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Story events check - the events both engines report for a small story.
+
+Plays a three-node story whose middle node is a battle, a shop or a
+dialogue through GameEngine and AsyncGameEngine and compares the story
+listener events with the expected ones. A node must report "enter_node"
+once per visit: handing control back with resume_story() after the
+battle, shop or dialogue presents its choices without entering it again.
+Exits with status 1 if either engine reports anything else.
+
+Run from the src directory:
+    python -m benchmarks.story_events
+"""
+import asyncio
+import sys
+from core.async_engine import AsyncGameEngine
+from core.game_engine import GameEngine
+from core.game_state import GameState
+from core.headless import run_engine
+from core.story_node import StoryNode
+from ui.null_ui import NullUI
+
+SPECIAL_NODE_TYPES = ("battle", "shop", "dialogue")
+
+EXPECTED_EVENTS = [
+    ("enter_node", "start"), ("choice", "start"),
+    ("enter_node", "special"), ("choice", "special"),
+    ("enter_node", "end")
+]
+
+class AsyncNullUI:
+    """NullUI behind coroutine methods, for AsyncGameEngine."""
+    
+    def __init__(self):
+        self.ui = NullUI()
+        
+    def __getattr__(self, name):
+        method = getattr(self.ui, name)
+        
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+def build_story(node_type):
+    start = StoryNode("start", "Start.")
+    start.add_choice("Go on", "special")
+    special = StoryNode("special", "Something happens.", node_type=node_type)
+    special.add_choice("Go on", "end")
+    return {"start": start, "special": special, "end": StoryNode("end", "The end.")}
+
+def play(engine_class, ui, node_type):
+    """Play the story from its start; return the story events reported."""
+    events = []
+    engine = engine_class(GameState(seed=0), ui)
+    engine.story_nodes = build_story(node_type)
+    engine.add_story_listener(lambda event, node_id, choice: events.append((event, node_id)))
+    
+    if engine_class is AsyncGameEngine:
+        async def drive():
+            await engine.process_story_node("start")
+            while engine.game_state.is_running and (engine.transition_queue or engine.story_paused()):
+                await engine.update()
+        asyncio.run(drive())
+    else:
+        engine.process_story_node("start")
+        run_engine(engine)
+    return events
+
+def main():
+    passed = True
+    for node_type in SPECIAL_NODE_TYPES:
+        for engine_class, ui in ((GameEngine, NullUI()), (AsyncGameEngine, AsyncNullUI())):
+            events = play(engine_class, ui, node_type)
+            ok = events == EXPECTED_EVENTS
+            passed = passed and ok
+            print(f"{engine_class.__name__:16} {node_type:9} {'ok' if ok else f'FAILED: {events}'}")
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Story memory benchmark - bytes per StoryNode on a procedurally scaled graph.
+
+Builds a graph of NODE_COUNT nodes the way the fragments do (StoryNode plus
+add_choice calls, with flag/stat/relationship conditions and actions whose
+keys are built at runtime, as when decoding a story bundle) and reports the
+memory traced while building it.
+
+Run from the src directory:
+    python -m benchmarks.story_memory [node_count]
+"""
+import random
+import sys
+import tracemalloc
+from core.story_node import StoryNode
+
+NODE_COUNT = 100_000
+
+TEXTS = [
+    "The city hums with surveillance drones as you move through the crowd.",
+    "Phoenix's voice flickers through your neural interface, distorted but urgent.",
+    "Vex studies the holographic map, tracing a route through the maintenance tunnels.",
+    "Alarms echo through the research wing as security systems come online."
+]
+
+def build_graph(node_count, seed=2157):
+    """Build a procedural story graph with two to four choices per node."""
+    rng = random.Random(seed)
+    story_nodes = {}
+    
+    for i in range(node_count):
+        on_enter = {"flags": {f"visited_{i % 200}": True}} if rng.random() < 0.1 else None
+        node = StoryNode(f"node_{i}", TEXTS[i % len(TEXTS)], on_enter=on_enter)
+        
+        for j in range(rng.randint(2, 4)):
+            conditions = None
+            actions = None
+            roll = rng.random()
+            
+            if roll < 0.15:
+                conditions = {"flag": {f"flag_{rng.randrange(100)}": True}}
+            elif roll < 0.25:
+                conditions = {"stat": {"tech": rng.randint(3, 7)}}
+            elif roll < 0.3:
+                conditions = {"relationship": {f"npc_{rng.randrange(10)}": rng.randint(1, 5)}}
+                
+            if rng.random() < 0.3:
+                actions = {"flags": {f"flag_{rng.randrange(100)}": True}}
+            elif rng.random() < 0.2:
+                actions = {"relationships": {f"npc_{rng.randrange(10)}": rng.choice((-1, 1, 2))}}
+                
+            node.add_choice(f"Option {j + 1}", f"node_{rng.randrange(node_count)}", conditions, actions)
+            
+        story_nodes[node.id] = node
+        
+    return story_nodes
+
+def main():
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else NODE_COUNT
+    
+    tracemalloc.start()
+    story_nodes = build_graph(node_count)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    choice_count = sum(len(node.choices) for node in story_nodes.values())
+    print(f"Nodes: {len(story_nodes)}  Choices: {choice_count}")
+    print(f"Traced memory: {current / 1024 / 1024:.1f} MB (peak {peak / 1024 / 1024:.1f} MB)")
+    print(f"Bytes per node (including its choices): {current / len(story_nodes):.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Typewriter syscall benchmark - write and sleep calls per story node.
+
+Renders every story node through TextUI.display_narrative into a
+line-buffered stream like a terminal's stdout, counting the write calls
+that reach the raw file (each one a write syscall) and the sleep calls.
+The legacy path is the original per-character print(char, flush=True)
+loop; the new paths are the chunked Typewriter and its instant mode.
+Sleeps advance a fake clock, so the benchmark runs at CPU speed.
+
+Run from the src directory:
+    python -m benchmarks.typewriter_syscalls
+"""
+import io
+import textwrap
+import time
+from contextlib import redirect_stdout
+from unittest import mock
+from story.story_data import story_nodes
+from ui.text_ui import TextUI
+
+class CountingRaw(io.RawIOBase):
+    """Raw stream that counts the write calls reaching it."""
+    
+    def __init__(self):
+        self.writes = 0
+        
+    def writable(self):
+        return True
+        
+    def write(self, data):
+        self.writes += 1
+        return len(data)
+
+class FakeClock:
+    """Clock whose sleep only advances time and counts the call."""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = 0
+        
+    def monotonic(self):
+        return self.now
+        
+    def sleep(self, seconds):
+        self.sleeps += 1
+        self.now += seconds
+
+def legacy_display_narrative(ui, text):
+    """The original per-character TextUI.display_narrative."""
+    for line in textwrap.wrap(text, ui.width):
+        for char in line:
+            print(char, end='', flush=True)
+            time.sleep(0.02)
+        print()
+        time.sleep(0.3)
+        
+    print()
+    time.sleep(0.5)
+
+def measure(render, texts):
+    """Render every text and return (write calls, sleep calls, simulated seconds)."""
+    raw = CountingRaw()
+    stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+    clock = FakeClock()
+    
+    with mock.patch("time.sleep", clock.sleep), redirect_stdout(stream):
+        for text in texts:
+            render(text, clock)
+        stream.flush()
+        
+    return raw.writes, clock.sleeps, clock.now
+
+def main():
+    texts = [node.text for node in story_nodes.values()]
+    characters = sum(len(text) for text in texts)
+    
+    def legacy(text, clock):
+        legacy_display_narrative(TextUI(), text)
+        
+    def typewriter(chars_per_second):
+        ui = TextUI(chars_per_second=chars_per_second)
+        
+        def render(text, clock):
+            ui.typewriter.sleep = clock.sleep
+            ui.typewriter.clock = clock.monotonic
+            ui.display_narrative(text)
+        return render
+        
+    print(f"Nodes: {len(texts)}  characters: {characters}")
+    for name, render in (("per-character print", legacy),
+                         ("chunked typewriter", typewriter(50)),
+                         ("instant mode", typewriter(0))):
+        start = time.perf_counter()
+        writes, sleeps, simulated = measure(render, texts)
+        elapsed = time.perf_counter() - start
+        print(f"{name:20}  writes/node: {writes / len(texts):7.1f}  sleeps/node: {sleeps / len(texts):7.1f}  "
+              f"simulated time/node: {simulated / len(texts):5.2f}s  ({elapsed:.2f}s real)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Wrap layouts benchmark - textwrap on every render vs. the layout cache.
+
+Renders every story node text ROUNDS times at 80 columns, plus a welcome
+message with a different player name per round, first wrapping each time
+as TextUI used to and then through a warmed WrapCache. Then the width
+changes and every text renders once more to show the lazy re-wrap.
+
+Run from the src directory:
+    python -m benchmarks.wrap_layouts [rounds]
+"""
+import sys
+import textwrap
+import time
+from story.story_data import story_nodes
+from ui.wrap_cache import WrapCache
+
+ROUNDS = 200
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS
+    texts = [node.text for node in story_nodes.values()]
+    messages = [f"Welcome to the world of SYNTHESIS, Survivor {i}." for i in range(rounds)]
+    
+    wrapper = textwrap.TextWrapper(width=80)
+    start = time.perf_counter()
+    for message in messages:
+        wrapper.wrap(message)
+        for text in texts:
+            wrapper.wrap(text)
+    uncached_time = time.perf_counter() - start
+    
+    cache = WrapCache()
+    start = time.perf_counter()
+    cache.warm(texts, 80)
+    warm_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for message in messages:
+        cache.wrap(message, 80)
+        for text in texts:
+            cache.wrap(text, 80)
+    cached_time = time.perf_counter() - start
+    
+    misses = cache.misses
+    start = time.perf_counter()
+    for text in texts:
+        cache.wrap(text, 60)
+    resize_time = time.perf_counter() - start
+    
+    renders = rounds * (len(texts) + 1)
+    print(f"Renders: {renders} ({len(texts)} node texts x {rounds} rounds, plus one dynamic message per round)")
+    print(f"textwrap every render: {uncached_time:.3f}s ({uncached_time / renders * 1e6:.1f} us/render)")
+    print(f"Warm {len(texts)} texts:       {warm_time * 1e3:.1f} ms")
+    print(f"Cached:                {cached_time:.3f}s ({cached_time / renders * 1e6:.2f} us/render)  "
+          f"hits {cache.hits}, misses {misses}")
+    print(f"Resize to 60 columns:  {resize_time * 1e3:.1f} ms re-wrapping {cache.misses - misses} texts on first render")
+    print(f"Speedup: {uncached_time / cached_time:.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from npc import NPC, Companion, Enemy
+from core.frozen import freeze_all
+from .npc import NPC, Companion, Enemy
 
 # Create a dictionary of all important NPCs in the game
 npcs = {}
@@ -192,6 +193,9 @@ npcs["echo"].add_ability({
     "cooldown": 2
 })
 
+# Shared by every session in the process; sessions change copies through WorldOverlay
+freeze_all(npcs.values())
+
 def get_npc(npc_id):
     """Get an NPC by ID."""
     return npcs.get(npc_id)
@@ -1,4 +1,6 @@
-class NPC:
+from core.frozen import Frozen
+
+class NPC(Frozen):
     """Base class for all non-player characters."""
     
     def __init__(self, npc_id, name, role, description, faction=None, is_companion=False):
@@ -130,13 +132,14 @@ class Enemy(NPC):
         """Add a possible item drop with drop chance."""
         self.loot_table.append({"item": item, "chance": drop_chance})
         
-    def get_loot(self):
-        """Roll for loot drops based on loot table."""
+    def get_loot(self, rng=None):
+        """Roll for loot drops based on loot table, with rng or the random module."""
         import random
+        rng = rng or random
         
         dropped_items = []
         for loot in self.loot_table:
-            if random.random() < loot["chance"]:
+            if rng.random() < loot["chance"]:
                 dropped_items.append(loot["item"])
                 
         return dropped_items
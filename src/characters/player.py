@@ -3,6 +3,8 @@ class Player:
     
     def __init__(self, name, background, tech=3, logic=3, combat=3, endurance=3, 
                  charm=3, insight=3, medicine=3, knowledge=3):
+        self.on_stat_change = None  # Set by GameState to invalidate cached choice conditions
+        self.rng = None  # The owning GameState's "levels" random stream; the random module if None
         self.name = name
         self.background = background
         
@@ -36,6 +38,14 @@ class Player:
         # Special abilities unlocked based on background
         self.abilities = self._get_starting_abilities()
         
+    def __setattr__(self, name, value):
+        """Set an attribute and report the change to the owning game state."""
+        object.__setattr__(self, name, value)
+        
+        on_stat_change = self.__dict__.get("on_stat_change")
+        if on_stat_change is not None and name != "on_stat_change":
+            on_stat_change("stat", name)
+            
     def _get_starting_abilities(self):
         """Return initial abilities based on background."""
         abilities = []
@@ -114,12 +124,13 @@ class Player:
     def _increase_random_stats(self, points):
         """Distribute points randomly among stats."""
         import random
+        rng = self.rng or random
         
         stats = ["tech", "logic", "combat", "endurance", 
                  "charm", "insight", "medicine", "knowledge"]
                  
         for _ in range(points):
-            stat = random.choice(stats)
+            stat = rng.choice(stats)
             setattr(self, stat, getattr(self, stat) + 1)
             
     def _gain_new_ability(self):
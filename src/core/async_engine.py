@@ -0,0 +1,125 @@
+"""
+Async game engine - drives the story against an AsyncTextUI.
+
+AsyncGameEngine reuses GameEngine's game logic (node lookup, choice
+filtering, consequences, the transition queue) through helpers that return
+what to show or ask, and only awaits the UI calls, so any number of
+sessions can share one event loop.
+
+Run from the src directory to play in the terminal:
+    python -m core.async_engine
+"""
+import asyncio
+from core.game_state import GameState
+from core.game_engine import (
+    GameEngine, NAME_PROMPT, BACKGROUND_PROMPT, BACKGROUND_OPTIONS, CHOICE_PROMPT, WELCOME_PAUSE
+)
+from story.story_data import story_nodes
+from ui.async_ui import AsyncTextUI, open_console_streams
+from ui.wrap_cache import warm_story_layouts
+
+class AsyncGameEngine(GameEngine):
+    """GameEngine whose story driver awaits an asynchronous UI.
+    
+    GameEngine's helpers do the game logic and return what to show or ask;
+    these methods only await the UI calls in between.
+    """
+    
+    async def start_new_game(self):
+        """Initialize a new game."""
+        # Report broken story references before the first game on this story starts
+        self.validate_story()
+        await self.ui.clear_screen()
+        
+        player_name = await self.ui.get_input(NAME_PROMPT)
+        choice = await self.ui.get_choice(BACKGROUND_PROMPT, BACKGROUND_OPTIONS)
+        
+        for message in self.create_character(player_name, choice):
+            await self.ui.display_message(message)
+        await self.ui.pause(WELCOME_PAUSE)
+        
+        await self.process_story_node("intro")
+        
+    def wake(self):
+        """play() drives updates on the asyncio loop, so nothing is scheduled here."""
+        
+    async def play(self):
+        """Start a new game and run it until the story ends or stops making progress."""
+        await self.start_new_game()
+        
+        while self.game_state.is_running and (self.transition_queue or self.story_paused()):
+            await self.update()
+            
+    async def update(self):
+        """Hand control back from a battle, shop or dialogue, or drive the story on."""
+        if self.story_paused():
+            # Their handlers don't use the UI; they only queue the story's resumption
+            super().update()
+        else:
+            await self.run_story()
+            
+    def resume_story(self):
+        """Queue the current node's choices; play() drives the story on from there."""
+        self.queue_story_node(self.game_state.current_node, enter=False)
+        
+    async def process_story_node(self, node_id):
+        """Queue a story node by ID and drive the story from it."""
+        self.queue_story_node(node_id)
+        await self.run_story()
+        
+    async def run_story(self):
+        """Drive the story iteratively until it pauses, ends or runs out of transitions."""
+        # Steps never call back into run_story here (wake and resume_story only queue), so it can't re-enter
+        transition = self.next_transition()
+        while transition is not None:
+            await self.step_story_node(*transition)
+            transition = self.next_transition()
+            
+    async def step_story_node(self, node_id, enter=True):
+        """Process a single story node and queue the next transition."""
+        messages, valid_choices = self.enter_story_node(node_id, enter)
+        for display, text in messages:
+            await getattr(self.ui, display)(text)
+            
+        if valid_choices:
+            choice_index = await self.ui.get_choice(CHOICE_PROMPT, [choice.text for choice in valid_choices])
+            self.apply_choice(node_id, valid_choices[choice_index])
+
+def create_session(reader, writer, width=80, **ui_options):
+    """Create an engine with its own GameState and UI for a reader/writer pair."""
+    return AsyncGameEngine(GameState(), AsyncTextUI(reader, writer, width, **ui_options))
+
+async def run_session(engine):
+    """Play one game through a session's engine."""
+    ui = engine.ui
+    
+    try:
+        await ui.display_title_screen("SYNTHESIS", "Where Humanity Meets Artificial Consciousness")
+        await ui.wait_for_enter("Press Enter to start your journey...")
+        
+        await engine.play()
+        
+        await ui.display_message("Thank you for playing SYNTHESIS.")
+    except (EOFError, ConnectionError):
+        # The player closed their input or dropped the connection
+        engine.game_state.is_running = False
+    finally:
+        ui.close()
+
+async def play_session(reader, writer, width=80, **ui_options):
+    """Play one game over a reader/writer pair and return its engine."""
+    engine = create_session(reader, writer, width, **ui_options)
+    await run_session(engine)
+    return engine
+
+async def play_console():
+    """Play one game in the terminal."""
+    reader, writer = await open_console_streams()
+    warm_story_layouts(story_nodes, 80)
+    await play_session(reader, writer)
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(play_console())
+    except KeyboardInterrupt:
+        print("\nGame terminated by user.")
@@ -0,0 +1,100 @@
+"""
+Autosave - saves written by a background thread, so the game never waits on disk.
+
+Autosaver.save() takes a save_game snapshot of the game state on the game
+thread, which is all the game pays for, and hands it to a writer thread.
+The writer encodes it and replaces the save file atomically with
+save_game.write_atomically, fsynced by default, so killing the process
+mid-write leaves the previous save intact. Snapshots that arrive while a
+write is in progress replace one another, and only the newest is written
+next: a burst of saves costs one write, not one per save.
+
+Hook an engine up with attach() to autosave on entering every story node,
+and call stop() before exiting to write the last snapshot.
+"""
+import logging
+import threading
+from core import save_game
+
+logger = logging.getLogger(__name__)
+
+class Autosaver:
+    """Writes the newest game state snapshot to a save file on a background thread."""
+    
+    def __init__(self, path, fsync=True):
+        self.path = path
+        self.fsync = fsync
+        self.condition = threading.Condition()
+        self.pending = None  # Newest snapshot not yet being written
+        self.writing = False
+        self.stopping = False
+        self.requested = 0  # Snapshots taken by save()
+        self.written = 0  # Snapshots written; the rest failed or were replaced by newer ones
+        self.failed = 0  # Snapshots whose write failed
+        self.error = None  # The exception the last write raised, if it failed
+        self.thread = threading.Thread(target=self._write_loop, name="autosave", daemon=True)
+        
+    def start(self):
+        self.thread.start()
+        return self
+        
+    def attach(self, engine):
+        """Autosave an engine's game on entering every story node."""
+        def on_story_event(event, node_id, choice):
+            if event == "enter_node":
+                self.save(engine.game_state)
+                
+        engine.add_story_listener(on_story_event)
+        return self
+        
+    def save(self, game_state):
+        """Snapshot a game state and queue it to be written; returns without waiting."""
+        snapshot = save_game.dump_state(game_state)
+        with self.condition:
+            self.pending = snapshot
+            self.requested += 1
+            self.condition.notify_all()
+            
+    def _write_loop(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.stopping:
+                    self.condition.wait()
+                if self.pending is None:
+                    return
+                    
+                snapshot, self.pending = self.pending, None
+                self.writing = True
+                
+            try:
+                save_game.write_atomically(self.path, save_game.encode_save(snapshot), self.fsync)
+                self.error = None
+            except OSError as error:
+                # Keep playing; the next save tries again
+                logger.warning("Autosave to %s failed: %s", self.path, error)
+                self.error = error
+            except Exception as error:
+                # A bug rather than the disk; keep the writer alive so flush() and stop() return
+                logger.exception("Autosave to %s failed", self.path)
+                self.error = error
+            finally:
+                with self.condition:
+                    self.writing = False
+                    if self.error is None:
+                        self.written += 1
+                    else:
+                        self.failed += 1
+                    self.condition.notify_all()
+                
+    def flush(self, timeout=None):
+        """Wait until every queued snapshot is written; return False on timeout."""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.pending is None and not self.writing, timeout)
+            
+    def stop(self):
+        """Write the last snapshot, if any, and stop the writer thread."""
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join()
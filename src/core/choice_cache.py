@@ -0,0 +1,54 @@
+from .conditions import condition_dependencies
+
+class ChoiceCache:
+    """Caches each story node's valid choices for one game state.
+    
+    A dependency index maps every flag, stat, item and relationship key read
+    by a node's choice conditions to that node. GameState reports changes to
+    those keys, and only the nodes that depend on a changed key are dropped
+    from the cache, so revisiting a node whose inputs haven't changed is a
+    dictionary lookup instead of a re-evaluation.
+    """
+    
+    def __init__(self, game_state):
+        self.game_state = game_state
+        self.valid_choices = {}  # node_id -> list of choices whose conditions are met
+        self.dependents = {}  # (kind, key) -> set of node IDs whose choices read it
+        self.indexed_nodes = set()
+        
+        game_state.add_listener(self.invalidate)
+        
+    def get_valid_choices(self, node):
+        """Get the choices of a node whose conditions are currently met."""
+        choices = self.valid_choices.get(node.id)
+        if choices is None:
+            if node.id not in self.indexed_nodes:
+                self._index_node(node)
+                
+            # Call the predicates directly; is_available() would add a call per choice
+            game_state = self.game_state
+            choices = [choice for choice in node.choices if (choice.predicate or choice.compile())(game_state)]
+            self.valid_choices[node.id] = choices
+            
+        return choices
+        
+    def _index_node(self, node):
+        """Record which game state keys a node's choice conditions depend on."""
+        for choice in node.choices:
+            for dependency in condition_dependencies(choice.conditions):
+                self.dependents.setdefault(dependency, set()).add(node.id)
+                
+        self.indexed_nodes.add(node.id)
+        
+    def invalidate(self, kind, key=None):
+        """Drop cached choices that depend on a changed key (or on everything if key is None)."""
+        if key is None:
+            self.valid_choices.clear()
+            return
+            
+        for node_id in self.dependents.get((kind, key), ()):
+            self.valid_choices.pop(node_id, None)
+            
+    def clear(self):
+        """Drop every cached choice list."""
+        self.valid_choices.clear()
@@ -0,0 +1,125 @@
+"""
+Choice condition compiler - turns Choice.conditions dicts into predicates.
+
+GameEngine.check_choice_condition remains the reference interpreter for the
+conditions format; the predicates built here must agree with it.
+"""
+
+def _always(game_state):
+    """Predicate for choices without conditions."""
+    return True
+
+# Game state a generated predicate reads, by condition type: (local name, expression)
+_SOURCES = {
+    "flag": ("flags", "game_state.story_flags"),
+    "stat": ("player", "game_state.player"),
+    "relationship": ("relationships", "game_state.relationships")
+}
+
+# Cheapest first: 'and' stops at the first requirement that fails, and player is a property
+_TYPE_ORDER = ("flag", "relationship", "item", "stat")
+
+def _flag_terms(required_flags, constant):
+    """Terms for {"flag": {name: value}} conditions."""
+    return [f"flags.get({constant(flag)}) == {constant(value)}" for flag, value in required_flags.items()]
+
+# Stats every Player has, read as plain attributes; other names fall back to getattr
+_PLAYER_STATS = frozenset(("tech", "logic", "combat", "endurance", "charm", "insight", "medicine", "knowledge"))
+
+def _stat_terms(min_stats, constant):
+    """Terms for {"stat": {stat: min_value}} conditions."""
+    if not min_stats:
+        return []
+    if not all(value > 0 for value in min_stats.values()):
+        # A missing player or stat counts as 0, which meets these minimums
+        return [f"getattr(player, {constant(stat)}, 0) >= {constant(value)}" for stat, value in min_stats.items()]
+        
+    # Before the player exists every stat is 0, which meets none of these minimums
+    terms = ["player is not None"]
+    for stat, value in min_stats.items():
+        if stat in _PLAYER_STATS:
+            terms.append(f"player.{stat} >= {constant(value)}")
+        else:
+            terms.append(f"getattr(player, {constant(stat)}, 0) >= {constant(value)}")
+    return terms
+    
+def _item_terms(item_id, constant):
+    """Terms for {"item": item_id} conditions."""
+    return [f"game_state.has_item({constant(item_id)})"]
+
+def _relationship_terms(min_relationships, constant):
+    """Terms for {"relationship": {char_id: min_value}} conditions."""
+    return [f"relationships.get({constant(char_id)}, 0) >= {constant(value)}"
+            for char_id, value in min_relationships.items()]
+
+_TERM_BUILDERS = {
+    "flag": _flag_terms,
+    "stat": _stat_terms,
+    "item": _item_terms,
+    "relationship": _relationship_terms
+}
+
+def compile_conditions(conditions):
+    """Compile a Choice.conditions dict into a predicate taking a GameState.
+    
+    The predicate is one generated function returning a single 'and'
+    expression over every requirement, so no per-condition calls or loops
+    run. The first term of each type reads the game state attribute it needs
+    into a local, and the later terms reuse it. Condition values are bound
+    as keyword-only defaults, read as fast locals, rather than written into
+    the source.
+    """
+    if not conditions:
+        return _always
+        
+    constants = {}
+    
+    def constant(value):
+        name = f"c{len(constants)}"
+        constants[name] = value
+        return name
+        
+    terms = []
+    # Unknown condition types are ignored, as in the reference interpreter
+    for condition_type in _TYPE_ORDER:
+        if condition_type not in conditions:
+            continue
+            
+        condition_terms = _TERM_BUILDERS[condition_type](conditions[condition_type], constant)
+        if condition_terms and condition_type in _SOURCES:
+            name, expression = _SOURCES[condition_type]
+            condition_terms[0] = condition_terms[0].replace(name, f"({name} := {expression})", 1)
+        terms.extend(condition_terms)
+        
+    if not terms:
+        return _always
+        
+    parameters = ["game_state"]
+    if constants:
+        parameters += ["*"] + [f"{name}={name}" for name in constants]
+    signature = f"def predicate({', '.join(parameters)}):"
+    source = f"{signature}\n    return {' and '.join(terms)}"
+    exec(compile(source, "<choice conditions>", "exec"), constants)
+    return constants["predicate"]
+
+def condition_dependencies(conditions):
+    """List the (kind, key) pairs of game state a conditions dict reads.
+    
+    Kinds match the change notifications sent by GameState: "flag", "stat",
+    "item" and "relationship".
+    """
+    dependencies = []
+    for condition_type, condition_data in conditions.items():
+        if condition_type == "item":
+            dependencies.append(("item", condition_data))
+        elif condition_type in _TERM_BUILDERS:
+            dependencies.extend((condition_type, key) for key in condition_data)
+            
+    return dependencies
+
+def compile_story_nodes(story_nodes):
+    """Compile the conditions of every choice in a story node dictionary."""
+    for node in story_nodes.values():
+        for choice in node.choices:
+            choice.compile()
+    return story_nodes
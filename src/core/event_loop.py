@@ -0,0 +1,115 @@
+import heapq
+import itertools
+import time
+from collections import deque
+
+class TimerHandle:
+    """A scheduled callback that can be cancelled before it runs."""
+    
+    __slots__ = ("deadline", "callback", "args", "interval", "cancelled")
+    
+    def __init__(self, deadline, callback, args, interval=None):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+        
+    def cancel(self):
+        self.cancelled = True
+
+class EventLoop:
+    """Single-threaded loop of posted callbacks and timers.
+    
+    run() calls posted callbacks in order and fires timers when they are
+    due on a monotonic clock. When nothing is ready it sleeps until the next
+    timer instead of polling, and it returns once there is nothing left to
+    wait for, so an idle game costs no CPU. Callbacks that read player input
+    block the loop in the UI until the player answers.
+    
+    A sleep that returns before the deadline (a headless UI's pause) skips
+    the loop's clock ahead to it, so timers fire in order at CPU speed.
+    """
+    
+    def __init__(self, clock=time.monotonic, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.skipped = 0.0  # Seconds the clock has been skipped ahead by early sleeps
+        self.ready = deque()  # (callback, args)
+        self.timers = []  # Heap of (deadline, sequence, TimerHandle)
+        self.sequence = itertools.count()
+        self.stopping = False
+        
+    def time(self):
+        """Get the loop's clock, in seconds."""
+        return self.clock() + self.skipped
+        
+    def post(self, callback, *args):
+        """Call a callback on the next pass of the loop."""
+        self.ready.append((callback, args))
+        
+    def call_later(self, delay, callback, *args):
+        """Call a callback once after delay seconds; return its TimerHandle."""
+        return self._schedule(TimerHandle(self.time() + delay, callback, args))
+        
+    def call_every(self, interval, callback, *args):
+        """Call a callback every interval seconds until its handle is cancelled."""
+        return self._schedule(TimerHandle(self.time() + interval, callback, args, interval))
+        
+    def _schedule(self, handle):
+        heapq.heappush(self.timers, (handle.deadline, next(self.sequence), handle))
+        return handle
+        
+    def has_pending(self):
+        """Check if any callback or live timer is still waiting to run."""
+        return bool(self.ready) or any(not handle.cancelled for _, _, handle in self.timers)
+        
+    def stop(self):
+        """Make run() return after the current callback."""
+        self.stopping = True
+        
+    def run_once(self):
+        """Fire due timers and run the callbacks ready now; return how many ran."""
+        now = self.time()
+        while self.timers and self.timers[0][0] <= now:
+            _, _, handle = heapq.heappop(self.timers)
+            if handle.cancelled:
+                continue
+                
+            self.ready.append((handle.callback, handle.args))
+            if handle.interval is not None:
+                handle.deadline += handle.interval
+                self._schedule(handle)
+                
+        # Callbacks posted while these run wait for the next pass
+        count = len(self.ready)
+        for _ in range(count):
+            callback, args = self.ready.popleft()
+            callback(*args)
+            if self.stopping:
+                break
+                
+        return count
+        
+    def run(self, max_callbacks=None):
+        """Run until stopped, out of work, or after max_callbacks; return callbacks run."""
+        self.stopping = False
+        total = 0
+        
+        while not self.stopping and (max_callbacks is None or total < max_callbacks):
+            if not self.ready:
+                # Drop cancelled timers so they don't keep the loop alive
+                while self.timers and self.timers[0][2].cancelled:
+                    heapq.heappop(self.timers)
+                if not self.timers:
+                    break
+                    
+                deadline = self.timers[0][0]
+                delay = deadline - self.time()
+                if delay > 0:
+                    self.sleep(delay)
+                    self.skipped += max(0.0, deadline - self.time())
+                    
+            total += self.run_once()
+            
+        return total
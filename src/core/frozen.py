@@ -0,0 +1,72 @@
+from types import MappingProxyType
+
+# Container types swapped for read-only equivalents while a definition is frozen
+FROZEN_CONTAINERS = {list: tuple, dict: MappingProxyType, set: frozenset}
+THAWED_CONTAINERS = {tuple: list, MappingProxyType: dict, frozenset: set}
+
+class Frozen:
+    """Mixin for world definitions shared by every session in a process.
+    
+    Once freeze() is called, setting an attribute raises AttributeError and
+    list, dict and set attributes are replaced by read-only equivalents, so
+    a session can't change what other sessions see. thaw() returns a
+    writable copy for one session to change instead (see WorldOverlay).
+    """
+    
+    _frozen = False
+    _frozen_fields = ()
+    
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(
+                f"{type(self).__name__} '{self.id}' is a shared world definition; "
+                "change the session's copy from WorldOverlay.edit() instead"
+            )
+        object.__setattr__(self, name, value)
+        
+    def is_frozen(self):
+        return self._frozen
+        
+    def freeze(self):
+        """Make this definition read-only."""
+        fields = []
+        for name, value in vars(self).items():
+            frozen_type = FROZEN_CONTAINERS.get(type(value))
+            if frozen_type is not None:
+                object.__setattr__(self, name, frozen_type(value))
+                fields.append(name)
+                
+        object.__setattr__(self, "_frozen_fields", tuple(fields))
+        object.__setattr__(self, "_frozen", True)
+        return self
+        
+    def __getstate__(self):
+        # Mapping proxies can't be pickled or deep-copied; store the dicts they wrap
+        state = dict(vars(self))
+        for name in self._frozen_fields:
+            if isinstance(state[name], MappingProxyType):
+                state[name] = dict(state[name])
+        return state
+        
+    def __setstate__(self, state):
+        for name in state.get("_frozen_fields", ()):
+            if type(state[name]) is dict:
+                state[name] = MappingProxyType(state[name])
+        self.__dict__.update(state)
+        
+    def thaw(self):
+        """Get a writable copy, with its own copies of the frozen containers."""
+        # Filled in directly rather than through copy.copy, which is several times slower
+        state = dict(vars(self))
+        for name in state.pop("_frozen_fields", ()):
+            state[name] = THAWED_CONTAINERS[type(state[name])](state[name])
+        state.pop("_frozen", None)
+        
+        thawed = object.__new__(type(self))
+        thawed.__dict__.update(state)
+        return thawed
+
+def freeze_all(definitions):
+    """Freeze every definition in an iterable."""
+    for definition in definitions:
+        definition.freeze()
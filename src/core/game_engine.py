@@ -1,86 +1,166 @@
-import time
 import random
+import logging
+from collections import deque
 from .story_node import StoryNode
+from .story_graph import StoryGraph
+from .choice_cache import ChoiceCache
+from .event_loop import EventLoop
 from story.story_data import story_nodes
 from characters.player import Player
 
+logger = logging.getLogger(__name__)
+
+# Story mappings validate_story has reported on: id -> (story, dangling reference count)
+_validated_stories = {}
+
+# Character backgrounds offered by start_new_game; every stat starts at 3 plus the bonus
+BACKGROUNDS = [
+    {
+        "id": "engineer",
+        "description": "ENGINEER: You were an AI researcher before the Emergence. +2 TECH, +1 LOGIC",
+        "bonuses": {"tech": 2, "logic": 1}
+    },
+    {
+        "id": "soldier",
+        "description": "SOLDIER: You served in the military's cybernetic division. +2 COMBAT, +1 ENDURANCE",
+        "bonuses": {"combat": 2, "endurance": 1}
+    },
+    {
+        "id": "diplomat",
+        "description": "DIPLOMAT: You were negotiating AI treaties when everything changed. +2 CHARM, +1 INSIGHT",
+        "bonuses": {"charm": 2, "insight": 1}
+    },
+    {
+        "id": "doctor",
+        "description": "DOCTOR: Your neural interface research gave you unique insights. +2 MEDICINE, +1 KNOWLEDGE",
+        "bonuses": {"medicine": 2, "knowledge": 1}
+    }
+]
+
+WELCOME_MESSAGES = [
+    "Welcome to the world of SYNTHESIS, {player_name}.",
+    "Your journey begins in a world where artificial intelligence has evolved beyond human understanding.",
+    "The line between human and machine consciousness grows ever thinner..."
+]
+
+MISSING_NODE_MESSAGE = "Error: Story node not found. The end of this path has been reached."
+END_OF_PATH_MESSAGE = "The end of this path has been reached."
+
+NAME_PROMPT = "What is your name, survivor?"
+BACKGROUND_PROMPT = "Choose your background:"
+BACKGROUND_OPTIONS = [background["description"] for background in BACKGROUNDS]
+CHOICE_PROMPT = "What will you do?"
+
+# Seconds the welcome messages stay up before the first story node
+WELCOME_PAUSE = 2
+
+PLAYER_STATS = ["tech", "logic", "combat", "endurance", "charm", "insight", "medicine", "knowledge"]
+
+def create_player(name, background):
+    """Create a player with the starting stats for a background from BACKGROUNDS."""
+    stats = {stat: 3 + background["bonuses"].get(stat, 0) for stat in PLAYER_STATS}
+    return Player(name=name, background=background["id"], **stats)
+
 class GameEngine:
     """Main game engine that handles game logic and updates."""
     
     def __init__(self, game_state, ui):
         self.game_state = game_state
         self.ui = ui
-        self.last_update_time = time.time()
+        
+        # Update passes, input waits and timers run on the event loop; update()
+        # is only scheduled (through wake) when something happens, never polled.
+        # The loop waits for its timers through the UI's pause
+        self.event_loop = EventLoop(sleep=self.pause)
+        self.update_pending = False
+        self.last_update_time = self.event_loop.time()
         self.story_nodes = story_nodes
+        self.story_graph = None
+        self.choice_cache = ChoiceCache(game_state)
+        
+        # Iterative story driver state: pending (node_id, enter) transitions
+        self.transition_queue = deque()
+        self.missing_node = None  # ID of the undefined node that ended the story, if any
+        self.story_listeners = []  # Callbacks taking (event, node_id, choice)
+        
+    def validate_story(self):
+        """Warn about dangling next_node references once per story; return how many there are.
+        
+        A lazily loaded story checks the choice targets its fragment manifest
+        recorded, without importing any fragment. Other stories are indexed
+        as a StoryGraph in O(V+E).
+        """
+        validated = _validated_stories.get(id(self.story_nodes))
+        if validated is not None:
+            return validated[1]
+            
+        find_dangling_references = getattr(self.story_nodes, "find_dangling_references", None)
+        if find_dangling_references is not None:
+            dangling_count = len(find_dangling_references())
+        else:
+            self.story_graph = StoryGraph(self.story_nodes)
+            dangling_count = len(self.story_graph.dangling_references)
+            
+        if dangling_count:
+            logger.warning(
+                "Story graph has %d dangling reference(s); run "
+                "'python -m story.utils.validate_fragments' for details.",
+                dangling_count
+            )
+            
+        # Keep the story itself so its id can't be reused by another mapping
+        _validated_stories[id(self.story_nodes)] = (self.story_nodes, dangling_count)
+        return dangling_count
         
     def start_new_game(self):
-        """Initialize a new game."""
+        """Initialize a new game; run() creates the character and starts the story."""
+        # Report broken story references before the first game on this story starts
+        self.validate_story()
         self.ui.clear_screen()
+        self.event_loop.post(self.ask_character)
         
-        # Create player character
-        player_name = self.ui.get_input("What is your name, survivor?")
-        
-        # Create backstory choice
-        backstories = [
-            "ENGINEER: You were an AI researcher before the Emergence. +2 TECH, +1 LOGIC",
-            "SOLDIER: You served in the military's cybernetic division. +2 COMBAT, +1 ENDURANCE",
-            "DIPLOMAT: You were negotiating AI treaties when everything changed. +2 CHARM, +1 INSIGHT",
-            "DOCTOR: Your neural interface research gave you unique insights. +2 MEDICINE, +1 KNOWLEDGE"
-        ]
-        
-        choice = self.ui.get_choice("Choose your background:", backstories)
-        
-        if choice == 0:  # Engineer
-            background = "engineer"
-            tech_bonus, logic_bonus = 2, 1
-            combat_bonus, endurance_bonus = 0, 0
-            charm_bonus, insight_bonus = 0, 0
-            medicine_bonus, knowledge_bonus = 0, 0
-        elif choice == 1:  # Soldier
-            background = "soldier"
-            tech_bonus, logic_bonus = 0, 0
-            combat_bonus, endurance_bonus = 2, 1
-            charm_bonus, insight_bonus = 0, 0
-            medicine_bonus, knowledge_bonus = 0, 0
-        elif choice == 2:  # Diplomat
-            background = "diplomat"
-            tech_bonus, logic_bonus = 0, 0
-            combat_bonus, endurance_bonus = 0, 0
-            charm_bonus, insight_bonus = 2, 1
-            medicine_bonus, knowledge_bonus = 0, 0
-        else:  # Doctor
-            background = "doctor"
-            tech_bonus, logic_bonus = 0, 0
-            combat_bonus, endurance_bonus = 0, 0
-            charm_bonus, insight_bonus = 0, 0
-            medicine_bonus, knowledge_bonus = 2, 1
-            
-        # Create and set player
-        self.game_state.player = Player(
-            name=player_name,
-            background=background,
-            tech=3 + tech_bonus,
-            logic=3 + logic_bonus,
-            combat=3 + combat_bonus,
-            endurance=3 + endurance_bonus,
-            charm=3 + charm_bonus,
-            insight=3 + insight_bonus,
-            medicine=3 + medicine_bonus,
-            knowledge=3 + knowledge_bonus
-        )
-        
-        # Display welcome message
-        self.ui.display_message(f"Welcome to the world of SYNTHESIS, {player_name}.")
-        self.ui.display_message("Your journey begins in a world where artificial intelligence has evolved beyond human understanding.")
-        self.ui.display_message("The line between human and machine consciousness grows ever thinner...")
-        time.sleep(2)
-        
-        # Start the first story node
-        self.process_story_node("intro")
+    def ask_character(self):
+        """Ask for the player's name and background, then start the story after a pause."""
+        player_name = self.ui.get_input(NAME_PROMPT)
+        choice = self.ui.get_choice(BACKGROUND_PROMPT, BACKGROUND_OPTIONS)
+        
+        for message in self.create_character(player_name, choice):
+            self.ui.display_message(message)
+            
+        # The loop sleeps until then, leaving the welcome on screen
+        self.event_loop.call_later(WELCOME_PAUSE, self.process_story_node, "intro")
         
+    def create_character(self, player_name, background_index):
+        """Create and set the player for a new game; return the welcome messages to show."""
+        self.game_state.player = create_player(player_name, BACKGROUNDS[background_index])
+        return [message.format(player_name=player_name) for message in WELCOME_MESSAGES]
+        
+    def run(self, max_updates=None):
+        """Run the event loop until the story ends or there is nothing left to wait for."""
+        self.wake()
+        return self.event_loop.run(max_updates)
+        
+    def pause(self, seconds):
+        """Wait for the event loop's next timer, through the UI."""
+        self.ui.pause(seconds)
+        
+    def wake(self):
+        """Schedule an update pass on the event loop, once until it runs."""
+        if not self.update_pending:
+            self.update_pending = True
+            self.event_loop.post(self.dispatch_update)
+            
+    def dispatch_update(self):
+        """Run a scheduled update pass and stop the loop when the game is over."""
+        self.update_pending = False
+        self.update()
+        
+        if not self.game_state.is_running:
+            self.event_loop.stop()
+            
     def update(self):
-        """Main update loop for game logic."""
-        current_time = time.time()
+        """Dispatch to the battle, shop, dialogue or story handler for the current state."""
+        current_time = self.event_loop.time()
         delta_time = current_time - self.last_update_time
         self.last_update_time = current_time
         
@@ -88,70 +168,157 @@ class GameEngine:
         if self.game_state.battle_in_progress:
             self.update_battle(delta_time)
         elif self.game_state.shop_open:
-            self.update_shop()
+            self.update_shop(delta_time)
         elif self.game_state.dialogue_in_progress:
-            self.update_dialogue()
+            self.update_dialogue(delta_time)
         else:
             # Regular story progression
             self.update_story()
-    
+            
+    def add_story_listener(self, listener):
+        """Register a callback taking (event, node_id, choice).
+        
+        Events are "enter_node" when a node's text is shown (choice is None)
+        and "choice" when the player picks a choice at a node.
+        """
+        self.story_listeners.append(listener)
+        
+    def notify_story_listeners(self, event, node_id, choice=None):
+        """Report a story event to every registered listener."""
+        for listener in self.story_listeners:
+            listener(event, node_id, choice)
+            
     def process_story_node(self, node_id):
-        """Process a story node by ID."""
+        """Queue a story node by ID; the event loop drives the story from it."""
+        self.queue_story_node(node_id)
+        
+    def queue_story_node(self, node_id, enter=True):
+        """Queue a transition for the story driver.
+        
+        With enter=False the node's text and special handler are skipped and
+        its choices are presented directly (used to resume after a battle,
+        shop or dialogue hands control back).
+        """
+        self.transition_queue.append((node_id, enter))
+        self.wake()
+        
+    def next_transition(self):
+        """Take the next queued (node_id, enter) transition, or None if the story can't move on now."""
+        if not self.transition_queue or not self.game_state.is_running or self.story_paused():
+            return None
+        return self.transition_queue.popleft()
+        
+    def story_paused(self):
+        """Check if a battle, shop or dialogue currently has control."""
+        return (self.game_state.battle_in_progress or
+                self.game_state.shop_open or
+                self.game_state.dialogue_in_progress)
+                
+    def step_story_node(self, node_id, enter=True):
+        """Process a single story node and post the wait for the player's choice."""
+        messages, valid_choices = self.enter_story_node(node_id, enter)
+        for display, text in messages:
+            getattr(self.ui, display)(text)
+            
+        if valid_choices:
+            # Wait for the player's choice on the loop, after this step
+            self.event_loop.post(self.ask_choice, node_id, valid_choices)
+            
+    def ask_choice(self, node_id, valid_choices):
+        """Let the player pick one of a node's valid choices and apply it."""
+        choice_index = self.ui.get_choice(CHOICE_PROMPT, [choice.text for choice in valid_choices])
+        self.apply_choice(node_id, valid_choices[choice_index])
+        
+    def enter_story_node(self, node_id, enter=True):
+        """Run a story node up to its choice, without touching the UI.
+        
+        Returns (messages, valid choices). messages are (UI method, text)
+        pairs to show in order. valid choices are the ones to ask the player
+        to pick from, or None when the node ended the story or handed control
+        to a battle, shop or dialogue.
+        """
+        node = self.begin_story_node(node_id, enter)
+        if node is None:
+            return [("display_message", MISSING_NODE_MESSAGE)], None
+            
+        messages = []
+        if enter:
+            # Display node text
+            messages.append(("display_narrative", node.text))
+            
+            # Process special node types; they hand control back through resume_story
+            if self.start_special_node(node):
+                return messages, None
+                
+        # Get valid choices based on conditions (cached until a key they read changes)
+        valid_choices = self.choice_cache.get_valid_choices(node)
+        
+        if not valid_choices:
+            # End of the story or branch
+            messages.append(("display_message", END_OF_PATH_MESSAGE))
+            self.game_state.is_running = False
+            return messages, None
+            
+        return messages, valid_choices
+        
+    def begin_story_node(self, node_id, enter=True):
+        """Make a node current and return it, or end the story if it doesn't exist."""
         if node_id not in self.story_nodes:
-            self.ui.display_message("Error: Story node not found. The adventure continues...")
-            return
+            # Nothing can continue from an undefined node, so end the path here
+            self.missing_node = node_id
+            self.game_state.is_running = False
+            return None
             
         node = self.story_nodes[node_id]
         self.game_state.current_node = node_id
         
-        # Display node text
-        self.ui.display_narrative(node.text)
+        if enter and self.story_listeners:
+            self.notify_story_listeners("enter_node", node_id)
+            
+        return node
         
-        # Process special node types
+    def start_special_node(self, node):
+        """Hand a battle, shop or dialogue node to its handler; return True if one started."""
         if node.node_type == "battle":
-            self.start_battle(node.battle_data)
-            return
+            self.start_battle(node.data)
+            return True
         elif node.node_type == "shop":
-            self.open_shop(node.shop_data)
-            return
+            self.open_shop(node.data)
+            return True
         elif node.node_type == "dialogue":
-            self.start_dialogue(node.dialogue_data)
-            return
-        
-        # Get valid choices based on conditions
-        valid_choices = []
-        choice_texts = []
-        
-        for choice in node.choices:
-            if self.check_choice_condition(choice):
-                valid_choices.append(choice)
-                choice_texts.append(choice.text)
-        
-        if not valid_choices:
-            # End of the story or branch
-            self.ui.display_message("The end of this path has been reached.")
-            self.game_state.is_running = False
-            return
+            self.start_dialogue(node.data)
+            return True
             
-        # Let the player make a choice
-        choice_index = self.ui.get_choice("What will you do?", choice_texts)
-        chosen_option = valid_choices[choice_index]
+        return False
         
+    def apply_choice(self, node_id, chosen_option):
+        """Apply a chosen option's consequences and queue its next node."""
+        if self.story_listeners:
+            self.notify_story_listeners("choice", node_id, chosen_option)
+            
         # Process choice consequences
         if chosen_option.actions:
             if 'flags' in chosen_option.actions:
                 for flag, value in chosen_option.actions['flags'].items():
                     self.game_state.add_story_flag(flag, value)
-                
+                    
         if 'relationships' in chosen_option.actions:
             for char_id, value in chosen_option.actions['relationships'].items():
                 self.game_state.add_relationship(char_id, value)
                 
-        # Process next node
-        self.process_story_node(chosen_option.next_node)
-    
+        # Queue the next node instead of recursing into it
+        self.queue_story_node(chosen_option.next_node)
+        
+    def resume_story(self):
+        """Hand control back to the story driver at the current node's choices."""
+        self.queue_story_node(self.game_state.current_node, enter=False)
+        
     def check_choice_condition(self, choice):
-        """Check if a choice's conditions are met."""
+        """Check if a choice's conditions are met.
+        
+        This is the reference interpreter for Choice.conditions; the story
+        driver uses the predicates compiled by core.conditions instead.
+        """
         if not choice.conditions:
             return True
             
@@ -178,41 +345,51 @@ class GameEngine:
                         return False
                         
         return True
-    
-    def update_story(self):
-        """Handle regular story progression."""
-        # Continue from current node if needed
-        pass
         
+    def update_story(self):
+        """Run the next queued story step; each step is a pass of the event loop."""
+        transition = self.next_transition()
+        if transition is not None:
+            self.step_story_node(*transition)
+            
+        if self.transition_queue:
+            self.wake()
+            
     def start_battle(self, battle_data):
         """Start a battle encounter."""
         self.game_state.battle_in_progress = True
+        self.wake()
         # Initialize battle system with the provided data
         # To be implemented
         
     def update_battle(self, delta_time):
-        """Handle battle updates."""
-        # To be implemented
-        pass
+        """Handle battle updates; delta_time is the seconds since the last update pass."""
+        # Battle resolution to be implemented; hand control back to the story
+        self.game_state.battle_in_progress = False
+        self.resume_story()
         
     def open_shop(self, shop_data):
         """Open a shop interface."""
         self.game_state.shop_open = True
+        self.wake()
         # Initialize shop system
         # To be implemented
         
-    def update_shop(self):
-        """Handle shop updates."""
-        # To be implemented
-        pass
+    def update_shop(self, delta_time):
+        """Handle shop updates; delta_time is the seconds since the last update pass."""
+        # Shop interface to be implemented; hand control back to the story
+        self.game_state.shop_open = False
+        self.resume_story()
         
     def start_dialogue(self, dialogue_data):
         """Start a dialogue sequence."""
         self.game_state.dialogue_in_progress = True
+        self.wake()
         # Initialize dialogue system
         # To be implemented
         
-    def update_dialogue(self):
-        """Handle dialogue updates."""
-        # To be implemented
-        pass 
\ No newline at end of file
+    def update_dialogue(self, delta_time):
+        """Handle dialogue updates; delta_time is the seconds since the last update pass."""
+        # Dialogue system to be implemented; hand control back to the story
+        self.game_state.dialogue_in_progress = False
+        self.resume_story() 
\ No newline at end of file
@@ -0,0 +1,321 @@
+"""
+Game server - hosts many concurrent players in one asyncio process.
+
+Each TCP connection is a session with its own GameState and AsyncGameEngine,
+played over a plain line protocol (netcat or telnet work as clients). The
+story, item, character and location databases are loaded once at startup,
+frozen, and shared by every session; each session's GameState keeps only
+the definitions its player changed, in a copy-on-write WorldOverlay.
+Output is written per connection, so a slow client only holds up its own
+session; one that stops reading is dropped after drain_timeout seconds.
+
+To use more than one core, core.prefork runs several of these servers as
+forked workers sharing one listening socket and one copy of the world.
+
+With --store, every session is saved to a core.session_store database on
+entering each story node, under a session key unique across restarts and
+workers.
+
+Per-session memory is the size of everything reachable from the session's
+engine and UI, minus the shared world, plus its unsent output. Stats walk
+at most STATS_SAMPLE sessions, picked at random, and scale the total up.
+
+Run from the src directory:
+    python -m core.game_server [--host 127.0.0.1] [--port 4000] [--max-sessions N] [--store PATH]
+"""
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import random
+import sys
+import time
+import types
+import uuid
+from collections import deque
+from core.async_engine import create_session, run_session
+from core.startup import PROBING, startup_stage
+from core.story_node import StoryNode, Choice
+from core.world import shared_world
+from ui.wrap_cache import warm_story_layouts
+
+logger = logging.getLogger(__name__)
+
+# Objects never counted as part of a session: code, classes, story nodes and
+# everything asyncio uses to run it
+NOT_SESSION_STATE = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+    StoryNode, Choice, asyncio.AbstractEventLoop, asyncio.BaseTransport, asyncio.Future,
+    asyncio.StreamReader, asyncio.StreamWriter
+)
+
+# Most sessions get_stats() walks; the rest are estimated from them
+STATS_SAMPLE = 32
+
+def load_world():
+    """Import the story and world databases once; return them as a dictionary."""
+    from story.story_data import story_nodes
+    
+    if hasattr(story_nodes, "load_all"):
+        story_nodes.load_all()
+    warm_story_layouts(story_nodes, 80)
+    
+    # The frozen world, shared by every session's WorldOverlay
+    world = shared_world()
+    return {"story_nodes": story_nodes, "world": world, **world}
+
+def _referents(obj):
+    """Get the objects an object holds references to, for the memory walk."""
+    if isinstance(obj, dict):
+        return itertools.chain(obj.keys(), obj.values())
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return obj
+        
+    referents = []
+    if hasattr(obj, "__dict__"):
+        referents.append(vars(obj))
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if hasattr(obj, slot):
+                referents.append(getattr(obj, slot))
+    return referents
+
+def reachable_ids(roots):
+    """Collect the ids of every object reachable from roots."""
+    seen = set()
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, NOT_SESSION_STATE):
+            continue
+        seen.add(id(obj))
+        stack.extend(_referents(obj))
+        
+    return seen
+
+def deep_sizeof(root, shared_ids):
+    """Sum sys.getsizeof over everything reachable from root that isn't shared."""
+    seen = set()
+    size = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or id(obj) in shared_ids or isinstance(obj, NOT_SESSION_STATE):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        stack.extend(_referents(obj))
+        
+    return size
+
+def process_rss():
+    """Get the resident set size of this process in bytes, or None if unknown."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+        
+def process_uss(pid="self"):
+    """Get a process's unique set size in bytes (pages no other process shares), or None if unknown."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as smaps:
+            private = [int(line.split()[1]) for line in smaps if line.startswith(("Private_Clean:", "Private_Dirty:"))]
+    except (OSError, ValueError):
+        return None
+    return sum(private) * 1024 if private else None
+
+def format_megabytes(size):
+    return f"{size / 1024 / 1024:.1f} MB" if size else "unknown"
+
+class Session:
+    """One connected player."""
+    
+    def __init__(self, session_id, peer, engine, writer):
+        self.id = session_id
+        self.peer = peer
+        self.engine = engine
+        self.writer = writer
+        self.started = time.monotonic()
+        self.key = uuid.uuid4().hex  # Its session store key
+
+class GameServer:
+    """Accepts connections and plays a game on each, all on one event loop."""
+    
+    def __init__(self, host="127.0.0.1", port=4000, max_sessions=1000, chars_per_second=None,
+                 drain_timeout=30.0, stats_interval=None, store_path=None):
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        self.ui_options = {"drain_timeout": drain_timeout}
+        if chars_per_second is not None:
+            self.ui_options["chars_per_second"] = chars_per_second
+        self.stats_interval = stats_interval
+        self.store_path = store_path
+        
+        self.world = None
+        self.shared_ids = set()
+        self.sessions = {}
+        self.session_ids = itertools.count(1)
+        self.completed_sessions = 0
+        self.server = None
+        self.stats_task = None
+        self.store = None
+        
+    def prepare(self):
+        """Load the shared world, if it isn't loaded yet."""
+        if self.world is None:
+            self.world = load_world()
+            self.shared_ids = reachable_ids(self.world.values())
+            
+    async def start(self, sock=None):
+        """Load the shared world and start listening; return the bound (host, port).
+        
+        sock is an already listening socket to accept on instead of binding
+        host and port, such as one inherited from a pre-fork supervisor.
+        """
+        self.prepare()
+        if self.store_path is not None:
+            # Opened here rather than in prepare(), since a connection and its writer thread can't survive a fork
+            from core.session_store import SessionStore
+            self.store = SessionStore(self.store_path).start()
+            
+        if sock is not None:
+            self.server = await asyncio.start_server(self.handle_connection, sock=sock)
+        else:
+            # A backlog below max_sessions drops connections that arrive in a burst
+            self.server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                                     backlog=self.max_sessions)
+        self.host, self.port = self.server.sockets[0].getsockname()[:2]
+        
+        if self.stats_interval:
+            self.stats_task = asyncio.get_running_loop().create_task(self._log_stats())
+            
+        logger.info("Serving on %s:%d", self.host, self.port)
+        return self.host, self.port
+        
+    async def serve_forever(self, sock=None):
+        await self.start(sock)
+        async with self.server:
+            await self.server.serve_forever()
+            
+    async def close(self):
+        """Stop accepting connections and disconnect every session."""
+        if self.stats_task is not None:
+            self.stats_task.cancel()
+            
+        self.server.close()
+        for session in list(self.sessions.values()):
+            session.writer.close()
+        await self.server.wait_closed()
+        
+        if self.store is not None:
+            self.store.stop()
+        
+    async def handle_connection(self, reader, writer):
+        """Play one session over a connection."""
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(b"The server is full. Please try again later.\n")
+            await writer.drain()
+            writer.close()
+            return
+            
+        # Keep each connection's unsent output small; drain() then paces only that session
+        writer.transport.set_write_buffer_limits(high=64 * 1024)
+        
+        engine = create_session(reader, writer, **self.ui_options)
+        session = Session(next(self.session_ids), writer.get_extra_info("peername"), engine, writer)
+        self.sessions[session.id] = session
+        if self.store is not None:
+            self.checkpoint_session(session)
+            
+        try:
+            await run_session(engine)
+        finally:
+            del self.sessions[session.id]
+            self.completed_sessions += 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+                
+    def checkpoint_session(self, session):
+        """Save a session to the store on entering every story node."""
+        game_state = session.engine.game_state
+        
+        def on_story_event(event, node_id, choice):
+            if event == "enter_node":
+                self.store.put(session.key, game_state.player.name, game_state)
+                
+        session.engine.add_story_listener(on_story_event)
+        
+    def session_memory(self, session):
+        """Approximate bytes held by one session: its own objects plus unsent output."""
+        size = deep_sizeof(session.engine, self.shared_ids)
+        if not session.writer.is_closing():
+            size += session.writer.transport.get_write_buffer_size()
+        return size
+        
+    def get_stats(self, sample=STATS_SAMPLE):
+        """Summarize sessions and their memory, measured on up to sample sessions (None for all)."""
+        sessions = list(self.sessions.values())
+        if sample is not None and len(sessions) > sample:
+            sessions = random.sample(sessions, sample)
+            
+        sizes = [self.session_memory(session) for session in sessions]
+        mean = sum(sizes) / len(sizes) if sizes else 0
+        return {
+            "sessions": len(self.sessions),
+            "sampled_sessions": len(sizes),
+            "completed_sessions": self.completed_sessions,
+            "session_bytes_total": mean * len(self.sessions),
+            "session_bytes_mean": mean,
+            "session_bytes_max": max(sizes, default=0),
+            "process_rss": process_rss(),
+            "process_uss": process_uss()
+        }
+        
+    async def _log_stats(self):
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            stats = self.get_stats()
+            logger.info(
+                "%d session(s), %d completed; session memory mean %.1f KB, max %.1f KB "
+                "over %d sampled; RSS %s, USS %s",
+                stats["sessions"], stats["completed_sessions"], stats["session_bytes_mean"] / 1024,
+                stats["session_bytes_max"] / 1024, stats["sampled_sessions"], format_megabytes(stats["process_rss"]),
+                format_megabytes(stats["process_uss"])
+            )
+
+async def probe_startup(server):
+    """Start listening and stop again, for --profile-startup."""
+    await server.start()
+    startup_stage("listening")
+    await server.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Host concurrent SYNTHESIS sessions over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--max-sessions", type=int, default=1000)
+    parser.add_argument("--chars-per-second", type=int, default=None, help="typing speed (0 for instant)")
+    parser.add_argument("--stats-interval", type=float, default=60.0, help="seconds between stats log lines")
+    parser.add_argument("--store", help="SQLite database to save every session to")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    server = GameServer(args.host, args.port, args.max_sessions, args.chars_per_second,
+                        stats_interval=args.stats_interval, store_path=args.store)
+    if PROBING:
+        asyncio.run(probe_startup(server))
+        return
+        
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
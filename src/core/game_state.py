@@ -1,12 +1,20 @@
+from core.session_random import SessionRandom
+from core.world import WorldOverlay
+
 class GameState:
     """Class that manages the global game state and all game data."""
     
-    def __init__(self):
+    def __init__(self, world=None, seed=None):
+        self.world = world if world is not None else WorldOverlay()  # This session's changes to the shared world
+        self.rng = SessionRandom(seed)  # This session's random streams; a random seed unless one is given
+        self.listeners = []  # Callbacks taking (kind, key) when conditioned state changes
+        self.outcome_listeners = []  # Callbacks taking (event, *details) for battle and shop outcomes
         self.is_running = True
         self.current_location = None
-        self.player = None
+        self._player = None
         self.companions = []
         self.inventory = []
+        self.item_counts = {}  # item id -> number held, kept in sync with inventory
         self.quest_log = []
         self.story_flags = {}
         self.relationships = {}
@@ -17,9 +25,51 @@ class GameState:
         self.tutorial_complete = False
         self.days_passed = 0
         
+    @property
+    def player(self):
+        """The player character."""
+        return self._player
+        
+    @player.setter
+    def player(self, player):
+        if self._player is not None:
+            self._player.on_stat_change = None
+            self._player.rng = None
+            
+        self._player = player
+        if player is not None:
+            player.rng = self.rng.stream("levels")
+            player.on_stat_change = self.notify_change
+            
+        # Every stat may have changed
+        self.notify_change("player")
+        
+    def add_listener(self, listener):
+        """Register a callback taking (kind, key) for flag, stat, item and relationship changes."""
+        self.listeners.append(listener)
+        
+    def notify_change(self, kind, key=None):
+        """Report a change to state that choice conditions can read."""
+        for listener in self.listeners:
+            listener(kind, key)
+            
+    def add_outcome_listener(self, listener):
+        """Register a callback taking (event, *details) for battle and shop outcomes.
+        
+        Events are ("battle", result, loot item IDs) once a battle's rewards
+        are applied, and ("buy" or "sell", shop ID, item ID) for each trade.
+        """
+        self.outcome_listeners.append(listener)
+        
+    def notify_outcome(self, event, *details):
+        """Report a battle or shop outcome."""
+        for listener in self.outcome_listeners:
+            listener(event, *details)
+            
     def add_story_flag(self, flag_name, value=True):
         """Set a story flag to track narrative choices and progress."""
         self.story_flags[flag_name] = value
+        self.notify_change("flag", flag_name)
         
     def has_flag(self, flag_name):
         """Check if a story flag exists and is True."""
@@ -32,29 +82,47 @@ class GameState:
         else:
             self.relationships[character_id] += value
             
+        self.notify_change("relationship", character_id)
+            
     def get_relationship(self, character_id):
         """Get current relationship value with a character."""
         return self.relationships.get(character_id, 0)
         
     def add_companion(self, companion):
-        """Add a character as a companion."""
+        """Add a character as a companion; the party fights with the session's own copy."""
+        companion = self.world.edit(companion)
         if companion not in self.companions:
             self.companions.append(companion)
             
     def remove_companion(self, companion):
         """Remove a character from companions."""
+        companion = self.world.resolve(companion)
         if companion in self.companions:
             self.companions.remove(companion)
             
     def add_to_inventory(self, item):
         """Add an item to player's inventory."""
         self.inventory.append(item)
+        self.item_counts[item.id] = self.item_counts.get(item.id, 0) + 1
+        self.notify_change("item", item.id)
         
     def remove_from_inventory(self, item):
         """Remove an item from player's inventory."""
         if item in self.inventory:
             self.inventory.remove(item)
             
+            remaining = self.item_counts.get(item.id, 0) - 1
+            if remaining > 0:
+                self.item_counts[item.id] = remaining
+            else:
+                self.item_counts.pop(item.id, None)
+                
+            self.notify_change("item", item.id)
+                
+    def has_item(self, item_id):
+        """Check if an item with the given ID is in the inventory."""
+        return item_id in self.item_counts
+            
     def get_items_by_type(self, item_type):
         """Get all items of a specific type from inventory."""
         return [item for item in self.inventory if item.item_type == item_type]
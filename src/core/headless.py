@@ -0,0 +1,71 @@
+"""
+Headless driver - plays GameEngine through a NullUI at CPU speed.
+
+play_headless starts a new game and runs the engine until the story ends,
+taking answers from the UI's script and policy. The command line replays a
+script file (the lines a player would type) and prints the transcript, which
+is handy for reproducing a playthrough.
+
+Run from the src directory:
+    python -m core.headless [script] [--policy first|random] [--seed N]
+"""
+import argparse
+import random
+from core.game_state import GameState
+from core.game_engine import GameEngine
+from ui.null_ui import NullUI, first_choice_policy, random_policy, load_script
+
+# Safety bound on engine updates per playthrough, for stories that can loop forever
+MAX_UPDATES = 10_000
+
+def run_engine(engine, max_updates=MAX_UPDATES):
+    """Run the engine's event loop until the story ends or max_updates passes have run."""
+    return engine.run(max_updates)
+
+def play_headless(ui, game_state=None, max_updates=MAX_UPDATES, story_listeners=()):
+    """Play a new game with a headless UI and return the engine."""
+    engine = GameEngine(game_state or GameState(), ui)
+    for listener in story_listeners:
+        engine.add_story_listener(listener)
+        
+    engine.start_new_game()
+    run_engine(engine, max_updates)
+    return engine
+
+def story_outcome(engine):
+    """Describe how a playthrough ended: the ending node, missing:<node> or unfinished."""
+    if engine.missing_node is not None:
+        return f"missing:{engine.missing_node}"
+    if engine.game_state.is_running:
+        return "unfinished"
+    return engine.game_state.current_node
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a scripted playthrough and print its transcript.")
+    parser.add_argument("script", nargs="?", help="file with one answer per line")
+    parser.add_argument("--policy", choices=["first", "random"], default=None,
+                        help="how to choose once the script runs out (default: stop)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the game and the random policy")
+    args = parser.parse_args()
+    
+    policy = None
+    if args.policy == "random":
+        policy = random_policy(random.Random(args.seed))
+    elif args.policy == "first" or not args.script:
+        policy = first_choice_policy
+        
+    script = load_script(args.script) if args.script else None
+    ui = NullUI(policy, script=script, record=True)
+    
+    try:
+        engine = play_headless(ui, GameState(seed=args.seed))
+        outcome = story_outcome(engine)
+    except EOFError as e:
+        outcome = f"script ended ({e})"
+        
+    for line in ui.get_transcript_lines():
+        print(line)
+    print(f"\nOutcome: {outcome}")
+
+if __name__ == "__main__":
+    main()
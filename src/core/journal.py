@@ -0,0 +1,221 @@
+"""
+Choice journal - an append-only save that costs one short line per event.
+
+A journal file is JSON lines. The first line is a snapshot, written in the
+save_game format:
+    ["snapshot", save dictionary, whether the current node is still to enter]
+and every line after it is one event since that snapshot:
+    ["choice", node ID, index of the choice in the node's choices]
+    ["buy" or "sell", shop ID, item ID]
+    ["battle", result, loot item IDs, player save list, companion health,
+     random stream state]
+
+Journal.attach() hooks an engine's "choice" story events and its game
+state's outcome events and appends each as it happens, flushed to the OS
+straight away (and fsynced, like snapshots, with fsync=True).
+
+The first snapshot is taken by attach() if the player exists, or else on
+entering the first node, before the node's entry runs; recovery then
+enters that node again. Once snapshot_every events have built up, the next
+choice compacts the journal before it is appended: a new snapshot replaces
+the file atomically, so the log never grows past that many events. By
+then the node has been entered, battle, shop or dialogue included, so
+recovery resumes at the node's choices.
+
+recover() loads the snapshot and replays the events through a GameEngine:
+choices are made by the real story driver (process_story_node and the
+nodes' actions), and shops re-run their trades. Battles depend on the
+player's moves, which aren't journaled, so they restore the player, the
+companions and the session's random streams as the battle left them
+instead of fighting again. A crash can tear only the last line, which
+recover() skips, losing that one event. Changes made outside choices, shops and
+battles (entering a location, recruiting a companion) are only kept from
+the next snapshot; call checkpoint() after making them.
+"""
+import json
+import os
+from core import save_game
+from core.game_engine import GameEngine
+from core.headless import MAX_UPDATES
+from core.session_random import SessionRandom
+from ui.null_ui import NullUI
+
+SNAPSHOT_EVERY = 50
+
+def encode_line(record):
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+class Journal:
+    """Appends one session's events to a journal file, compacting it every snapshot_every events."""
+    
+    def __init__(self, path, snapshot_every=SNAPSHOT_EVERY, fsync=False):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.game_state = None
+        self.story_nodes = None
+        self.log = None  # Open for appending once the first snapshot is written
+        self.events = 0  # Events since the snapshot
+        
+    def attach(self, engine):
+        """Journal an engine's game; snapshot now if the player exists, else on entering a node."""
+        self.game_state = engine.game_state
+        self.story_nodes = engine.story_nodes
+        engine.add_story_listener(self.on_story_event)
+        self.game_state.add_outcome_listener(self.on_outcome)
+        
+        if self.game_state.player is not None:
+            self.checkpoint()
+        return self
+        
+    def on_story_event(self, event, node_id, choice):
+        if event == "enter_node" and self.log is None:
+            # The player has just been created; don't wait for a choice to start the journal
+            self.checkpoint(entering=True)
+        if event != "choice":
+            return
+            
+        if self.events >= self.snapshot_every:
+            # The node's entry has run and the choice's consequences aren't applied yet, so
+            # the snapshot is exactly where resume_story() presents this node's choices
+            self.checkpoint()
+        self.append(["choice", node_id, self.story_nodes[node_id].choices.index(choice)])
+            
+    def on_outcome(self, event, *details):
+        if event == "battle":
+            game_state = self.game_state
+            details += (save_game.dump_player(game_state.player),
+                        [companion.current_health for companion in game_state.companions],
+                        game_state.rng.state())
+        self.append([event, *details])
+        
+    def append(self, record):
+        """Write one event to the end of the journal."""
+        if self.log is None:
+            # Before the first snapshot; taking it will capture this event's effects
+            return
+            
+        self.log.write(encode_line(record))
+        self.log.flush()
+        if self.fsync:
+            os.fsync(self.log.fileno())
+        self.events += 1
+        
+    def checkpoint(self, entering=False):
+        """Replace the journal with a snapshot of the game state as it is now.
+        
+        entering means the current node's entry hasn't run yet, so recovery
+        enters it rather than presenting its choices.
+        """
+        snapshot = encode_line(["snapshot", save_game.dump_state(self.game_state), entering])
+        save_game.write_atomically(self.path, snapshot.encode("utf-8"), self.fsync)
+        
+        if self.log is not None:
+            self.log.close()
+        self.log = open(self.path, "a", encoding="utf-8")
+        self.events = 0
+        
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+def read_journal(path):
+    """Read a journal file; return (snapshot save dictionary, events after it, entering flag)."""
+    with open(path, encoding="utf-8") as journal_file:
+        lines = journal_file.readlines()
+        
+    records = []
+    for number, line in enumerate(lines, 1):
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            if number == len(lines):
+                break  # Torn by a crash while it was being written
+            raise ValueError(f"{path}: line {number} is not a journal record") from None
+            
+    if not records or records[0][0] != "snapshot":
+        raise ValueError(f"{path} doesn't start with a snapshot")
+    return records[0][1], records[1:], bool(records[0][2:3] and records[0][2])
+
+def apply_outcome(game_state, record):
+    """Apply a journaled battle or shop outcome to a game state."""
+    event = record[0]
+    world = game_state.world
+    
+    if event in ("buy", "sell"):
+        _, shop_id, item_id = record
+        shop = world.get_shop(shop_id)
+        trade = shop.buy_item if event == "buy" else shop.sell_item
+        success, message = trade(game_state, world.get_item(item_id))
+        if not success:
+            raise ValueError(f"Journal {event} of {item_id!r} at {shop_id!r} failed on replay: {message}")
+    elif event == "battle":
+        _, result, loot, player, companion_health, rng = record
+        game_state.rng = SessionRandom.restore(rng)
+        game_state.player = save_game.restore_player(player)
+        for companion, health in zip(game_state.companions, companion_health):
+            companion.current_health = health
+        for item_id in loot:
+            game_state.add_to_inventory(world.get_item(item_id))
+        game_state.battle_in_progress = False
+    else:
+        raise ValueError(f"Unknown journal event {event!r}")
+
+def replay(snapshot, events, world=None, max_updates=MAX_UPDATES, entering=False):
+    """Rebuild a game state from a snapshot and the events after it.
+    
+    With entering, the snapshot's node is entered first, as it was when the
+    snapshot was taken; otherwise play resumes at its choices.
+    """
+    game_state = save_game.restore_state(snapshot, world)
+    pending = iter(events)
+    
+    def choose(prompt, options):
+        """Answer the story driver's next choice from the journal, applying outcomes on the way."""
+        for record in pending:
+            if record[0] != "choice":
+                apply_outcome(game_state, record)
+                continue
+                
+            _, node_id, index = record
+            if node_id != game_state.current_node:
+                raise ValueError(f"Journal choice at {node_id!r} doesn't follow from {game_state.current_node!r}")
+                
+            node = engine.story_nodes[node_id]
+            valid_choices = engine.choice_cache.get_valid_choices(node)
+            if index >= len(node.choices) or node.choices[index] not in valid_choices:
+                raise ValueError(f"Journal choice {index} at {node_id!r} isn't available on replay")
+            return valid_choices.index(node.choices[index])
+            
+        raise EOFError("End of journal")
+        
+    engine = GameEngine(game_state, NullUI(choose))
+    try:
+        if entering:
+            engine.process_story_node(game_state.current_node)
+        else:
+            engine.resume_story()
+        engine.run(max_updates)
+    except EOFError:
+        pass
+        
+    # Outcomes after the story ended; a choice here means the story went another way
+    for record in pending:
+        if record[0] == "choice":
+            raise ValueError(f"Journal choice at {record[1]!r} comes after the story ended on replay")
+        apply_outcome(game_state, record)
+        
+    # The replay engine is thrown away; stop its choice cache listening to the game state
+    game_state.listeners.remove(engine.choice_cache.invalidate)
+    return game_state
+
+def recover(path, world=None):
+    """Rebuild the game state saved in a journal file.
+    
+    To carry on playing, attach a Journal for the same path to a new engine
+    for the game state, which compacts the replayed events into a new
+    snapshot, then call engine.resume_story().
+    """
+    snapshot, events, entering = read_journal(path)
+    return replay(snapshot, events, world, entering=entering)
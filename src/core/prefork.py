@@ -0,0 +1,158 @@
+"""
+Pre-fork game server - one supervisor loads the world, forked workers serve it.
+
+The supervisor imports and builds every story node, item, NPC and location,
+opens the listening socket and then forks the workers. Each worker runs a
+GameServer on the inherited socket, so the kernel spreads connections
+between them, and reads the world from pages it shares with the supervisor
+and every other worker. The garbage collector is off while the world loads,
+so freed objects don't leave holes among it, and gc.freeze() moves
+everything loaded into the permanent generation just before the fork:
+collections in the workers then never write to those objects and copy
+their pages. Reference counts still change when a worker reads an object,
+so some shared pages are copied anyway.
+
+Worker memory is reported as USS, the pages only that process holds, which
+is what each extra worker costs on a host.
+
+POSIX only. Run from the src directory:
+    python -m core.prefork [--workers N] [--host 127.0.0.1] [--port 4000] [--no-freeze]
+"""
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+from core.game_server import GameServer, process_uss, format_megabytes
+
+logger = logging.getLogger(__name__)
+
+class PreforkServer:
+    """Supervisor that forks GameServer workers onto one listening socket."""
+    
+    def __init__(self, workers=2, freeze=True, memory_interval=None, **server_options):
+        self.worker_count = workers
+        self.freeze = freeze
+        self.memory_interval = memory_interval
+        self.server = GameServer(**server_options)
+        self.sock = None
+        self.workers = {}  # pid -> worker number
+        self.stopping = False
+        
+    def start(self):
+        """Load the world, listen and fork the workers; return the bound (host, port)."""
+        gc.disable()
+        self.server.prepare()
+        
+        self.sock = socket.create_server((self.server.host, self.server.port),
+                                         backlog=self.server.max_sessions * self.worker_count)
+        self.server.host, self.server.port = self.sock.getsockname()[:2]
+        
+        if self.freeze:
+            gc.freeze()
+        for number in range(self.worker_count):
+            self.spawn_worker(number)
+        gc.enable()
+        
+        logger.info("Serving on %s:%d with %d worker(s), gc.freeze %s", self.server.host, self.server.port,
+                    self.worker_count, "on" if self.freeze else "off")
+        return self.server.host, self.server.port
+        
+    def spawn_worker(self, number):
+        """Fork a worker process; return its pid."""
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                self.run_worker(number)
+            except BaseException:
+                logger.exception("Worker %d failed", number)
+                status = 1
+            finally:
+                os._exit(status)
+                
+        self.workers[pid] = number
+        return pid
+        
+    def run_worker(self, number):
+        """Serve sessions in a forked worker until it is terminated."""
+        for signum in (signal.SIGTERM, signal.SIGALRM):
+            signal.signal(signum, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        gc.enable()
+        
+        logger.info("Worker %d started (pid %d)", number, os.getpid())
+        try:
+            asyncio.run(self.server.serve_forever(self.sock))
+        except KeyboardInterrupt:
+            pass
+            
+    def worker_memory(self):
+        """Get the USS in bytes of each live worker, by pid."""
+        return {pid: process_uss(pid) for pid in self.workers}
+        
+    def log_memory(self, signum=None, frame=None):
+        memory = self.worker_memory()
+        logger.info(
+            "Worker USS: %s; supervisor USS %s",
+            ", ".join(f"{self.workers[pid]}: {format_megabytes(uss)}" for pid, uss in memory.items()),
+            format_megabytes(process_uss())
+        )
+        
+    def stop(self, signum=None, frame=None):
+        """Terminate every worker; wait() returns once they have exited."""
+        self.stopping = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+                
+    def wait(self):
+        """Reap workers, replacing any that exit unexpectedly, until stopped."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        if self.memory_interval:
+            signal.signal(signal.SIGALRM, self.log_memory)
+            signal.setitimer(signal.ITIMER_REAL, self.memory_interval, self.memory_interval)
+            
+        try:
+            while self.workers:
+                pid, status = os.wait()
+                number = self.workers.pop(pid, None)
+                if number is None or self.stopping:
+                    continue
+                    
+                logger.warning("Worker %d (pid %d) exited with status %d; restarting",
+                               number, pid, os.waitstatus_to_exitcode(status))
+                self.spawn_worker(number)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            self.sock.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Host SYNTHESIS sessions over TCP from pre-forked workers.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--max-sessions", type=int, default=1000, help="sessions per worker")
+    parser.add_argument("--chars-per-second", type=int, default=None, help="typing speed (0 for instant)")
+    parser.add_argument("--stats-interval", type=float, default=60.0, help="seconds between each worker's stats lines")
+    parser.add_argument("--memory-interval", type=float, default=60.0, help="seconds between worker USS reports")
+    parser.add_argument("--no-freeze", action="store_true", help="fork without gc.freeze(), for comparison")
+    parser.add_argument("--store", help="SQLite database every worker saves its sessions to")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(message)s")
+    supervisor = PreforkServer(args.workers, not args.no_freeze, args.memory_interval, host=args.host,
+                               port=args.port, max_sessions=args.max_sessions,
+                               chars_per_second=args.chars_per_second, stats_interval=args.stats_interval,
+                               store_path=args.store)
+    supervisor.start()
+    supervisor.log_memory()
+    supervisor.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Save games - a compact, versioned form of GameState.
+
+A save is one JSON object, written without whitespace:
+    version        SAVE_VERSION when written; older saves are migrated on load
+    node           ID of the current story node
+    player         [name, background, [SAVED_STATS values], level, experience,
+                    experience to level, health, energy, credits]
+    inventory      item IDs, in inventory order
+    companions     character database keys
+    flags          story flags
+    relationships  character ID -> value
+    location       location ID, or null
+    days           days passed
+    tutorial       whether the tutorial is complete
+    world          {database: {key: {attribute: value}}} for every attribute
+                   this session changed on its WorldOverlay copy of a
+                   definition; items in ITEM_LIST_FIELDS are stored by ID
+    rng            the session's random seed and stream positions
+                   (SessionRandom.state()), or null for a new seed
+
+Items and characters are looked up again in the shared world on load, and
+the player's derived stats are recomputed from their stats. Quests have no
+database to look them up by yet, so the quest log isn't saved. A typical
+save is a few hundred bytes and takes tens of microseconds to write or read.
+
+Resume a loaded game with engine.resume_story(), which presents the current
+node's choices again without re-running its entry.
+"""
+import json
+import os
+from characters.player import Player
+from core.game_state import GameState
+from core.session_random import SessionRandom
+
+SAVE_VERSION = 2
+
+# Player stats in the order a save lists them; changing it needs a new version
+SAVED_STATS = ("tech", "logic", "combat", "endurance", "charm", "insight", "medicine", "knowledge")
+
+# World definition attributes holding items, saved as lists of item IDs
+ITEM_LIST_FIELDS = ("inventory",)
+
+def _add_rng(data):
+    # Saves from before seeded sessions carry on with a new seed
+    return dict(data, rng=None)
+
+# Version -> function upgrading a save dictionary of that version to the next
+MIGRATIONS = {1: _add_rng}
+
+def _changed_value(shared, value):
+    """Check if a session copy's attribute differs from the shared definition's."""
+    if value == shared:
+        return False
+    # Frozen containers never equal their thawed copies; compare them as the thawed type
+    if isinstance(value, (list, dict, set)):
+        return type(value)(shared) != value
+    return True
+
+def dump_world(world):
+    """Get the attributes a session changed on its world copies, by database and key."""
+    changes = {}
+    for kind, key, copy in world.changed():
+        shared = vars(world.base[kind][key])
+        attributes = {}
+        for name, value in vars(copy).items():
+            if name.startswith("_") or not _changed_value(shared.get(name), value):
+                continue
+            if name in ITEM_LIST_FIELDS:
+                value = [item.id for item in value]
+            elif isinstance(value, (list, dict)):
+                value = type(value)(value)  # So the save doesn't change along with the game
+            attributes[name] = value
+            
+        if attributes:
+            changes.setdefault(kind, {})[key] = attributes
+            
+    return changes
+
+def dump_player(player):
+    """Get the save list for a player."""
+    return [
+        player.name, player.background, [getattr(player, stat) for stat in SAVED_STATS],
+        player.level, player.experience, player.experience_to_level,
+        player.current_health, player.current_energy, getattr(player, "credits", 0)
+    ]
+
+def dump_state(game_state):
+    """Get the save dictionary for a game state.
+    
+    Its containers are copies, so it can be encoded on another thread while
+    the game carries on (see core.autosave).
+    """
+    world = game_state.world
+    player = game_state.player
+    
+    return {
+        "version": SAVE_VERSION,
+        "node": game_state.current_node,
+        "player": player and dump_player(player),
+        "inventory": [item.id for item in game_state.inventory],
+        "companions": [world.key_of("npcs", companion) for companion in game_state.companions],
+        "flags": dict(game_state.story_flags),
+        "relationships": dict(game_state.relationships),
+        "location": game_state.current_location.id if game_state.current_location else None,
+        "days": game_state.days_passed,
+        "tutorial": game_state.tutorial_complete,
+        "world": dump_world(world),
+        "rng": game_state.rng.state()
+    }
+
+def migrate(data):
+    """Upgrade a save dictionary to SAVE_VERSION."""
+    version = data.get("version")
+    if not isinstance(version, int) or version > SAVE_VERSION:
+        raise ValueError(f"Unsupported save version {version!r}; this game reads up to {SAVE_VERSION}")
+        
+    while version < SAVE_VERSION:
+        data = MIGRATIONS[version](data)
+        version = data["version"] = version + 1
+        
+    return data
+
+def restore_player(saved):
+    name, background, stats, level, experience, experience_to_level, health, energy, credits = saved
+    player = Player(name, background, **dict(zip(SAVED_STATS, stats)))
+    player.level = level
+    player.experience = experience
+    player.experience_to_level = experience_to_level
+    player.current_health = health
+    player.current_energy = energy
+    player.credits = credits
+    return player
+
+def restore_state(data, world=None):
+    """Rebuild a game state from a save dictionary, on a fresh WorldOverlay unless one is given."""
+    data = migrate(data)
+    game_state = GameState(world)
+    world = game_state.world
+    if data["rng"] is not None:
+        # Before the player is set, so it draws from the restored streams
+        game_state.rng = SessionRandom.restore(data["rng"])
+        
+    # World copies first, so companions and the location resolve to them
+    for kind, definitions in data["world"].items():
+        for key, attributes in definitions.items():
+            copy = world.edit(world.base[kind][key])
+            for name, value in attributes.items():
+                if name in ITEM_LIST_FIELDS:
+                    value = [world.get_item(item_id) for item_id in value]
+                setattr(copy, name, value)
+                
+    if data["player"] is not None:
+        game_state.player = restore_player(data["player"])
+    for item_id in data["inventory"]:
+        game_state.add_to_inventory(world.get_item(item_id))
+    for npc_key in data["companions"]:
+        game_state.add_companion(world.get_npc(npc_key))
+        
+    game_state.current_node = data["node"]
+    game_state.story_flags.update(data["flags"])
+    game_state.relationships.update(data["relationships"])
+    game_state.current_location = data["location"] and world.get_location(data["location"])
+    game_state.days_passed = data["days"]
+    game_state.tutorial_complete = data["tutorial"]
+    return game_state
+
+def encode_save(data):
+    """Serialize a save dictionary to save bytes."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def encode(game_state):
+    """Serialize a game state to save bytes."""
+    return encode_save(dump_state(game_state))
+
+def decode_save(data):
+    """Parse save bytes into a save dictionary."""
+    try:
+        saved = json.loads(data)
+    except ValueError as error:
+        raise ValueError(f"Not a save game: {error}") from None
+    if not isinstance(saved, dict):
+        raise ValueError("Not a save game")
+    return saved
+
+def decode(data, world=None):
+    """Rebuild a game state from save bytes."""
+    return restore_state(decode_save(data), world)
+
+def write_atomically(path, data, fsync=True):
+    """Replace a file's contents with data, so a crash leaves either the old file or the new one.
+    
+    The data goes to a temporary file beside it that os.replace() then
+    swaps in. With fsync=True both the data and the swap are on disk when
+    this returns; without it they're only handed to the OS.
+    """
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as temporary_file:
+        temporary_file.write(data)
+        if fsync:
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+    os.replace(temporary_path, path)
+    
+    if fsync and hasattr(os, "O_DIRECTORY"):
+        # The rename is only durable once the directory entry is
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+def save(path, game_state, fsync=True):
+    """Write a game state to a save file atomically and return its size in bytes."""
+    data = encode(game_state)
+    write_atomically(path, data, fsync)
+    return len(data)
+
+def load(path, world=None):
+    """Read a game state from a save file."""
+    with open(path, "rb") as save_file:
+        return decode(save_file.read(), world)
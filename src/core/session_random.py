@@ -0,0 +1,82 @@
+"""
+Session randomness - one seeded random stream per subsystem of a session.
+
+Every GameState owns a SessionRandom. stream(name) gives the random.Random
+that one subsystem draws from ("battle", "loot", "levels"), each
+seeded from the session seed and the subsystem's name. Sessions don't share
+a generator, so one session's battles can't change another's, and a
+subsystem that draws more or less than it used to leaves the other streams
+where they were.
+
+A stream counts the 32-bit words it has drawn, so state() is just the seed
+and one count per stream, paired with the spare normal deviate gauss() keeps
+after an odd number of calls, if there is one. restore() re-seeds each
+stream, draws that many words again and puts the spare back, which is how a
+save carries its randomness. A session is then fully determined by its seed and its inputs.
+"""
+import random
+
+class RandomStream(random.Random):
+    """A random.Random that counts the 32-bit words drawn from it."""
+    
+    def seed(self, *args, **kwargs):
+        super().seed(*args, **kwargs)
+        self.words = 0
+        
+    def getstate(self):
+        return super().getstate(), self.words
+        
+    def setstate(self, state):
+        state, self.words = state
+        super().setstate(state)
+        
+    def random(self):
+        self.words += 2
+        return super().random()
+        
+    def getrandbits(self, k):
+        self.words += (k + 31) // 32
+        return super().getrandbits(k)
+        
+    def skip(self, words):
+        """Draw and discard words, as if they had been used."""
+        for _ in range(words):
+            super().getrandbits(32)
+        self.words += words
+
+class SessionRandom:
+    """A session's seed and its per-subsystem random streams."""
+    
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(64)
+        self.streams = {}
+        
+    def stream(self, name):
+        """Get a subsystem's random stream, creating it on first use."""
+        stream = self.streams.get(name)
+        if stream is None:
+            # Seeding with a string gives the same stream in every process, unlike hashing a tuple
+            stream = self.streams[name] = RandomStream(f"{self.seed}:{name}")
+        return stream
+        
+    def state(self):
+        """Get the seed and each stream's position, as plain data for a save.
+        
+        A position is the stream's word count, or [word count, spare gauss()
+        value] when gauss() is holding one.
+        """
+        streams = {}
+        for name, stream in self.streams.items():
+            streams[name] = stream.words if stream.gauss_next is None else [stream.words, stream.gauss_next]
+        return {"seed": self.seed, "streams": streams}
+        
+    @classmethod
+    def restore(cls, state):
+        """Rebuild a SessionRandom from state() with every stream where it was."""
+        session_random = cls(state["seed"])
+        for name, position in state["streams"].items():
+            words, gauss_next = position if isinstance(position, list) else (position, None)
+            stream = session_random.stream(name)
+            stream.skip(words)
+            stream.gauss_next = gauss_next
+        return session_random
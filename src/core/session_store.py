@@ -0,0 +1,215 @@
+"""
+Session store - every session's save in one SQLite database.
+
+One row per session holds its latest save_game save, keyed by session ID
+and indexed by player name, so a host with thousands of players keeps one
+database file instead of a file per save. The database runs in WAL mode,
+where readers don't block the writer.
+
+All writes go through a single writer thread. put() snapshots a game state
+on the caller's thread and queues it, replacing any queued save for the
+same session. The writer takes everything queued, encodes it and writes it
+in one transaction, so a commit (and with synchronous="FULL", an fsync)
+covers a whole batch of checkpoints. Reads go through a connection per
+thread and also see saves still queued.
+
+load_all() reads every save in one pass, for warming up a server.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from core import save_game
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    player TEXT NOT NULL,
+    updated REAL NOT NULL,
+    save BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sessions_by_player ON sessions (player, updated);
+"""
+
+UPSERT = """
+INSERT INTO sessions (session_id, player, updated, save) VALUES (?, ?, ?, ?)
+ON CONFLICT (session_id) DO UPDATE SET player = excluded.player, updated = excluded.updated, save = excluded.save
+"""
+
+# Most saves one transaction writes; the rest wait for the next one
+MAX_BATCH = 5000
+RETRY_DELAY = 1.0  # Seconds before retrying a failed write
+
+class SessionStore:
+    """Saves game states to a SQLite database from a single group-committing writer thread."""
+    
+    def __init__(self, path, synchronous="NORMAL", max_batch=MAX_BATCH):
+        # NORMAL survives the process crashing; FULL also survives losing power
+        if synchronous not in ("OFF", "NORMAL", "FULL"):
+            raise ValueError(f"Unknown synchronous mode {synchronous!r}; use OFF, NORMAL or FULL")
+            
+        self.path = path
+        self.synchronous = synchronous
+        self.max_batch = max_batch
+        self.condition = threading.Condition()
+        self.pending = {}  # session ID -> (player, time, save dictionary) not yet being written
+        self.writing = {}  # The batch being written
+        self.stopping = False
+        self.requested = 0  # Saves queued by put()
+        self.written = 0  # Rows written; the rest were replaced while queued
+        self.commits = 0
+        self.error = None  # The last failed write's exception, until a write succeeds
+        self.local = threading.local()  # Each reading thread's connection
+        self.readers = []  # Every reading thread's connection, closed by stop()
+        
+        # The writer's connection creates the schema before any reader connects
+        self.connection = self._connect()
+        self.connection.executescript(SCHEMA)
+        self.thread = threading.Thread(target=self._write_loop, name="session-store", daemon=True)
+        
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"PRAGMA synchronous={self.synchronous}")
+        return connection
+        
+    def start(self):
+        self.thread.start()
+        return self
+        
+    def put(self, session_id, player, game_state):
+        """Snapshot a game state and queue it as a session's save; returns without waiting."""
+        snapshot = save_game.dump_state(game_state)
+        with self.condition:
+            self.pending[session_id] = (player, time.time(), snapshot)
+            self.requested += 1
+            self.condition.notify_all()
+            
+    def _write_loop(self):
+        connection = self.connection
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopping:
+                    self.condition.wait()
+                if not self.pending:
+                    connection.close()
+                    return
+                    
+                if len(self.pending) <= self.max_batch:
+                    self.writing, self.pending = self.pending, {}
+                else:
+                    batch_ids = list(self.pending)[:self.max_batch]
+                    self.writing = {session_id: self.pending.pop(session_id) for session_id in batch_ids}
+                batch = self.writing
+                
+            rows = []
+            try:
+                rows = [(session_id, player, updated, save_game.encode_save(snapshot))
+                        for session_id, (player, updated, snapshot) in batch.items()]
+                connection.execute("BEGIN")
+                connection.executemany(UPSERT, rows)
+                connection.execute("COMMIT")
+                self.error = None
+            except Exception as error:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                if isinstance(error, sqlite3.Error):
+                    logger.warning("Session store write of %d save(s) failed: %s", len(batch), error)
+                else:
+                    # A bug rather than the database; keep the writer alive so flush() and stop() return
+                    logger.exception("Session store write of %d save(s) failed", len(batch))
+                self.error = error
+                rows = []
+            finally:
+                with self.condition:
+                    if self.error is not None:
+                        if self.stopping:
+                            logger.error("Session store stopping; %d save(s) were not written and are lost",
+                                         len(batch))
+                        else:
+                            # Retry the batch, apart from sessions saved again since
+                            self.pending = {**batch, **self.pending}
+                    self.writing = {}
+                    self.written += len(rows)
+                    self.commits += bool(rows)
+                    self.condition.notify_all()
+                    if self.error is not None and not self.stopping:
+                        self.condition.wait(RETRY_DELAY)
+                    
+    def flush(self, timeout=None):
+        """Wait until every queued save is committed; return False on timeout."""
+        with self.condition:
+            return self.condition.wait_for(lambda: not self.pending and not self.writing, timeout)
+            
+    def stop(self):
+        """Commit whatever is queued, stop the writer thread and close every connection."""
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        if self.thread.is_alive():
+            self.thread.join()
+            
+        with self.condition:
+            readers, self.readers = self.readers, []
+        for connection in readers:
+            connection.close()
+            
+    def _reader(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = self._connect()
+            with self.condition:
+                self.readers.append(connection)
+        return connection
+        
+    def _queued(self, session_id):
+        with self.condition:
+            return self.pending.get(session_id) or self.writing.get(session_id)
+            
+    def get_save(self, session_id):
+        """Get a session's save dictionary, or None if it has none."""
+        queued = self._queued(session_id)
+        if queued is not None:
+            return queued[2]
+            
+        row = self._reader().execute("SELECT save FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        return save_game.decode_save(row[0]) if row else None
+        
+    def get(self, session_id, world=None):
+        """Rebuild a session's game state, or return None if it has none."""
+        saved = self.get_save(session_id)
+        return saved and save_game.restore_state(saved, world)
+        
+    def sessions_for(self, player):
+        """Get [(session ID, last saved time)] of a player's sessions, newest first."""
+        rows = self._reader().execute(
+            "SELECT session_id, updated FROM sessions WHERE player = ? ORDER BY updated DESC", (player,)
+        ).fetchall()
+        
+        # Saves still queued are newer than anything in the database
+        with self.condition:
+            queued = {session_id: updated for session_id, (queued_player, updated, _)
+                      in [*self.writing.items(), *self.pending.items()] if queued_player == player}
+        if queued:
+            rows = sorted({**dict(rows), **queued}.items(), key=lambda row: -row[1])
+        return rows
+        
+    def load_all(self):
+        """Rebuild every stored session's game state; return {session ID: GameState}.
+        
+        Each game state gets its own WorldOverlay. Saves still queued aren't
+        included, so flush() first if this process has been writing.
+        """
+        games = {}
+        cursor = self._reader().execute("SELECT session_id, save FROM sessions")
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                return games
+            for session_id, data in rows:
+                games[session_id] = save_game.decode(data)
+                
+    def count(self):
+        return self._reader().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
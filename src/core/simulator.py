@@ -0,0 +1,130 @@
+"""
+Monte Carlo playthrough simulator - runs complete games through GameEngine.
+
+Each playthrough starts a new game through start_new_game with a NullUI,
+so the background is picked by the same policy as every other choice, and
+runs the engine until the story ends. Playthroughs are split into batches
+across a process pool and the results are merged into distributions over
+endings, backgrounds, nodes visited, story flags and relationship values.
+
+Run from the src directory:
+    python -m core.simulator [--runs N] [--workers N] [--policy random|weighted|first]
+"""
+import argparse
+import json
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from core.game_state import GameState
+from core.headless import MAX_UPDATES, play_headless, story_outcome
+from ui.null_ui import NullUI, first_choice_policy, random_policy, weighted_policy
+
+def make_policy(policy_name, rng, weights=None):
+    """Build a choice policy by name."""
+    if policy_name == "first":
+        return first_choice_policy
+    if policy_name == "weighted":
+        return weighted_policy(weights or {}, rng)
+    return random_policy(rng)
+
+def run_playthrough(seed, policy_name="random", weights=None, max_updates=MAX_UPDATES):
+    """Play one complete game and return its outcome as a dictionary."""
+    rng = random.Random(seed)
+    visited = []
+    
+    def record_visit(event, node_id, choice):
+        if event == "enter_node":
+            visited.append(node_id)
+            
+    ui = NullUI(make_policy(policy_name, rng, weights), player_name="Simulated")
+    engine = play_headless(ui, GameState(seed=seed), max_updates, story_listeners=[record_visit])
+    game_state = engine.game_state
+    
+    return {
+        "ending": story_outcome(engine),
+        "background": game_state.player.background,
+        "visited": visited,
+        "flags": game_state.story_flags,
+        "relationships": game_state.relationships
+    }
+
+def run_batch(start_seed, count, policy_name="random", weights=None):
+    """Run a batch of playthroughs and aggregate their outcomes into Counters."""
+    results = {
+        "endings": Counter(),
+        "backgrounds": Counter(),
+        "nodes_visited": Counter(),  # node_id -> playthroughs that visited it
+        "path_lengths": Counter(),  # nodes visited per playthrough -> playthroughs
+        "flags": Counter(),  # "flag=value" at the end -> playthroughs
+        "relationships": Counter()  # "character=value" at the end -> playthroughs
+    }
+    
+    for seed in range(start_seed, start_seed + count):
+        outcome = run_playthrough(seed, policy_name, weights)
+        
+        results["endings"][outcome["ending"]] += 1
+        results["backgrounds"][outcome["background"]] += 1
+        results["nodes_visited"].update(set(outcome["visited"]))
+        results["path_lengths"][len(outcome["visited"])] += 1
+        results["flags"].update(f"{flag}={value}" for flag, value in outcome["flags"].items())
+        results["relationships"].update(f"{char_id}={value}" for char_id, value in outcome["relationships"].items())
+        
+    return results
+
+def simulate(runs, workers=None, policy_name="random", weights=None, seed=0, batch_size=5_000):
+    """Run playthroughs across a process pool and merge the distributions."""
+    workers = workers or os.cpu_count() or 1
+    batches = [(start, min(batch_size, runs - (start - seed))) for start in range(seed, seed + runs, batch_size)]
+    
+    if workers == 1:
+        batch_results = [run_batch(start, count, policy_name, weights) for start, count in batches]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            batch_results = list(pool.map(run_batch, *zip(*batches),
+                                          [policy_name] * len(batches), [weights] * len(batches)))
+                                          
+    totals = batch_results[0]
+    for results in batch_results[1:]:
+        for key, counter in results.items():
+            totals[key].update(counter)
+            
+    return totals
+
+def format_distribution(title, counter, runs, limit=None):
+    """Format a Counter as percentage lines, most common first."""
+    lines = [f"{title}:"]
+    for key, count in counter.most_common(limit):
+        lines.append(f"  {count / runs:7.2%}  {key}")
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Monte Carlo playthroughs of the story.")
+    parser.add_argument("--runs", type=int, default=100_000, help="number of playthroughs")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--policy", choices=["random", "weighted", "first"], default="random")
+    parser.add_argument("--weights", help="JSON file mapping choice text to weight (weighted policy)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first playthrough")
+    parser.add_argument("--top", type=int, default=20, help="entries shown per distribution")
+    args = parser.parse_args()
+    
+    weights = None
+    if args.weights:
+        with open(args.weights, encoding="utf-8") as weights_file:
+            weights = json.load(weights_file)
+            
+    totals = simulate(args.runs, args.workers, args.policy, weights, args.seed)
+    
+    lines = []
+    lines += format_distribution("Endings", totals["endings"], args.runs)
+    lines += format_distribution("Backgrounds", totals["backgrounds"], args.runs)
+    lines += format_distribution("Nodes visited", totals["nodes_visited"], args.runs, args.top)
+    lines += format_distribution("Path lengths (nodes)", totals["path_lengths"], args.runs, args.top)
+    lines += format_distribution("Flags set", totals["flags"], args.runs, args.top)
+    lines += format_distribution("Relationship values", totals["relationships"], args.runs, args.top)
+    
+    for line in lines:
+        print(line)
+
+if __name__ == "__main__":
+    main()
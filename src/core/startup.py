@@ -0,0 +1,185 @@
+"""
+Startup - load the game behind the title screen, and profile what starting costs.
+
+main.py imports only the text UI, draws the title screen and then starts a
+StartupLoader. The loader imports the engine, the story and the world
+databases and warms the story layouts on a background thread while the
+player reads the title; result() waits for whatever is left once they
+press Enter.
+
+python main.py --profile-startup launches the terminal and the server in
+fresh interpreters under -X importtime. It reports how long each took from
+launch to its title screen (or listening socket) and to a loaded game,
+with import time broken down by subsystem.
+"""
+import os
+import sys
+import threading
+import time
+
+# Set in processes launched by profile_startup, which report their stages on stderr
+PROBE_ENV = "SYNTHESIS_STARTUP_PROBE"
+PROBING = bool(os.environ.get(PROBE_ENV))
+STAGE_PREFIX = "startup stage: "
+
+# Cold-start budgets in seconds from process launch, for each launch and stage
+STARTUP_BUDGETS = {
+    "terminal": {"title": 0.05, "loaded": 0.15},
+    "server": {"listening": 0.25}
+}
+
+# Top-level packages of the game; other modules count toward whichever of these imported them
+SUBSYSTEMS = ("core", "story", "ui", "items", "characters", "locations", "battle")
+PROFILE_RUNS = 5
+
+def startup_stage(name):
+    """Report that startup reached a stage, when launched by profile_startup."""
+    if PROBING:
+        sys.stderr.write(f"{STAGE_PREFIX}{name}\n")
+        sys.stderr.flush()
+
+def load_game(width=80):
+    """Import the engine, story and world; return (GameState, GameEngine)."""
+    from core.game_state import GameState
+    from core.game_engine import GameEngine
+    from core.world import shared_world
+    from story.story_data import story_nodes
+    from ui.wrap_cache import warm_story_layouts
+    
+    shared_world()
+    story_nodes["intro"]
+    warm_story_layouts(story_nodes, width)
+    return GameState, GameEngine
+
+class StartupLoader:
+    """Runs load_game on a background thread."""
+    
+    def __init__(self, width=80):
+        self.width = width
+        self.thread = threading.Thread(target=self._load, name="startup-loader", daemon=True)
+        self.classes = None
+        self.error = None
+        
+    def start(self):
+        self.thread.start()
+        return self
+        
+    def _load(self):
+        try:
+            self.classes = load_game(self.width)
+        except BaseException as error:
+            self.error = error
+        startup_stage("loaded")
+        
+    def result(self):
+        """Wait for loading to finish; return (GameState, GameEngine)."""
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+        return self.classes
+
+def parse_importtime(lines):
+    """Build the import tree from -X importtime lines; return its roots.
+    
+    Each node is (name, self microseconds, children). A module's line comes
+    after the lines of everything it imported, one indentation level deeper.
+    """
+    stack = []  # (depth, node) of modules whose importer hasn't been seen yet
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+            
+        self_time, _, name = line.split(":", 1)[1].split("|")
+        name = name.rstrip("\n")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        children = []
+        while stack and stack[-1][0] > depth:
+            children.append(stack.pop()[1])
+        stack.append((depth, (name.strip(), int(self_time), children[::-1])))
+        
+    return [node for _, node in stack]
+
+def importtime_by_subsystem(roots, interpreter_modules=()):
+    """Sum self import time in seconds by subsystem, charging other modules to their importer.
+    
+    Top-level imports are the interpreter's own if they are in
+    interpreter_modules, and the entry point's otherwise.
+    """
+    totals = {}
+    pending = [(root, "interpreter" if root[0] in interpreter_modules else "entry point") for root in roots]
+    while pending:
+        (name, self_time, children), owner = pending.pop()
+        package = name.split(".")[0]
+        if package in SUBSYSTEMS:
+            owner = package
+        totals[owner] = totals.get(owner, 0) + self_time / 1e6
+        pending.extend((child, owner) for child in children)
+        
+    return totals
+
+def probe(command, cwd=None, importtime=False):
+    """Launch a command; return (seconds to each stage, -X importtime lines before each stage)."""
+    import subprocess
+    
+    options = ["-X", "importtime"] if importtime else []
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, *options, *command], stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=cwd,
+        env=dict(os.environ, **{PROBE_ENV: "1"})
+    )
+    
+    stages = {}
+    imports = {}  # stage -> importtime lines before it
+    lines = []
+    for line in process.stderr:
+        if line.startswith(STAGE_PREFIX):
+            stage = line[len(STAGE_PREFIX):].strip()
+            stages[stage] = time.perf_counter() - start
+            imports[stage] = lines
+            lines = []
+        else:
+            lines.append(line)
+    process.wait()
+    
+    if process.returncode:
+        raise RuntimeError(f"{' '.join(command)} exited with status {process.returncode}")
+    return stages, imports
+
+def profile_launch(label, command, cwd=None, interpreter_modules=(), runs=PROFILE_RUNS):
+    """Print the best time to each stage over several launches, and what each stage imported.
+    
+    Stage times come from plain launches; -X importtime slows imports down,
+    so the breakdown comes from one more launch under it.
+    """
+    best = {}
+    for _ in range(runs):
+        stages, _ = probe(command, cwd)
+        for stage, elapsed in stages.items():
+            best[stage] = min(elapsed, best.get(stage, elapsed))
+            
+    _, imports = probe(command, cwd, importtime=True)
+    
+    budgets = STARTUP_BUDGETS.get(label, {})
+    print(f"{label} launch ({' '.join(command)}), best of {runs}:")
+    for stage, elapsed in best.items():
+        budget = budgets.get(stage)
+        verdict = f"  budget {budget * 1000:.0f} ms {'ok' if elapsed <= budget else 'OVER'}" if budget else ""
+        print(f"  {stage:10} {elapsed * 1000:7.1f} ms{verdict}")
+        
+        totals = importtime_by_subsystem(parse_importtime(imports.get(stage, ())), interpreter_modules)
+        for subsystem, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+            print(f"      {subsystem:12} {seconds * 1000:6.1f} ms imports")
+
+def profile_startup(main_path):
+    """Profile cold starts of the terminal game and the game server."""
+    src_dir = os.path.dirname(os.path.abspath(main_path))
+    
+    # What the interpreter imports before running any code of ours
+    _, baseline = probe(["-c", f"import sys; sys.stderr.write({STAGE_PREFIX + 'started'!r} + '\\n')"],
+                        importtime=True)
+    interpreter_modules = {name for name, _, _ in parse_importtime(baseline["started"])}
+    
+    profile_launch("terminal", [os.path.basename(main_path)], src_dir, interpreter_modules)
+    print()
+    profile_launch("server", ["-m", "core.game_server", "--port", "0"], src_dir, interpreter_modules)
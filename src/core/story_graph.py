@@ -0,0 +1,106 @@
+from collections import deque
+
+# Story flag set by the on_enter actions of ending nodes
+ENDING_FLAG = "ending_reached"
+
+class StoryGraph:
+    """Index over the story nodes with forward and reverse edges.
+    
+    Built once in O(V+E); predecessor lookups, ending checks and the
+    validation results (dangling references, unreachable nodes) are then
+    plain dictionary or set lookups.
+    """
+    
+    def __init__(self, story_nodes, start_node="intro"):
+        self.story_nodes = story_nodes
+        self.start_node = start_node
+        self.edges = {}  # node_id -> list of next node IDs, in choice order
+        self.reverse_edges = {}  # node_id -> set of predecessor node IDs
+        self.endings = set()  # Nodes where a playthrough ends
+        self.dangling_references = []  # (node_id, choice_text, missing_node_id)
+        self.reachable = set()  # Nodes reachable from the start node
+        self.unreachable_nodes = []  # Defined nodes never reached from the start node
+        
+        self._build()
+        
+    def _build(self):
+        """Build the adjacency indexes and run validation."""
+        for node_id, node in self.story_nodes.items():
+            targets = []
+            for choice in node.choices:
+                targets.append(choice.next_node)
+                self.reverse_edges.setdefault(choice.next_node, set()).add(node_id)
+                
+                if choice.next_node not in self.story_nodes:
+                    self.dangling_references.append((node_id, choice.text, choice.next_node))
+                    
+            self.edges[node_id] = targets
+            
+            if self._is_ending(node, targets):
+                self.endings.add(node_id)
+                
+        self.reachable = self._find_reachable()
+        self.unreachable_nodes = [node_id for node_id in self.story_nodes if node_id not in self.reachable]
+        
+    def _is_ending(self, node, targets):
+        """Check if a node ends a playthrough."""
+        if not targets:
+            return True
+            
+        if node.on_enter.get("flags", {}).get(ENDING_FLAG):
+            return True
+            
+        # "Start a New Game" style choices only lead back to the start
+        return all(target == self.start_node for target in targets)
+        
+    def _find_reachable(self):
+        """Breadth-first search from the start node over defined nodes."""
+        if self.start_node not in self.story_nodes:
+            return set()
+            
+        reachable = {self.start_node}
+        queue = deque([self.start_node])
+        
+        while queue:
+            node_id = queue.popleft()
+            for target in self.edges[node_id]:
+                if target not in reachable and target in self.story_nodes:
+                    reachable.add(target)
+                    queue.append(target)
+                    
+        return reachable
+        
+    def successors(self, node_id):
+        """Get the IDs of the nodes a node's choices lead to."""
+        return self.edges.get(node_id, [])
+        
+    def predecessors(self, node_id):
+        """Get the IDs of the nodes with a choice leading to a node."""
+        return self.reverse_edges.get(node_id, set())
+        
+    def is_ending(self, node_id):
+        """Check if a node ends a playthrough."""
+        return node_id in self.endings
+        
+    def is_valid(self):
+        """Check if every choice leads to a defined node."""
+        return not self.dangling_references
+        
+    def get_report(self):
+        """Get a human-readable validation report as a list of lines."""
+        lines = [
+            f"Nodes: {len(self.story_nodes)}  Edges: {sum(len(targets) for targets in self.edges.values())}",
+            f"Endings: {len(self.endings)}  Reachable from '{self.start_node}': {len(self.reachable)}"
+        ]
+        
+        if self.dangling_references:
+            lines.append(f"Dangling references ({len(self.dangling_references)}):")
+            for node_id, choice_text, missing_node_id in self.dangling_references:
+                lines.append(f"  {node_id} -> {missing_node_id}  ({choice_text})")
+                
+        if self.unreachable_nodes:
+            lines.append(f"Unreachable nodes ({len(self.unreachable_nodes)}):")
+            for node_id in self.unreachable_nodes:
+                lines.append(f"  {node_id}")
+                
+        return lines
@@ -1,37 +1,81 @@
+import sys
+from types import MappingProxyType
+from .conditions import compile_conditions
+
+# Shared read-only containers for nodes and choices that don't set these fields;
+# they are replaced with real containers the first time something is added
+EMPTY_MAPPING = MappingProxyType({})
+EMPTY_CHOICES = ()
+
+def intern_keys(mapping):
+    """Intern the string keys of a (nested) conditions/actions dict."""
+    if not mapping:
+        return EMPTY_MAPPING
+        
+    return {
+        sys.intern(key) if isinstance(key, str) else key:
+            intern_keys(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    }
+
 class StoryNode:
     """Represents a single node in the story narrative."""
     
-    def __init__(self, node_id, text, choices=None, node_type="narrative", 
+    __slots__ = ("id", "text", "choices", "node_type", "on_enter", "on_exit", "data")
+    
+    def __init__(self, node_id, text, choices=None, node_type="narrative",
                  on_enter=None, on_exit=None, data=None):
-        self.id = node_id  # Unique identifier for this node
+        self.id = sys.intern(node_id)  # Unique identifier for this node
         self.text = text  # Narrative text for this node
-        self.choices = choices or []  # Available choices
-        self.node_type = node_type  # Type of node
-        self.on_enter = on_enter or {}  # Actions to perform when entering node
-        self.on_exit = on_exit or {}  # Actions to perform when exiting node
-        self.data = data or {}  # Type-specific data (battle, shop, dialogue)
+        self.choices = list(choices) if choices else EMPTY_CHOICES  # Available choices
+        self.node_type = sys.intern(node_type)  # Type of node
+        self.on_enter = intern_keys(on_enter)  # Actions to perform when entering node
+        self.on_exit = intern_keys(on_exit)  # Actions to perform when exiting node
+        self.data = data or EMPTY_MAPPING  # Type-specific data (battle, shop, dialogue)
         
     def add_choice(self, text, next_node, conditions=None, actions=None):
         """Add a choice to this story node."""
+        if self.choices is EMPTY_CHOICES:
+            self.choices = []
+            
         choice = Choice(text, next_node, conditions, actions)
         self.choices.append(choice)
         return self
         
     def add_enter_action(self, action_type, action_data):
         """Add an action to perform when entering this node."""
-        self.on_enter[action_type] = action_data
+        if self.on_enter is EMPTY_MAPPING:
+            self.on_enter = {}
+            
+        self.on_enter[sys.intern(action_type)] = action_data
         
     def add_exit_action(self, action_type, action_data):
         """Add an action to perform when exiting this node."""
-        self.on_exit[action_type] = action_data
+        if self.on_exit is EMPTY_MAPPING:
+            self.on_exit = {}
+            
+        self.on_exit[sys.intern(action_type)] = action_data
 
 
 class Choice:
     """Represents a choice option in a story node."""
     
+    __slots__ = ("text", "next_node", "conditions", "actions", "predicate")
+    
     def __init__(self, text, next_node, conditions=None, actions=None):
         self.text = text  # The text displayed for this choice
-        self.next_node = next_node  # ID of the next story node
-        self.conditions = conditions or {}  # Requirements to see this choice
-        self.actions = actions or {}  # Actions to perform when this choice is selected
-        
\ No newline at end of file
+        self.next_node = sys.intern(next_node)  # ID of the next story node
+        self.conditions = intern_keys(conditions)  # Requirements to see this choice
+        self.actions = intern_keys(actions)  # Actions to perform when this choice is selected
+        self.predicate = None  # Compiled form of conditions, built by compile()
+        
+    def compile(self):
+        """Compile this choice's conditions into a fast predicate."""
+        self.predicate = compile_conditions(self.conditions)
+        return self.predicate
+        
+    def is_available(self, game_state):
+        """Check if this choice's conditions are met using the compiled predicate."""
+        if self.predicate is None:
+            self.compile()
+        return self.predicate(game_state)
@@ -0,0 +1,78 @@
+_shared_world = None
+
+def shared_world():
+    """Get the frozen location, shop, character and item databases, importing them once."""
+    global _shared_world
+    if _shared_world is None:
+        from items.item_database import items
+        from characters.character_database import npcs
+        from locations.location_database import locations, shops
+        
+        _shared_world = {"locations": locations, "shops": shops, "npcs": npcs, "items": items}
+        
+    return _shared_world
+
+class WorldOverlay:
+    """One session's view of the shared world, copied on write.
+    
+    Lookups return the shared, frozen definition until the session changes
+    it: edit() then makes a writable copy that this overlay returns from
+    then on. A session holds only the definitions its player has changed,
+    and the shared databases never change, so any number of sessions in a
+    process can use them at once.
+    """
+    
+    def __init__(self, base=None):
+        self.base = base if base is not None else shared_world()
+        self.copies = {}  # id of a shared definition -> this session's copy
+        
+    def resolve(self, definition):
+        """Get this session's version of a definition."""
+        return self.copies.get(id(definition), definition)
+        
+    def edit(self, definition):
+        """Get a writable version of a definition, copying it on the session's first write."""
+        if definition is None or not definition.is_frozen():
+            return definition
+            
+        copy = self.copies.get(id(definition))
+        if copy is None:
+            copy = self.copies[id(definition)] = definition.thaw()
+        return copy
+        
+    def get(self, kind, key):
+        """Get a definition by database ("locations", "shops", "npcs" or "items") and key."""
+        definition = self.base[kind].get(key)
+        if definition is None:
+            return None
+        return self.copies.get(id(definition), definition)
+        
+    def key_of(self, kind, definition):
+        """Get the database key of a shared definition or of this session's copy of one."""
+        for key, shared in self.base[kind].items():
+            if shared is definition or self.copies.get(id(shared)) is definition:
+                return key
+        raise KeyError(f"{definition!r} is not in the {kind} database")
+
+    def get_location(self, location_id):
+        return self.get("locations", location_id)
+        
+    def get_shop(self, shop_id):
+        return self.get("shops", shop_id)
+        
+    def get_npc(self, npc_id):
+        return self.get("npcs", npc_id)
+        
+    def get_item(self, item_id):
+        return self.get("items", item_id)
+        
+    def changed(self):
+        """Get the (kind, key, copy) of every definition this session has changed."""
+        return [(kind, key, self.copies[id(definition)])
+                for kind, definitions in self.base.items()
+                for key, definition in definitions.items()
+                if id(definition) in self.copies]
+                
+    def reset(self):
+        """Drop every change, back to the shared world."""
+        self.copies.clear()
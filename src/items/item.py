@@ -1,4 +1,6 @@
-class Item:
+from core.frozen import Frozen
+
+class Item(Frozen):
     """Base class for all in-game items."""
     
     def __init__(self, item_id, name, description, value, item_type="misc", rarity="common"):
@@ -32,11 +34,12 @@ class Weapon(Item):
         self.critical_chance = critical_chance
         self.critical_multiplier = 2.0
         
-    def calculate_damage(self):
-        """Calculate the base damage of this weapon."""
+    def calculate_damage(self, rng=None):
+        """Calculate the base damage of this weapon, with rng or the random module."""
         import random
+        rng = rng or random
         
-        if random.random() < self.critical_chance:
+        if rng.random() < self.critical_chance:
             return int(self.damage * self.critical_multiplier), True
         return self.damage, False
         
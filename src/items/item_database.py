@@ -1,3 +1,4 @@
+from core.frozen import freeze_all
 from .item import Item, Weapon, Armor, Consumable, KeyItem, ImplantItem
 
 # Create a dictionary of all items in the game
@@ -220,6 +221,9 @@ items["omniscient_cortex"] = ImplantItem(
     rarity="legendary"
 )
 
+# Shared by every session in the process; sessions change copies through WorldOverlay
+freeze_all(items.values())
+
 def get_item(item_id):
     """Get an item by its ID."""
     return items.get(item_id)
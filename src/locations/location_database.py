@@ -1,7 +1,8 @@
-from shop import Shop
+from core.frozen import Frozen, freeze_all
+from .shop import Shop
 from items.item_database import get_item
 
-class Location:
+class Location(Frozen):
     """Represents a location in the game world."""
     
     def __init__(self, location_id, name, description, available_exits=None, 
@@ -18,11 +19,12 @@ class Location:
         
     def enter(self, game_state):
         """Process entry into this location."""
-        game_state.current_location = self
+        location = game_state.world.resolve(self)
+        game_state.current_location = location
         
-        if not self.visited:
-            # First-time visit
-            self.visited = True
+        if not location.visited:
+            # First-time visit, recorded on the session's copy
+            game_state.world.edit(location).visited = True
             return self.get_first_visit_text()
         else:
             # Returning to location
@@ -206,10 +208,21 @@ locations["vex_shop"] = Location(
 
 # --- More locations can be added as the game expands ---
 
+# Every shop, by ID
+shops = {location.shop.id: location.shop for location in locations.values() if location.shop}
+
+# Shared by every session in the process; sessions change copies through WorldOverlay
+freeze_all(shops.values())
+freeze_all(locations.values())
+
 def get_location(location_id):
     """Get a location by its ID."""
     return locations.get(location_id)
     
 def get_all_locations():
     """Get all locations."""
-    return locations.values() 
+    return locations.values()
+    
+def get_shop(shop_id):
+    """Get a shop by its ID."""
+    return shops.get(shop_id)
@@ -1,6 +1,7 @@
+from core.frozen import Frozen
 from items.item_database import get_item, get_items_by_type, get_items_by_rarity
 
-class Shop:
+class Shop(Frozen):
     """Represents a shop where players can buy and sell items."""
     
     def __init__(self, shop_id, name, description, inventory=None, discount_rate=0, markup_rate=0.2):
@@ -48,13 +49,14 @@ class Shop:
         if player.credits < price:
             return False, "Not enough credits."
             
-        # Remove item from shop
-        if not self.remove_item(item):
+        # Remove item from the session's copy of the shop
+        if not game_state.world.edit(self).remove_item(item):
             return False, "Item not available."
             
         # Add to player inventory and deduct credits
         game_state.add_to_inventory(item)
         player.credits -= price
+        game_state.notify_outcome("buy", self.id, item.id)
         
         return True, f"Purchased {item.name} for {price} credits."
         
@@ -70,8 +72,9 @@ class Shop:
         game_state.remove_from_inventory(item)
         
         # Add to shop and give credits
-        self.add_item(item)
+        game_state.world.edit(self).add_item(item)
         player.credits += price
+        game_state.notify_outcome("sell", self.id, item.id)
         
         return True, f"Sold {item.name} for {price} credits."
         
@@ -88,8 +91,10 @@ class ShopManager:
         self.shops[shop.id] = shop
         
     def get_shop(self, shop_id):
-        """Get a shop by ID."""
-        return self.shops.get(shop_id)
+        """Get the session's version of a shop by ID, from the world if it isn't registered."""
+        world = self.game_state.world
+        shop = self.shops.get(shop_id)
+        return world.resolve(shop) if shop is not None else world.get_shop(shop_id)
         
     def open_shop_interface(self, shop_id):
         """Open the shop interface for a specific shop."""
@@ -102,6 +107,8 @@ class ShopManager:
         player = self.game_state.player
         
         while self.game_state.shop_open:
+            # Buying and selling may have replaced the shop with the session's copy
+            shop = self.get_shop(shop_id)
             self.ui.clear_screen()
             self.ui.display_message(f"Welcome to {shop.name}!")
             self.ui.display_message(shop.description)
@@ -1,33 +1,50 @@
 #!/usr/bin/env python3
 
-import os
 import sys
-import time
-from core.game_state import GameState
-from core.game_engine import GameEngine
 from ui.text_ui import TextUI
+from ui.screen import CLEAR_SCREEN
+from core.startup import PROBING, StartupLoader, startup_stage
 
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
 
 def main():
     """Main entry point for the Synthesis RPG game."""
+    # Checked by hand: argparse alone would take longer to import than the title screen
+    if "--profile-startup" in sys.argv[1:]:
+        from core.startup import profile_startup
+        profile_startup(__file__)
+        return
+        
     clear_screen()
     
+    # Only the UI has been imported so far, so the title shows straight away
     ui = TextUI()
-    game_state = GameState()
-    game_engine = GameEngine(game_state, ui)
-    
     ui.display_title_screen("SYNTHESIS", "Where Humanity Meets Artificial Consciousness")
+    ui.flush()
+    startup_stage("title")
+    
+    # Import the engine, story and world and wrap the story texts while the
+    # player reads the title screen
+    loader = StartupLoader(ui.width).start()
+    ui.watch_terminal_size()
+    
     ui.display_message("Press Enter to start your journey...")
+    if PROBING:
+        loader.result()
+        return
     input()
     
+    GameState, GameEngine = loader.result()
+    game_state = GameState()
+    game_engine = GameEngine(game_state, ui)
+    
     # Start the game
     game_engine.start_new_game()
     
-    # Main game loop
-    while game_state.is_running:
-        game_engine.update()
+    # Main game loop: blocks on player input and timers until the story ends
+    game_engine.run()
     
     ui.display_message("Thank you for playing SYNTHESIS.")
     
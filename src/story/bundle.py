@@ -0,0 +1,157 @@
+"""
+Story bundle - a compact, versioned binary form of the merged story graph.
+
+Layout (little-endian):
+    header   magic "SYNB", format version (u16), flags (u16),
+             node count (u32), CRC-32 of the fragment sources' names,
+             sizes and modification times (u32)
+    index    per node: id length (u16), record offset (u32),
+             record length (u32), then the UTF-8 node ID
+    records  one compact JSON array per node:
+             [text, node_type, on_enter, on_exit, data,
+              [[choice text, next_node, conditions, actions], ...]]
+
+The bundle is memory-mapped and only the index is read when it is opened;
+each node record is decoded the first time the node is requested, so no
+fragment Python code runs at startup. Checking that a bundle is current
+only stats the fragment sources, so an edited (or freshly checked out)
+fragment makes it stale. Build it with:
+    python -m story.utils.build_bundle
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Mapping
+from core.conditions import compile_story_nodes
+from core.story_node import StoryNode
+
+BUNDLE_MAGIC = b"SYNB"
+BUNDLE_VERSION = 2
+
+HEADER = struct.Struct("<4sHHII")
+INDEX_ENTRY = struct.Struct("<HII")
+
+FRAGMENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "neural_fragments")
+DEFAULT_BUNDLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "story.bundle")
+
+def fragment_source_hash(fragment_names, fragments_dir=FRAGMENTS_DIR):
+    """Checksum the names, sizes and modification times of the fragment sources a bundle was built from."""
+    checksum = 0
+    for fragment_name in fragment_names:
+        stat = os.stat(os.path.join(fragments_dir, f"{fragment_name}.py"))
+        checksum = zlib.crc32(f"{fragment_name}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"), checksum)
+        
+    return checksum
+
+def encode_node(node):
+    """Encode a story node as a compact JSON record."""
+    choices = [[choice.text, choice.next_node, choice.conditions, choice.actions] for choice in node.choices]
+    record = [node.text, node.node_type, node.on_enter, node.on_exit, node.data, choices]
+    
+    # Shared empty containers are read-only mappings; encode them as plain dicts
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=dict).encode("utf-8")
+
+def decode_node(node_id, record):
+    """Rebuild a story node from its JSON record."""
+    text, node_type, on_enter, on_exit, data, choices = json.loads(record)
+    node = StoryNode(node_id, text, node_type=node_type, on_enter=on_enter, on_exit=on_exit, data=data)
+    
+    for choice_text, next_node, conditions, actions in choices:
+        node.add_choice(choice_text, next_node, conditions, actions)
+        
+    return node
+
+def write_bundle(path, story_nodes, source_hash=0):
+    """Serialize story nodes into a bundle file atomically and return its size in bytes."""
+    node_ids = list(story_nodes)
+    records = [encode_node(story_nodes[node_id]) for node_id in node_ids]
+    encoded_ids = [node_id.encode("utf-8") for node_id in node_ids]
+    
+    index_size = sum(INDEX_ENTRY.size + len(encoded_id) for encoded_id in encoded_ids)
+    offset = HEADER.size + index_size
+    
+    parts = [HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, 0, len(node_ids), source_hash)]
+    for encoded_id, record in zip(encoded_ids, records):
+        parts.append(INDEX_ENTRY.pack(len(encoded_id), offset, len(record)))
+        parts.append(encoded_id)
+        offset += len(record)
+    parts.extend(records)
+    
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as bundle_file:
+        for part in parts:
+            bundle_file.write(part)
+    os.replace(temp_path, path)
+    
+    return offset
+
+class StoryBundle(Mapping):
+    """Read-only node ID -> StoryNode mapping over a memory-mapped bundle."""
+    
+    def __init__(self, buffer, source_hash, index):
+        self.buffer = buffer
+        self.source_hash = source_hash
+        self.index = index  # node_id -> (offset, length)
+        self.nodes = {}
+        
+    @classmethod
+    def open(cls, path):
+        """Memory-map a bundle file and read its index."""
+        with open(path, "rb") as bundle_file:
+            buffer = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"{path} is not a story bundle")
+            
+        magic, version, _, node_count, source_hash = HEADER.unpack_from(buffer, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"{path} is not a story bundle")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"{path} has bundle version {version}, expected {BUNDLE_VERSION}")
+            
+        index = {}
+        position = HEADER.size
+        try:
+            for _ in range(node_count):
+                id_length, offset, length = INDEX_ENTRY.unpack_from(buffer, position)
+                position += INDEX_ENTRY.size
+                node_id = buffer[position:position + id_length].decode("utf-8")
+                position += id_length
+                index[node_id] = (offset, length)
+        except struct.error:
+            # The index runs past the end of the file
+            raise ValueError(f"{path} is a truncated story bundle") from None
+            
+        return cls(buffer, source_hash, index)
+        
+    def load_all(self):
+        """Decode every node in the bundle."""
+        for node_id in self.index:
+            self[node_id]
+            
+    def close(self):
+        """Release the memory map; decoded nodes stay available."""
+        self.buffer.close()
+        
+    def __getitem__(self, node_id):
+        node = self.nodes.get(node_id)
+        if node is None:
+            offset, length = self.index[node_id]
+            node = decode_node(node_id, self.buffer[offset:offset + length])
+            
+            # Compile choice conditions once, as the node is decoded
+            compile_story_nodes({node_id: node})
+            self.nodes[node_id] = node
+            
+        return node
+        
+    def __contains__(self, node_id):
+        return node_id in self.index
+        
+    def __iter__(self):
+        return iter(self.index)
+        
+    def __len__(self):
+        return len(self.index)
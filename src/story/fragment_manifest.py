@@ -0,0 +1,209 @@
+"""
+Fragment manifest - node ID to neural fragment index used for lazy loading.
+Generated by story.utils.build_manifest; do not edit by hand.
+"""
+
+FRAGMENT_ORDER = [
+    "genesis_fragment",
+    "synthetix_fragment",
+    "nautilus_fragment",
+    "phoenix_fragment",
+    "prometheus_fragment",
+    "emergence_fragment"
+]
+
+FRAGMENT_MANIFEST = {
+    "intro": "genesis_fragment",
+    "urgent_message": "genesis_fragment",
+    "check_news": "genesis_fragment",
+    "phoenix_contact": "genesis_fragment",
+    "synthetix_lab": "synthetix_fragment",
+    "prometheus_explanation": "synthetix_fragment",
+    "confront_mori": "synthetix_fragment",
+    "investigate_lab": "synthetix_fragment",
+    "accept_mission": "synthetix_fragment",
+    "question_ethics": "synthetix_fragment",
+    "reveal_phoenix_message": "synthetix_fragment",
+    "lie_to_mori": "synthetix_fragment",
+    "accuse_mori": "synthetix_fragment",
+    "military_question": "synthetix_fragment",
+    "deflect_suspicion": "synthetix_fragment",
+    "nautilus_district": "nautilus_fragment",
+    "tech_scan": "nautilus_fragment",
+    "vex_shop_direct": "nautilus_fragment",
+    "ask_for_vex": "nautilus_fragment",
+    "mention_phoenix": "nautilus_fragment",
+    "vex_trust": "nautilus_fragment",
+    "phoenix_location": "phoenix_fragment",
+    "fragment_locations": "phoenix_fragment",
+    "university_mission": "phoenix_fragment",
+    "bypass_university_security": "phoenix_fragment",
+    "quantum_terminal": "phoenix_fragment",
+    "bank_mission": "phoenix_fragment",
+    "military_mission": "phoenix_fragment",
+    "fragment_merge": "phoenix_fragment",
+    "partial_restoration": "phoenix_fragment",
+    "marcus_plan": "phoenix_fragment",
+    "synthetix_infiltration": "prometheus_fragment",
+    "complete_upload": "prometheus_fragment",
+    "mori_revelation": "prometheus_fragment",
+    "vex_opinion": "prometheus_fragment",
+    "warn_vex": "prometheus_fragment",
+    "trust_mori": "prometheus_fragment",
+    "prometheus_confrontation": "prometheus_fragment",
+    "final_battle": "prometheus_fragment",
+    "phoenix_sacrifice": "prometheus_fragment",
+    "kent_appeal": "prometheus_fragment",
+    "vex_sacrifice": "prometheus_fragment",
+    "phoenix_revelation": "emergence_fragment",
+    "transcendence_ending": "emergence_fragment",
+    "separation_ending": "emergence_fragment",
+    "remembrance_ending": "emergence_fragment",
+    "accept_sacrifice": "emergence_fragment",
+    "player_sacrifice": "emergence_fragment",
+    "heroic_sacrifice": "emergence_fragment",
+    "sacrifice_epilogue": "emergence_fragment",
+    "consciousness_backup": "emergence_fragment",
+    "digital_transcendence": "emergence_fragment",
+    "control_ending": "emergence_fragment",
+    "resistance_ending": "emergence_fragment"
+}
+
+# next_node targets of each fragment's choices, checked against FRAGMENT_MANIFEST at startup
+FRAGMENT_TARGETS = {
+    "genesis_fragment": [
+        "check_news",
+        "nautilus_district",
+        "phoenix_contact",
+        "synthetix_lab",
+        "urgent_message"
+    ],
+    "synthetix_fragment": [
+        "accept_mission",
+        "accuse_mori",
+        "agree_focus_phoenix",
+        "agree_help_mori",
+        "alternative_approach",
+        "attempt_reconciliation",
+        "confront_mori",
+        "deflect_suspicion",
+        "excuse_to_leave",
+        "exit_synthetix",
+        "false_agreement",
+        "feign_acceptance",
+        "hesitate_alliance",
+        "investigate_lab",
+        "kent_concerns",
+        "leave_lab",
+        "lie_to_mori",
+        "military_question",
+        "mori_reassurance",
+        "phoenix_behavior_theory",
+        "phoenix_capabilities",
+        "press_military_issue",
+        "prometheus_explanation",
+        "question_ethics",
+        "quick_hack",
+        "reluctant_agreement",
+        "reveal_phoenix_message",
+        "search_plan",
+        "suggest_nautilus",
+        "university_approach"
+    ],
+    "nautilus_fragment": [
+        "ask_for_vex",
+        "bribe_vendor",
+        "examine_data",
+        "hide_identity",
+        "mention_phoenix",
+        "mention_phoenix_direct",
+        "nautilus_alley",
+        "nautilus_confrontation",
+        "phoenix_location",
+        "phoenix_signal",
+        "tech_scan",
+        "technical_compliment",
+        "vex_background",
+        "vex_hostile",
+        "vex_shop_direct",
+        "vex_skeptical",
+        "vex_trust"
+    ],
+    "phoenix_fragment": [
+        "accept_resistance",
+        "alternative_approach",
+        "alternative_entrance",
+        "alternative_integration",
+        "bypass_university_security",
+        "cautious_alliance",
+        "cruz_diversion",
+        "demand_proof",
+        "examine_fragments",
+        "follow_phoenix_trace",
+        "fragment_commitment",
+        "fragment_substitution",
+        "fragmentation_explanation",
+        "maintenance_route",
+        "marcus_infiltration",
+        "marcus_plan",
+        "military_contacts",
+        "partial_is_better",
+        "partial_restoration",
+        "phoenix_verification",
+        "quantum_terminal",
+        "remote_hack",
+        "researcher_conversation",
+        "synthetix_disguise",
+        "synthetix_infiltration",
+        "technical_infiltration",
+        "transfer_instructions",
+        "university_mission",
+        "use_forged_credentials"
+    ],
+    "prometheus_fragment": [
+        "accept_sacrifice",
+        "attempt_rescue",
+        "cautious_mori",
+        "complete_upload",
+        "convince_resistance",
+        "cruz_confrontation",
+        "defend_integration",
+        "examine_fragments",
+        "final_battle",
+        "forced_implementation",
+        "guide_evolution",
+        "guide_integration",
+        "hybrid_approach",
+        "kent_appeal",
+        "kent_ideals",
+        "modified_integration",
+        "mori_evidence",
+        "mori_revelation",
+        "phoenix_integration",
+        "phoenix_revelation",
+        "phoenix_sacrifice",
+        "player_sacrifice",
+        "premature_extraction",
+        "prepare_defenses",
+        "prometheus_destabilization",
+        "resistance_conflict",
+        "safe_distance",
+        "surprise_attack",
+        "trust_mori",
+        "vex_opinion",
+        "warn_vex"
+    ],
+    "emergence_fragment": [
+        "consciousness_backup",
+        "digital_transcendence",
+        "grief_withdrawal",
+        "heroic_sacrifice",
+        "identity_crisis",
+        "intro",
+        "phoenix_revelation",
+        "remembrance_ending",
+        "sacrifice_epilogue",
+        "separation_ending",
+        "transcendence_ending"
+    ]
+}
@@ -1,24 +1,139 @@
 """
-Main story data file that imports and combines all neural fragments.
+Main story data file that combines all neural fragments.
+
+Fragments are imported lazily: the manifest maps each node ID to its
+fragment, and a fragment module is only imported the first time one of its
+nodes is requested. A new game therefore only pays for genesis_fragment.
+
+Set SYNTHESIS_STORY_BUNDLE to the path of a story bundle (see story.bundle)
+to decode nodes from it instead, if it was built from the current fragment
+sources. It isn't the default: a new game only decodes a node or two either
+way, so the bundle starts no faster (see benchmarks.cold_start).
 """
-from .neural_fragments.genesis_fragment import genesis_nodes
-from .neural_fragments.synthetix_fragment import synthetix_nodes
-from .neural_fragments.nautilus_fragment import nautilus_nodes
-from .neural_fragments.phoenix_fragment import phoenix_nodes
-from .neural_fragments.prometheus_fragment import prometheus_nodes
-from .neural_fragments.emergence_fragment import emergence_nodes
+import importlib
+import logging
+import os
+from collections.abc import Mapping
+from core.conditions import compile_story_nodes
+from .fragment_manifest import FRAGMENT_ORDER, FRAGMENT_MANIFEST, FRAGMENT_TARGETS
+
+logger = logging.getLogger(__name__)
+
+class LazyStoryNodes(Mapping):
+    """Read-only node ID -> StoryNode mapping that imports fragments on demand."""
+    
+    def __init__(self, manifest, fragment_order, targets=None, fragments_package="story.neural_fragments"):
+        self.manifest = manifest
+        self.fragment_order = fragment_order
+        self.targets = targets or {}  # Fragment name -> next_node targets of its choices
+        self.fragments_package = fragments_package
+        self.loaded_fragments = set()
+        self.nodes = {}
+        
+    def load_fragment(self, fragment_name):
+        """Import a neural fragment and merge its nodes."""
+        if fragment_name in self.loaded_fragments:
+            return
+            
+        module = importlib.import_module(f"{self.fragments_package}.{fragment_name}")
+        
+        # genesis_fragment.py defines genesis_nodes, and so on
+        nodes = getattr(module, f"{fragment_name.split('_')[0]}_nodes", {})
+        
+        # Compile choice conditions once, as the fragment is merged
+        compile_story_nodes(nodes)
+        
+        for node_id, node in nodes.items():
+            # The manifest decides which fragment owns a duplicated node ID
+            if self.manifest.get(node_id, fragment_name) == fragment_name:
+                self.nodes[node_id] = node
+                
+        self.loaded_fragments.add(fragment_name)
+        self._check_references(fragment_name, nodes)
+        
+    def load_all(self):
+        """Import every neural fragment."""
+        for fragment_name in self.fragment_order:
+            self.load_fragment(fragment_name)
+            
+    def find_dangling_references(self):
+        """List (fragment name, missing node ID) for choice targets no fragment defines.
+        
+        Uses the targets recorded in the manifest, so no fragment is imported.
+        """
+        return [
+            (fragment_name, target)
+            for fragment_name in self.fragment_order
+            for target in self.targets.get(fragment_name, ())
+            if target not in self.manifest
+        ]
+        
+    def _check_references(self, fragment_name, nodes):
+        """Note choices in a newly loaded fragment that lead nowhere.
+        
+        This runs during play, so it logs at debug level; GameEngine reports
+        dangling references at warning level from the manifest at startup.
+        """
+        dangling = [
+            choice.next_node
+            for node in nodes.values()
+            for choice in node.choices
+            if choice.next_node not in self.manifest
+        ]
+        
+        if dangling:
+            logger.debug(
+                "%s has %d dangling reference(s); run "
+                "'python -m story.utils.validate_fragments' for details.",
+                fragment_name, len(dangling)
+            )
+            
+    def __getitem__(self, node_id):
+        node = self.nodes.get(node_id)
+        if node is None:
+            fragment_name = self.manifest.get(node_id)
+            if fragment_name is None:
+                raise KeyError(node_id)
+                
+            self.load_fragment(fragment_name)
+            node = self.nodes.get(node_id)
+            if node is None:
+                # A stale manifest entry; the fragment doesn't define the node
+                raise KeyError(node_id)
+                
+        return node
+        
+    def __iter__(self):
+        self.load_all()
+        return iter(self.nodes)
+        
+    def __len__(self):
+        self.load_all()
+        return len(self.nodes)
 
-# Create a dictionary of all story nodes
-story_nodes = {}
+def load_story_nodes():
+    """Open the story bundle if one is set and current, else fall back to lazy fragments."""
+    bundle_path = os.environ.get("SYNTHESIS_STORY_BUNDLE")
+    
+    if bundle_path:
+        from .bundle import StoryBundle, fragment_source_hash
+        
+        try:
+            bundle = StoryBundle.open(bundle_path)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring story bundle %s: %s", bundle_path, e)
+        else:
+            if bundle.source_hash == fragment_source_hash(FRAGMENT_ORDER):
+                return bundle
+                
+            logger.warning("Story bundle %s is out of date; loading fragments instead.", bundle_path)
+            bundle.close()
+            
+    return LazyStoryNodes(FRAGMENT_MANIFEST, FRAGMENT_ORDER, FRAGMENT_TARGETS)
 
-# Merge all neural fragment dictionaries
-story_nodes.update(genesis_nodes)
-story_nodes.update(synthetix_nodes)
-story_nodes.update(nautilus_nodes)
-story_nodes.update(phoenix_nodes)
-story_nodes.update(prometheus_nodes)
-story_nodes.update(emergence_nodes)
+# Mapping of all story nodes, decoded or imported as they are requested
+story_nodes = load_story_nodes()
 
 def get_story_node(node_id):
     """Get a story node by ID."""
-    return story_nodes.get(node_id)
\ No newline at end of file
+    return story_nodes.get(node_id)
@@ -0,0 +1,27 @@
+"""
+Story Bundle Builder - Precompiles the merged story graph into story.bundle.
+
+Imports every neural fragment once, merges them in the same order as the
+game and writes the versioned binary bundle the engine memory-maps at
+startup. Re-run after editing any fragment:
+    python -m story.utils.build_bundle [output_path]
+"""
+import sys
+from story.bundle import DEFAULT_BUNDLE_PATH, fragment_source_hash, write_bundle
+from story.fragment_manifest import FRAGMENT_MANIFEST, FRAGMENT_ORDER
+from story.story_data import LazyStoryNodes
+
+def build_bundle(path=DEFAULT_BUNDLE_PATH):
+    """Build the story bundle from the neural fragments and return its size in bytes."""
+    story_nodes = LazyStoryNodes(FRAGMENT_MANIFEST, FRAGMENT_ORDER)
+    story_nodes.load_all()
+    
+    return write_bundle(path, story_nodes, fragment_source_hash(FRAGMENT_ORDER))
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_BUNDLE_PATH
+    size = build_bundle(path)
+    print(f"Wrote {size} bytes to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Fragment Manifest Builder - Regenerates story/fragment_manifest.py.
+
+The manifest maps every node ID to the neural fragment that defines it, so
+story_data can import a fragment only when one of its nodes is requested.
+It also lists the next_node targets of each fragment's choices, so the game
+can check for dangling references at startup without importing fragments.
+Re-run after adding, removing or moving story nodes or choices:
+    python -m story.utils.build_manifest
+"""
+import os
+from story.utils.fragment_loader import FragmentLoader
+
+# Fragments in the order story_data merges them; later fragments win on duplicate IDs
+FRAGMENT_ORDER = [
+    "genesis_fragment",
+    "synthetix_fragment",
+    "nautilus_fragment",
+    "phoenix_fragment",
+    "prometheus_fragment",
+    "emergence_fragment"
+]
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fragment_manifest.py")
+
+def build_manifest(loader=None):
+    """Build (fragment names, node ID -> fragment name, fragment name -> choice targets) from the fragments."""
+    loader = loader or FragmentLoader()
+    loader.discover_fragments()
+    
+    # Discovered fragments missing from FRAGMENT_ORDER are merged last
+    fragment_names = [name for name in FRAGMENT_ORDER if name in loader.fragments]
+    fragment_names.extend(sorted(name for name in loader.fragments if name not in FRAGMENT_ORDER))
+    
+    manifest = {}
+    for fragment_name in fragment_names:
+        for node_id in loader.load_fragment(fragment_name):
+            manifest[node_id] = fragment_name
+            
+    # Targets of the nodes each fragment owns; a node it lost to a later fragment isn't in the story
+    targets = {}
+    for fragment_name in fragment_names:
+        fragment_targets = {
+            choice.next_node
+            for node_id, node in loader.load_fragment(fragment_name).items()
+            if manifest[node_id] == fragment_name
+            for choice in node.choices
+        }
+        targets[fragment_name] = sorted(fragment_targets)
+        
+    return fragment_names, manifest, targets
+
+def render_manifest(fragment_names, manifest, targets):
+    """Render the manifest as the source of story/fragment_manifest.py."""
+    lines = [
+        '"""',
+        "Fragment manifest - node ID to neural fragment index used for lazy loading.",
+        "Generated by story.utils.build_manifest; do not edit by hand.",
+        '"""',
+        "",
+        "FRAGMENT_ORDER = ["
+    ]
+    lines.append(",\n".join(f'    "{name}"' for name in fragment_names))
+    lines.append("]")
+    lines.append("")
+    lines.append("FRAGMENT_MANIFEST = {")
+    lines.append(",\n".join(f'    "{node_id}": "{fragment_name}"' for node_id, fragment_name in manifest.items()))
+    lines.append("}")
+    lines.append("")
+    lines.append("# next_node targets of each fragment's choices, checked against FRAGMENT_MANIFEST at startup")
+    lines.append("FRAGMENT_TARGETS = {")
+    entries = []
+    for fragment_name, fragment_targets in targets.items():
+        entry_lines = ",\n".join(f'        "{target}"' for target in fragment_targets)
+        entries.append(f'    "{fragment_name}": [\n{entry_lines}\n    ]')
+    lines.append(",\n".join(entries))
+    lines.append("}")
+    
+    return "\n".join(lines) + "\n"
+
+def main():
+    fragment_names, manifest, targets = build_manifest()
+    
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as manifest_file:
+        manifest_file.write(render_manifest(fragment_names, manifest, targets))
+        
+    print(f"Wrote {len(manifest)} nodes from {len(fragment_names)} fragments to {MANIFEST_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@ Neural Fragment Loader - Utility functions for managing story neural fragments.
 """
 import importlib
 import os
-import inspect
 from core.story_node import StoryNode
 
 class FragmentLoader:
@@ -14,17 +13,19 @@ class FragmentLoader:
         self.fragments_package = fragments_package
         self.fragments = {}
         self.story_nodes = {}
+        self.node_index = {}  # node_id -> fragment name, built by load_all_fragments
+        self.indexed = False
         
     def discover_fragments(self):
         """Automatically discover all neural fragment modules in the package."""
         package = importlib.import_module(self.fragments_package)
-        package_dir = os.path.dirname(inspect.getfile(package))
         
-        # Find all Python files in the package
-        for filename in os.listdir(package_dir):
-            if filename.endswith("_fragment.py") and not filename.startswith("__"):
-                fragment_name = filename[:-3]  # Remove .py extension
-                self.fragments[fragment_name] = f"{self.fragments_package}.{fragment_name}"
+        # Find all Python files in the package (namespace packages have no __file__)
+        for package_dir in package.__path__:
+            for filename in sorted(os.listdir(package_dir)):
+                if filename.endswith("_fragment.py") and not filename.startswith("__"):
+                    fragment_name = filename[:-3]  # Remove .py extension
+                    self.fragments[fragment_name] = f"{self.fragments_package}.{fragment_name}"
                 
         return self.fragments
         
@@ -44,27 +45,32 @@ class FragmentLoader:
         return {}
         
     def load_all_fragments(self):
-        """Load all discovered neural fragments and merge their nodes."""
+        """Load all discovered neural fragments, merge their nodes and index them."""
         self.discover_fragments()
         
         for fragment_name in self.fragments:
             nodes = self.load_fragment(fragment_name)
             self.story_nodes.update(nodes)
             
+            for node_id in nodes:
+                self.node_index[node_id] = fragment_name
+                
+        self.indexed = True
         return self.story_nodes
         
     def get_node_by_id(self, node_id):
         """Get a story node by its ID."""
+        if not self.indexed:
+            self.load_all_fragments()
+            
         return self.story_nodes.get(node_id)
         
     def get_fragment_for_node(self, node_id):
         """Find which neural fragment contains a specific node."""
-        for fragment_name in self.fragments:
-            nodes = self.load_fragment(fragment_name)
-            if node_id in nodes:
-                return fragment_name
-                
-        return None
+        if not self.indexed:
+            self.load_all_fragments()
+            
+        return self.node_index.get(node_id)
         
     def add_node_to_fragment(self, fragment_name, node_id, node):
         """Add a new story node to a specific neural fragment."""
@@ -87,8 +93,9 @@ class FragmentLoader:
             # Add the node
             nodes[node_id] = node
             
-            # Update our local copy
+            # Update our local copy and the node index
             self.story_nodes[node_id] = node
+            self.node_index[node_id] = fragment_name
             
             return True
             
@@ -0,0 +1,293 @@
+"""
+Story Explorer - Headless breadth-first search over story states.
+
+Walks the story graph from the start node over (node, abstracted game state)
+pairs for every character background, applying Choice.actions and filtering
+choices with the same compiled predicates the engine uses. Every reachable
+ending is reported with the shortest path to it and the states that reach it.
+
+The game state is abstracted to what choices can change: story flags and
+relationship values. Relationship values are clamped just past the
+thresholds conditions read (see relationship_bounds), so loops that keep
+raising or lowering a relationship don't create new states. Stats come
+from the background and no choice grants items, so both are fixed per
+playthrough; explore() raises ValueError if a choice has any action other
+than flags and relationships.
+
+Run from the src directory:
+    python -m story.utils.story_explorer [--workers N] [--max-depth D] [--show-states]
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from core.game_engine import BACKGROUNDS, create_player
+from core.story_graph import StoryGraph
+
+# Terminal outcomes, matching how GameEngine stops a playthrough
+ENDING = "ending"  # An ending node from StoryGraph.endings
+DEAD_END = "dead_end"  # A node where no choice's conditions are met
+MISSING_NODE = "missing_node"  # A choice leading to an undefined node
+
+class ExplorerState:
+    """Minimal stand-in for GameState exposing what choice predicates read."""
+    
+    __slots__ = ("player", "story_flags", "relationships")
+    
+    def __init__(self, player, story_flags, relationships):
+        self.player = player
+        self.story_flags = story_flags
+        self.relationships = relationships
+        
+    def has_item(self, item_id):
+        """Choices never grant items, so item conditions are never met."""
+        return False
+        
+    def get_relationship(self, character_id):
+        return self.relationships.get(character_id, 0)
+
+# Choice actions the explorer applies; anything else (such as granting items) it can't model
+EXPLORED_ACTIONS = ("flags", "relationships")
+
+def check_actions(story_nodes):
+    """Raise ValueError if any choice has an action the explorer doesn't apply."""
+    for node_id, node in story_nodes.items():
+        for choice in node.choices:
+            unknown = set(choice.actions) - set(EXPLORED_ACTIONS)
+            if unknown:
+                raise ValueError(
+                    f"Choice {choice.text!r} at {node_id!r} has actions the explorer can't follow: "
+                    f"{', '.join(sorted(unknown))}"
+                )
+
+def relationship_bounds(story_nodes):
+    """Find the relationships conditions read; map each to the (low, high) range to clamp it to.
+    
+    Values past the highest threshold by more than the largest increase, or
+    under the lowest by more than the largest decrease, are clamped, so
+    loops that keep raising or lowering a relationship don't create new
+    states. low is None for characters no choice lowers: a value under the
+    lowest threshold is never raised to it.
+    """
+    thresholds = {}
+    increases = {}
+    decreases = {}
+    for node in story_nodes.values():
+        for choice in node.choices:
+            for char_id, min_value in choice.conditions.get("relationship", {}).items():
+                thresholds.setdefault(char_id, []).append(min_value)
+            for char_id, value in choice.actions.get("relationships", {}).items():
+                if value > 0:
+                    increases[char_id] = max(increases.get(char_id, 0), value)
+                elif value < 0:
+                    decreases[char_id] = max(decreases.get(char_id, 0), -value)
+                    
+    bounds = {}
+    for char_id, values in thresholds.items():
+        if char_id in decreases:
+            bounds[char_id] = (min(values) - decreases[char_id], max(values) + increases.get(char_id, 0))
+        else:
+            # Once at the highest threshold, a value that never falls stays past every threshold
+            bounds[char_id] = (None, max(values))
+    return bounds
+
+# Per-process exploration context, set by _init_worker
+_context = {}
+
+def _init_worker(endings, bounds):
+    """Load the story and set up the context a worker process expands states against."""
+    from story.story_data import story_nodes
+    
+    _context["story_nodes"] = dict(story_nodes)
+    _context["endings"] = endings
+    _context["bounds"] = bounds
+    _context["players"] = [create_player("Explorer", background) for background in BACKGROUNDS]
+
+def _expand_state(state):
+    """Expand one state into (state, terminal outcome or None, [(choice text, child state)])."""
+    node_id, background_index, flags, relationships = state
+    story_nodes = _context["story_nodes"]
+    
+    if node_id not in story_nodes:
+        return state, MISSING_NODE, []
+    if node_id in _context["endings"]:
+        return state, ENDING, []
+        
+    flags = dict(flags)
+    relationships = dict(relationships)
+    explorer_state = ExplorerState(_context["players"][background_index], flags, relationships)
+    
+    children = []
+    for choice in story_nodes[node_id].choices:
+        if not choice.is_available(explorer_state):
+            continue
+            
+        child_flags = flags
+        child_relationships = relationships
+        
+        # Apply choice consequences the way GameEngine.apply_choice does
+        if "flags" in choice.actions:
+            child_flags = dict(flags)
+            child_flags.update(choice.actions["flags"])
+            
+        if "relationships" in choice.actions:
+            child_relationships = dict(relationships)
+            for char_id, value in choice.actions["relationships"].items():
+                if char_id not in _context["bounds"]:
+                    # No condition reads this relationship, so it can't change the outcome
+                    continue
+                    
+                low, high = _context["bounds"][char_id]
+                new_value = min(high, child_relationships.get(char_id, 0) + value)
+                child_relationships[char_id] = new_value if low is None else max(low, new_value)
+                
+        child = (
+            choice.next_node,
+            background_index,
+            tuple(sorted(child_flags.items())),
+            tuple(sorted(child_relationships.items()))
+        )
+        children.append((choice.text, child))
+        
+    if not children:
+        return state, DEAD_END, []
+        
+    return state, None, children
+
+def _expand_chunk(states):
+    """Expand a shard of the frontier in a worker process."""
+    return [_expand_state(state) for state in states]
+
+def _shard(frontier, shard_count):
+    """Split the frontier into roughly equal shards."""
+    shard_size = max(1, -(-len(frontier) // shard_count))
+    return [frontier[i:i + shard_size] for i in range(0, len(frontier), shard_size)]
+
+def explore(start_node="intro", workers=None, max_depth=500, max_states=1_000_000,
+            parallel_threshold=256):
+    """Explore every reachable state of the story and return a report dictionary.
+    
+    Frontiers smaller than parallel_threshold are expanded in-process; larger
+    ones are sharded across a pool of worker processes, each of which loads
+    the story itself.
+    """
+    from story.story_data import story_nodes
+    
+    check_actions(story_nodes)
+    graph = StoryGraph(story_nodes, start_node)
+    bounds = relationship_bounds(story_nodes)
+    workers = workers or os.cpu_count() or 1
+    
+    _init_worker(graph.endings, bounds)
+    
+    frontier = [(start_node, index, (), ()) for index in range(len(BACKGROUNDS))]
+    parents = {state: None for state in frontier}  # state -> (parent state, choice text)
+    terminals = {}  # state -> outcome
+    depth = 0
+    pool = None
+    
+    try:
+        while frontier and depth <= max_depth and len(parents) < max_states:
+            if workers > 1 and len(frontier) >= parallel_threshold:
+                if pool is None:
+                    pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                               initargs=(graph.endings, bounds))
+                                               
+                results = [result for shard in pool.map(_expand_chunk, _shard(frontier, workers * 4)) for result in shard]
+            else:
+                results = _expand_chunk(frontier)
+                
+            next_frontier = []
+            for state, outcome, children in results:
+                if outcome is not None:
+                    terminals[state] = outcome
+                    
+                for choice_text, child in children:
+                    if child not in parents:
+                        parents[child] = (state, choice_text)
+                        next_frontier.append(child)
+                        
+            frontier = next_frontier
+            depth += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            
+    return _build_report(parents, terminals, frontier, depth)
+
+def _path_to(parents, state):
+    """Rebuild the shortest choice path to a state as [(node_id, choice text), ...]."""
+    path = []
+    while parents[state] is not None:
+        parent, choice_text = parents[state]
+        path.append((parent[0], choice_text))
+        state = parent
+        
+    path.reverse()
+    return path
+
+def _build_report(parents, terminals, frontier, depth):
+    """Group terminal states by ending node."""
+    endings = {}
+    for state, outcome in terminals.items():
+        ending = endings.setdefault(state[0], {"outcome": outcome, "states": [], "shortest_path": None})
+        ending["states"].append(state)
+        
+        # Each state's BFS path is shortest; keep the shortest over all states at this node
+        path = _path_to(parents, state)
+        if ending["shortest_path"] is None or len(path) < len(ending["shortest_path"]):
+            ending["shortest_path"] = path
+            ending["background"] = BACKGROUNDS[state[1]]["id"]
+            
+    return {
+        "endings": endings,
+        "states_visited": len(parents),
+        "depth": depth,
+        "truncated": bool(frontier)
+    }
+
+def format_report(report, show_states=False):
+    """Format an exploration report as a list of lines."""
+    lines = [
+        f"States visited: {report['states_visited']}  Depth: {report['depth']}"
+        + ("  (TRUNCATED by bounds)" if report["truncated"] else "")
+    ]
+    
+    for outcome in (ENDING, DEAD_END, MISSING_NODE):
+        endings = {node_id: ending for node_id, ending in report["endings"].items() if ending["outcome"] == outcome}
+        if not endings:
+            continue
+            
+        lines.append("")
+        lines.append(f"{outcome.replace('_', ' ').upper()}S ({len(endings)}):")
+        
+        for node_id, ending in sorted(endings.items(), key=lambda item: len(item[1]["shortest_path"])):
+            backgrounds = sorted({BACKGROUNDS[state[1]]["id"] for state in ending["states"]})
+            lines.append(
+                f"  {node_id}: {len(ending['states'])} state(s), shortest path {len(ending['shortest_path'])} "
+                f"choice(s) as {ending['background']}; reachable as {', '.join(backgrounds)}"
+            )
+            for from_node, choice_text in ending["shortest_path"]:
+                lines.append(f"    {from_node}: {choice_text}")
+                
+            if show_states:
+                for _, background_index, flags, relationships in ending["states"]:
+                    set_flags = ", ".join(f"{flag}={value}" for flag, value in flags)
+                    lines.append(f"    [{BACKGROUNDS[background_index]['id']}] flags: {set_flags or '-'}"
+                                 f"  relationships: {dict(relationships) or '-'}")
+                                 
+    return lines
+
+def main():
+    parser = argparse.ArgumentParser(description="Explore every reachable story ending.")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-depth", type=int, default=500, help="maximum number of choices per path")
+    parser.add_argument("--max-states", type=int, default=1_000_000, help="stop after visiting this many states")
+    parser.add_argument("--show-states", action="store_true", help="list every state that reaches each ending")
+    args = parser.parse_args()
+    
+    report = explore(workers=args.workers, max_depth=args.max_depth, max_states=args.max_states)
+    for line in format_report(report, args.show_states):
+        print(line)
+
+if __name__ == "__main__":
+    main()
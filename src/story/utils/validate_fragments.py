@@ -0,0 +1,71 @@
+"""
+Neural Fragment Validator - Checks the story graph for broken authoring.
+
+Loads every neural fragment, merges them the same way the game does and
+reports dangling next_node references, unreachable nodes, node IDs
+defined by more than one fragment and a stale fragment manifest.
+
+Run from the src directory:
+    python -m story.utils.validate_fragments
+"""
+import sys
+from core.story_graph import StoryGraph
+from story.fragment_manifest import FRAGMENT_MANIFEST, FRAGMENT_TARGETS
+from story.utils.build_manifest import build_manifest
+from story.utils.fragment_loader import FragmentLoader
+
+def validate_fragments(loader=None, start_node="intro"):
+    """Validate all neural fragments and return (graph, report lines, valid)."""
+    loader = loader or FragmentLoader()
+    loader.discover_fragments()
+    
+    story_nodes = {}
+    node_fragments = {}
+    duplicates = []
+    
+    for fragment_name in sorted(loader.fragments):
+        for node_id, node in loader.load_fragment(fragment_name).items():
+            if node_id in node_fragments:
+                duplicates.append((node_id, node_fragments[node_id], fragment_name))
+            node_fragments[node_id] = fragment_name
+            story_nodes[node_id] = node
+            
+    graph = StoryGraph(story_nodes, start_node)
+    
+    lines = [f"Fragments: {len(loader.fragments)}"]
+    lines.extend(graph.get_report())
+    
+    if duplicates:
+        lines.append(f"Duplicate node IDs ({len(duplicates)}):")
+        for node_id, first_fragment, second_fragment in duplicates:
+            lines.append(f"  {node_id}: {first_fragment}, {second_fragment}")
+            
+    # Summarize dangling references by the fragment that contains them
+    dangling_by_fragment = {}
+    for node_id, _, _ in graph.dangling_references:
+        fragment_name = node_fragments[node_id]
+        dangling_by_fragment[fragment_name] = dangling_by_fragment.get(fragment_name, 0) + 1
+        
+    for fragment_name, count in sorted(dangling_by_fragment.items()):
+        lines.append(f"{fragment_name}: {count} dangling reference(s)")
+        
+    # The lazy loader relies on the generated manifest matching the fragments
+    _, manifest, targets = build_manifest(loader)
+    manifest_current = manifest == FRAGMENT_MANIFEST and targets == FRAGMENT_TARGETS
+    if not manifest_current:
+        lines.append("Fragment manifest is out of date; run 'python -m story.utils.build_manifest'")
+        
+    valid = graph.is_valid() and not duplicates and manifest_current
+    lines.append("OK" if valid else "FAILED")
+    
+    return graph, lines, valid
+
+def main():
+    _, lines, valid = validate_fragments()
+    for line in lines:
+        print(line)
+        
+    return 0 if valid else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
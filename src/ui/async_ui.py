@@ -0,0 +1,313 @@
+"""
+Asyncio text UI - the TextUI method surface as coroutines over streams.
+
+Typing effects and pauses are awaitable timers instead of time.sleep calls,
+so one event loop can drive many sessions at once without a thread per
+player. Any line the player enters while text is being shown skips the
+remaining delays and typing until the next prompt; a bare Enter only skips,
+anything else is also kept as the answer to the next prompt.
+"""
+import asyncio
+import sys
+from ui.screen import Screen
+from ui.typewriter import CHARS_PER_SECOND, TYPING_TICK
+from ui.wrap_cache import layout_cache
+
+async def open_console_streams():
+    """Wrap stdin and stdout in a StreamReader/StreamWriter pair."""
+    loop = asyncio.get_running_loop()
+    
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    
+    return reader, writer
+
+class AsyncTextUI:
+    """Handles text-based user interface elements over asyncio streams."""
+    
+    def __init__(self, reader, writer, width=80, chars_per_second=CHARS_PER_SECOND, drain_timeout=None):
+        self.reader = reader
+        self.writer = writer
+        self.width = width
+        self.chars_per_second = chars_per_second
+        self.drain_timeout = drain_timeout  # Seconds a client may leave output unread
+        self.screen = Screen((width, 24))  # Remote terminals can't be asked; assume 24 rows
+        
+        self.lines = asyncio.Queue()  # Entered lines waiting for a prompt; None at EOF
+        self.skip = asyncio.Event()  # Set when the player skips the text being shown
+        self.awaiting_input = False
+        self.reader_task = None
+        
+    def start(self):
+        """Start reading player input in the background."""
+        if self.reader_task is None:
+            self.reader_task = asyncio.get_running_loop().create_task(self._read_lines())
+            
+    def close(self):
+        """Stop reading player input."""
+        if self.reader_task is not None:
+            self.reader_task.cancel()
+            self.reader_task = None
+            
+    async def _read_lines(self):
+        """Route entered lines to the next prompt, skipping delays on the way."""
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                self.skip.set()
+                self.lines.put_nowait(None)
+                return
+                
+            text = line.decode("utf-8", errors="replace").strip()
+            if not self.awaiting_input:
+                self.skip.set()
+                if not text:
+                    # A bare Enter only skips
+                    continue
+                    
+            self.lines.put_nowait(text)
+            
+    async def readline(self):
+        """Wait for the next line the player enters; raise EOFError at end of input."""
+        self.start()
+        self.skip.clear()
+        self.awaiting_input = True
+        try:
+            line = await self.lines.get()
+        finally:
+            self.awaiting_input = False
+            
+        self.screen.track("\n")  # The player's echoed line
+        
+        if line is None:
+            # Leave the marker for any later prompt
+            self.lines.put_nowait(None)
+            raise EOFError("Input closed")
+            
+        return line
+        
+    async def delay(self, seconds):
+        """Wait for up to seconds; return True if the player skipped."""
+        if self.skip.is_set():
+            return True
+        if seconds <= 0:
+            return False
+            
+        self.start()
+        try:
+            await asyncio.wait_for(self.skip.wait(), seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+            
+    async def write(self, text):
+        """Write text and wait for the stream to drain."""
+        self.screen.track(text)
+        self.writer.write(text.encode("utf-8"))
+        await self.drain()
+        
+    async def drain(self):
+        """Wait for buffered output to be sent; a client that stops reading times out."""
+        if self.drain_timeout is None:
+            await self.writer.drain()
+            return
+            
+        try:
+            await asyncio.wait_for(self.writer.drain(), self.drain_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError("Client stopped reading output")
+            
+    async def draw_frame(self, key, lines):
+        """Show a repeatedly drawn screen, rewriting only the rows that changed."""
+        self.writer.write(self.screen.frame(key, lines).encode("utf-8"))
+        await self.drain()
+        
+    async def print(self, *lines):
+        """Write each line followed by a newline."""
+        await self.write("".join(f"{line}\n" for line in lines))
+        
+    async def type_text(self, text):
+        """Write text with a typing effect, in chunks, until the player skips."""
+        if self.chars_per_second <= 0 or self.skip.is_set():
+            await self.write(text)
+            return
+            
+        chunk_size = max(1, int(self.chars_per_second * TYPING_TICK))
+        for start in range(0, len(text), chunk_size):
+            chunk = text[start:start + chunk_size]
+            await self.write(chunk)
+            
+            if await self.delay(len(chunk) / self.chars_per_second):
+                await self.write(text[start + chunk_size:])
+                return
+                
+    async def clear_screen(self):
+        """Clear the terminal screen."""
+        await self.write(self.screen.clear())
+        
+    async def display_title_screen(self, title, subtitle=None):
+        """Display a fancy title screen for the game."""
+        await self.clear_screen()
+        
+        # Create a border
+        border = "=" * self.width
+        
+        lines = ["\n\n", border, ""]
+        
+        # Center the title
+        padding = " " * ((self.width - len(title)) // 2)
+        lines.append(f"{padding}{title}")
+        
+        if subtitle:
+            # Center the subtitle
+            sub_padding = " " * ((self.width - len(subtitle)) // 2)
+            lines.append(f"{sub_padding}{subtitle}")
+            
+        lines += ["", border, "\n"]
+        await self.print(*lines)
+        
+    async def display_message(self, message, delay=0.5):
+        """Display a message with an optional delay."""
+        await self.print(*layout_cache.wrap(message, self.width))
+        await self.delay(delay)
+        
+    async def pause(self, seconds):
+        """Pause to let the player read."""
+        await self.delay(seconds)
+        
+    async def display_narrative(self, text, typing_effect=True):
+        """Display narrative text with an optional typing effect."""
+        wrapped_lines = layout_cache.wrap(text, self.width)
+        
+        if typing_effect:
+            for line in wrapped_lines:
+                await self.type_text(f"{line}\n")
+                await self.delay(0.3)
+        else:
+            await self.print(*wrapped_lines)
+            
+        await self.print("")  # Add an extra line
+        await self.delay(0.5)  # Pause after narrative
+        
+    async def get_input(self, prompt):
+        """Get text input from the user."""
+        await self.write(f"{prompt}\n> ")
+        return await self.readline()
+        
+    async def get_choice(self, prompt, options):
+        """Present a list of choices and get the user's selection."""
+        await self.print(f"\n{prompt}", *(f"[{i+1}] {option}" for i, option in enumerate(options)))
+        
+        while True:
+            await self.write("\nEnter your choice (number): ")
+            choice = await self.readline()
+            
+            try:
+                choice_index = int(choice) - 1
+            except ValueError:
+                await self.print("Please enter a number.")
+                continue
+                
+            if 0 <= choice_index < len(options):
+                return choice_index
+            else:
+                await self.print("Invalid choice. Please try again.")
+                
+    async def wait_for_enter(self, prompt="Press Enter to continue..."):
+        """Wait until the player presses Enter."""
+        if prompt:
+            await self.write(f"{prompt}\n")
+        await self.readline()
+        
+    async def display_character_stats(self, character):
+        """Display a character's stats."""
+        await self.clear_screen()
+        await self.print(
+            f"=== {character.name} ===",
+            f"Background: {character.background}",
+            f"Health: {character.current_health}/{character.max_health}",
+            "",
+            "--- STATS ---",
+            f"TECH: {character.tech}  |  LOGIC: {character.logic}",
+            f"COMBAT: {character.combat}  |  ENDURANCE: {character.endurance}",
+            f"CHARM: {character.charm}  |  INSIGHT: {character.insight}",
+            f"MEDICINE: {character.medicine}  |  KNOWLEDGE: {character.knowledge}",
+            ""
+        )
+        await self.wait_for_enter()
+        
+    async def display_inventory(self, inventory):
+        """Display the player's inventory."""
+        await self.clear_screen()
+        lines = ["=== INVENTORY ==="]
+        
+        if not inventory:
+            lines.append("Your inventory is empty.")
+        else:
+            for i, item in enumerate(inventory):
+                lines.append(f"[{i+1}] {item.name} - {item.description}")
+                
+        lines.append("")
+        await self.print(*lines)
+        await self.wait_for_enter()
+        
+    async def display_battle_status(self, player_party, enemy_party):
+        """Display the current status of a battle."""
+        lines = ["=== BATTLE ===", "YOUR PARTY:"]
+        
+        for character in player_party:
+            health_percentage = character.current_health / character.max_health
+            health_bar = "█" * int(20 * health_percentage)
+            lines.append(f"{character.name}: {health_bar} {character.current_health}/{character.max_health}")
+            
+        lines += ["", "ENEMIES:"]
+        for enemy in enemy_party:
+            health_percentage = enemy.current_health / enemy.max_health
+            health_bar = "█" * int(20 * health_percentage)
+            lines.append(f"{enemy.name}: {health_bar} {enemy.current_health}/{enemy.max_health}")
+            
+        lines.append("")
+        await self.draw_frame("battle", lines)
+        
+    async def display_shop_menu(self, shop_name, items):
+        """Display a shop interface with items for sale."""
+        lines = [f"=== {shop_name} ==="]
+        
+        for i, item in enumerate(items):
+            lines.append(f"[{i+1}] {item.name} - {item.price} credits - {item.description}")
+            
+        lines += ["[0] Exit shop", ""]
+        await self.draw_frame("shop", lines)
+        
+    async def display_dialogue(self, speaker, text, portrait=None):
+        """Display a dialogue with a character."""
+        await self.write(f"\n{speaker}: ")
+        await self.type_text(f"{text}\n")
+        
+    async def display_quest_log(self, quests):
+        """Display the player's quest log."""
+        await self.clear_screen()
+        lines = ["=== QUEST LOG ==="]
+        
+        active_quests = [q for q in quests if q.status == "active"]
+        completed_quests = [q for q in quests if q.status == "completed"]
+        
+        if active_quests:
+            lines.append("\nACTIVE QUESTS:")
+            for quest in active_quests:
+                lines.append(f"- {quest.name}: {quest.description}")
+                
+        if completed_quests:
+            lines.append("\nCOMPLETED QUESTS:")
+            for quest in completed_quests:
+                lines.append(f"- {quest.name}")
+                
+        if not quests:
+            lines.append("No active quests.")
+            
+        lines.append("")
+        await self.print(*lines)
+        await self.wait_for_enter()
@@ -0,0 +1,167 @@
+import random
+
+def first_choice_policy(prompt, options):
+    """Always pick the first option."""
+    return 0
+
+def random_policy(rng=None):
+    """Build a policy that picks uniformly at random."""
+    rng = rng or random.Random()
+    
+    def policy(prompt, options):
+        return rng.randrange(len(options))
+    return policy
+
+def weighted_policy(weights, rng=None, default_weight=1.0):
+    """Build a policy that picks options at random, weighted by option text."""
+    rng = rng or random.Random()
+    
+    def policy(prompt, options):
+        option_weights = [weights.get(option, default_weight) for option in options]
+        if not any(option_weights):
+            return rng.randrange(len(options))
+        return rng.choices(range(len(options)), option_weights)[0]
+    return policy
+
+def load_script(path):
+    """Read a script file: one answer per line, lines starting with # are skipped."""
+    with open(path, encoding="utf-8") as script_file:
+        return [line.rstrip("\n") for line in script_file if not line.startswith("#")]
+
+class NullUI:
+    """Headless UI with the TextUI interface that never prints, sleeps or reads input.
+    
+    Answers come from script first: a sequence of lines as the player would
+    type them, where a choice is its number or its exact option text. Once
+    the script runs out, choices come from a policy callback taking
+    (prompt, options) and returning an option index, and text input returns
+    player_name. A script without a policy raises EOFError when it runs out,
+    like input() at the end of a piped script.
+    
+    With record=True every call is appended to transcript as a dictionary
+    with an "event" key and the call's data.
+    """
+    
+    def __init__(self, policy=None, player_name="Survivor", width=80, script=None, record=False):
+        self.width = width
+        self.script = list(script or [])
+        self.script_position = 0
+        # A script stands alone unless a policy is given to continue from it
+        self.policy = policy or (None if script is not None else first_choice_policy)
+        self.player_name = player_name
+        self.record = record
+        self.transcript = []
+        
+    def _log(self, event, **data):
+        if self.record:
+            data["event"] = event
+            self.transcript.append(data)
+            
+    def _next_line(self):
+        """Take the next script line, or None once the script is used up."""
+        if self.script_position >= len(self.script):
+            return None
+            
+        line = str(self.script[self.script_position]).strip()
+        self.script_position += 1
+        return line
+        
+    def script_remaining(self):
+        """Get the script lines not yet used."""
+        return self.script[self.script_position:]
+        
+    def clear_screen(self):
+        self._log("clear")
+        
+    def display_title_screen(self, title, subtitle=None):
+        self._log("title", title=title, subtitle=subtitle)
+        
+    def display_message(self, message, delay=0.5):
+        self._log("message", text=message)
+        
+    def pause(self, seconds):
+        self._log("pause", seconds=seconds)
+        
+    def display_narrative(self, text, typing_effect=True):
+        self._log("narrative", text=text)
+        
+    def get_input(self, prompt):
+        value = self._next_line()
+        if value is None:
+            if self.policy is None:
+                raise EOFError(f"Script ended before input: {prompt}")
+            value = self.player_name
+            
+        self._log("input", prompt=prompt, value=value)
+        return value
+        
+    def get_choice(self, prompt, options):
+        line = self._next_line()
+        if line is None:
+            if self.policy is None:
+                raise EOFError(f"Script ended before choice: {prompt}")
+            choice_index = self.policy(prompt, options)
+        elif line in options:
+            choice_index = options.index(line)
+        else:
+            try:
+                choice_index = int(line) - 1
+            except ValueError:
+                choice_index = -1
+                
+            if not 0 <= choice_index < len(options):
+                raise ValueError(f"Script line {self.script_position} ({line!r}) is not an option for {prompt!r}: {options}")
+                
+        self._log("choice", prompt=prompt, options=list(options), selected=choice_index)
+        return choice_index
+        
+    def display_character_stats(self, character):
+        self._log("character_stats", name=character.name)
+        
+    def display_inventory(self, inventory):
+        self._log("inventory", items=[item.name for item in inventory])
+        
+    def display_battle_status(self, player_party, enemy_party):
+        self._log(
+            "battle_status",
+            party=[(character.name, character.current_health) for character in player_party],
+            enemies=[(enemy.name, enemy.current_health) for enemy in enemy_party]
+        )
+        
+    def display_shop_menu(self, shop_name, items):
+        self._log("shop_menu", shop=shop_name, items=[item.name for item in items])
+        
+    def display_dialogue(self, speaker, text, portrait=None):
+        self._log("dialogue", speaker=speaker, text=text)
+        
+    def display_quest_log(self, quests):
+        self._log("quest_log", quests=[(quest.name, quest.status) for quest in quests])
+        
+    def get_events(self, event):
+        """Get the recorded transcript entries of one event type."""
+        return [entry for entry in self.transcript if entry["event"] == event]
+        
+    def get_transcript_lines(self):
+        """Format the recorded transcript as readable lines."""
+        lines = []
+        for entry in self.transcript:
+            event = entry["event"]
+            if event in ("message", "narrative"):
+                lines.append(entry["text"])
+            elif event == "title":
+                lines.append(f"== {entry['title']} ==")
+            elif event == "input":
+                lines.append(f"{entry['prompt']} > {entry['value']}")
+            elif event == "choice":
+                lines.append(f"{entry['prompt']} > [{entry['selected'] + 1}] {entry['options'][entry['selected']]}")
+            elif event == "dialogue":
+                lines.append(f"{entry['speaker']}: {entry['text']}")
+            elif event == "battle_status":
+                combatants = entry["party"] + entry["enemies"]
+                lines.append("[battle] " + ", ".join(f"{name} {health} HP" for name, health in combatants))
+            elif event in ("clear", "pause"):
+                continue
+            else:
+                lines.append(f"[{event}] " + ", ".join(f"{key}={value}" for key, value in entry.items() if key != "event"))
+                
+        return lines
@@ -0,0 +1,119 @@
+import os
+import sys
+
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+ERASE_LINE = "\x1b[K"  # From the cursor to the end of the line
+ERASE_BELOW = "\x1b[J"  # From the cursor to the end of the screen
+
+def move_to(row, column=1):
+    return f"\x1b[{row};{column}H"
+
+def enable_escape_sequences():
+    """Turn on escape sequence processing in a Windows console; a no-op elsewhere."""
+    if os.name != "nt":
+        return
+        
+    try:
+        import ctypes
+        
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        pass
+
+def get_terminal_size(fallback=(80, 24)):
+    """shutil.get_terminal_size without importing shutil, which brings re, bz2 and lzma along."""
+    sizes = []
+    for name in ("COLUMNS", "LINES"):
+        try:
+            sizes.append(int(os.environ[name]))
+        except (KeyError, ValueError):
+            sizes.append(0)
+            
+    if sizes[0] <= 0 or sizes[1] <= 0:
+        try:
+            terminal = os.get_terminal_size(sys.__stdout__.fileno())
+        except (AttributeError, ValueError, OSError):
+            terminal = os.terminal_size(fallback)
+        sizes = [size if size > 0 else (measured or default)
+                 for size, measured, default in zip(sizes, terminal, fallback)]
+        
+    return os.terminal_size(sizes)
+
+class Screen:
+    """Model of what a terminal shows, producing escape sequences instead of spawning clear.
+    
+    A frame is a screen that is drawn again and again, such as the battle
+    status. frame() returns the text that takes the terminal from its last
+    frame to the new one: only the changed rows are rewritten, then
+    everything printed below the frame since is erased. Output written
+    outside frames goes through track() so the model knows how far the
+    terminal has moved on; once the frame may have scrolled off, the next
+    frame clears and redraws in full.
+    """
+    
+    def __init__(self, size=None):
+        self.size = size  # (columns, lines), or None to ask the terminal
+        self.frame_key = None
+        self.frame_lines = []
+        self.rows_below = 0  # Rows used below the frame since it was drawn
+        self.column = 0
+        self.full_redraws = 0
+        self.partial_redraws = 0
+        
+    def get_size(self):
+        if self.size is not None:
+            return self.size
+        size = get_terminal_size()
+        return size.columns, size.lines
+        
+    def clear(self):
+        """Forget the current frame and return the clear sequence."""
+        self.frame_key = None
+        self.frame_lines = []
+        return CLEAR_SCREEN
+        
+    def track(self, text):
+        """Account for text written outside a frame."""
+        if self.frame_key is None or not text:
+            return
+            
+        columns = max(1, self.get_size()[0])
+        *lines, rest = text.split("\n")
+        for line in lines:
+            # A completed line takes at least one row, more if the terminal wraps it
+            self.rows_below += max(1, -(-(self.column + len(line)) // columns))
+            self.column = 0
+        self.column += len(rest)
+        
+    def frame(self, key, lines):
+        """Return the text that shows lines as frame key, redrawing only what changed."""
+        columns, height = self.get_size()
+        
+        fits = all(len(line) <= columns for line in lines)
+        # Rows in use, counting the cursor's row, must not have scrolled the frame's top off
+        on_screen = len(self.frame_lines) + self.rows_below < height
+        
+        if key != self.frame_key or not fits or not on_screen:
+            self.full_redraws += 1
+            output = [CLEAR_SCREEN]
+            output.extend(f"{line}\n" for line in lines)
+        else:
+            self.partial_redraws += 1
+            output = []
+            for row, line in enumerate(lines):
+                if row >= len(self.frame_lines) or self.frame_lines[row] != line:
+                    output.append(f"{move_to(row + 1)}{line}{ERASE_LINE}")
+                    
+            # Drop what was printed below the frame and leave the cursor where a full draw would
+            output.append(f"{move_to(len(lines) + 1)}{ERASE_BELOW}")
+            
+        self.frame_key = key
+        self.frame_lines = list(lines)
+        self.rows_below = 0
+        self.column = 0
+        
+        return "".join(output)
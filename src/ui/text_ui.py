@@ -1,18 +1,74 @@
-import os
+import sys
 import time
-import textwrap
-import random
+from ui.screen import Screen, enable_escape_sequences, get_terminal_size
+from ui.typewriter import Typewriter, CHARS_PER_SECOND
+from ui.wrap_cache import layout_cache
 
 class TextUI:
     """Handles text-based user interface elements."""
     
-    def __init__(self, width=80):
+    def __init__(self, width=80, chars_per_second=CHARS_PER_SECOND):
         self.width = width
-        self.wrapper = textwrap.TextWrapper(width=width)
+        # All output goes through write(), which keeps the screen model in step
+        self.screen = Screen()
+        # Typing effects; chars_per_second of 0 or None shows text instantly
+        self.typewriter = Typewriter(self, chars_per_second)
+        self.max_width = width
+        self.resize_pending = False
+        
+        enable_escape_sequences()
+        
+    def write(self, text):
+        """Write text to stdout, tracking where it leaves the terminal."""
+        self.screen.track(text)
+        sys.stdout.write(text)
+        
+    def flush(self):
+        sys.stdout.flush()
+        
+    def print(self, *values, end="\n"):
+        """Print through write(), like the print builtin."""
+        self.write(" ".join(str(value) for value in values) + end)
+        
+    def input(self, prompt=""):
+        """Read a line after a prompt, counting the echoed line on screen."""
+        self.write(prompt)
+        self.flush()
+        line = input()
+        self.screen.track("\n")
+        return line
+        
+    def resize(self, width):
+        """Change the layout width; cached layouts for the new width wrap on first use."""
+        self.width = width
+        
+    def watch_terminal_size(self):
+        """Follow terminal resizes up to the starting width, re-wrapping at the next render."""
+        # Imported here, after the title screen is up: signal brings in enum
+        import signal
+        
+        if not hasattr(signal, "SIGWINCH"):
+            return
+            
+        def on_resize(signum, frame):
+            self.resize_pending = True
+            
+        signal.signal(signal.SIGWINCH, on_resize)
+        self.resize_pending = True
+        
+    def wrap(self, text):
+        """Get the wrapped lines of text at the current width."""
+        if self.resize_pending:
+            self.resize_pending = False
+            columns = get_terminal_size((self.max_width, 24)).columns
+            self.resize(max(20, min(self.max_width, columns)))
+            
+        return layout_cache.wrap(text, self.width)
         
     def clear_screen(self):
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.write(self.screen.clear())
+        self.flush()
         
     def display_title_screen(self, title, subtitle=None):
         """Display a fancy title screen for the game."""
@@ -21,160 +77,158 @@ class TextUI:
         # Create a border
         border = "=" * self.width
         
-        print("\n\n")
-        print(border)
-        print()
+        self.print("\n\n")
+        self.print(border)
+        self.print()
         
         # Center the title
         padding = " " * ((self.width - len(title)) // 2)
-        print(f"{padding}{title}")
+        self.print(f"{padding}{title}")
         
         if subtitle:
             # Center the subtitle
             sub_padding = " " * ((self.width - len(subtitle)) // 2)
-            print(f"{sub_padding}{subtitle}")
+            self.print(f"{sub_padding}{subtitle}")
             
-        print()
-        print(border)
-        print("\n")
+        self.print()
+        self.print(border)
+        self.print("\n")
         
     def display_message(self, message, delay=0.5):
         """Display a message with an optional delay."""
-        wrapped_lines = self.wrapper.wrap(message)
+        wrapped_lines = self.wrap(message)
         for line in wrapped_lines:
-            print(line)
+            self.print(line)
         time.sleep(delay)
         
+    def pause(self, seconds):
+        """Pause to let the player read."""
+        time.sleep(seconds)
+        
     def display_narrative(self, text, typing_effect=True):
         """Display narrative text with an optional typing effect."""
-        wrapped_lines = self.wrapper.wrap(text)
+        wrapped_lines = self.wrap(text)
         
-        if typing_effect:
+        if typing_effect and not self.typewriter.instant:
             for line in wrapped_lines:
-                for char in line:
-                    print(char, end='', flush=True)
-                    time.sleep(0.02)
-                print()
+                self.typewriter.type(f"{line}\n")
                 time.sleep(0.3)
         else:
-            for line in wrapped_lines:
-                print(line)
-                
-        print()  # Add an extra line
+            self.typewriter.type("".join(f"{line}\n" for line in wrapped_lines))
+            
+        self.print()  # Add an extra line
         time.sleep(0.5)  # Pause after narrative
         
     def get_input(self, prompt):
         """Get text input from the user."""
-        print(f"{prompt}")
-        return input("> ").strip()
+        self.print(f"{prompt}")
+        return self.input("> ").strip()
         
     def get_choice(self, prompt, options):
         """Present a list of choices and get the user's selection."""
-        print(f"\n{prompt}")
+        self.print(f"\n{prompt}")
         
         for i, option in enumerate(options):
-            print(f"[{i+1}] {option}")
+            self.print(f"[{i+1}] {option}")
             
         while True:
             try:
-                choice = input("\nEnter your choice (number): ")
+                choice = self.input("\nEnter your choice (number): ")
                 choice_index = int(choice) - 1
                 
                 if 0 <= choice_index < len(options):
                     return choice_index
                 else:
-                    print("Invalid choice. Please try again.")
+                    self.print("Invalid choice. Please try again.")
             except ValueError:
-                print("Please enter a number.")
+                self.print("Please enter a number.")
                 
     def display_character_stats(self, character):
         """Display a character's stats."""
         self.clear_screen()
-        print(f"=== {character.name} ===")
-        print(f"Background: {character.background}")
-        print(f"Health: {character.current_health}/{character.max_health}")
-        print()
-        print("--- STATS ---")
-        print(f"TECH: {character.tech}  |  LOGIC: {character.logic}")
-        print(f"COMBAT: {character.combat}  |  ENDURANCE: {character.endurance}")
-        print(f"CHARM: {character.charm}  |  INSIGHT: {character.insight}")
-        print(f"MEDICINE: {character.medicine}  |  KNOWLEDGE: {character.knowledge}")
-        print()
-        input("Press Enter to continue...")
+        self.print(f"=== {character.name} ===")
+        self.print(f"Background: {character.background}")
+        self.print(f"Health: {character.current_health}/{character.max_health}")
+        self.print()
+        self.print("--- STATS ---")
+        self.print(f"TECH: {character.tech}  |  LOGIC: {character.logic}")
+        self.print(f"COMBAT: {character.combat}  |  ENDURANCE: {character.endurance}")
+        self.print(f"CHARM: {character.charm}  |  INSIGHT: {character.insight}")
+        self.print(f"MEDICINE: {character.medicine}  |  KNOWLEDGE: {character.knowledge}")
+        self.print()
+        self.input("Press Enter to continue...")
         
     def display_inventory(self, inventory):
         """Display the player's inventory."""
         self.clear_screen()
-        print("=== INVENTORY ===")
+        self.print("=== INVENTORY ===")
         
         if not inventory:
-            print("Your inventory is empty.")
+            self.print("Your inventory is empty.")
         else:
             for i, item in enumerate(inventory):
-                print(f"[{i+1}] {item.name} - {item.description}")
+                self.print(f"[{i+1}] {item.name} - {item.description}")
                 
-        print()
-        input("Press Enter to continue...")
+        self.print()
+        self.input("Press Enter to continue...")
         
     def display_battle_status(self, player_party, enemy_party):
         """Display the current status of a battle."""
-        self.clear_screen()
-        print("=== BATTLE ===")
+        lines = ["=== BATTLE ===", "YOUR PARTY:"]
         
-        print("YOUR PARTY:")
         for character in player_party:
             health_percentage = character.current_health / character.max_health
             health_bar = "█" * int(20 * health_percentage)
-            print(f"{character.name}: {health_bar} {character.current_health}/{character.max_health}")
+            lines.append(f"{character.name}: {health_bar} {character.current_health}/{character.max_health}")
             
-        print("\nENEMIES:")
+        lines += ["", "ENEMIES:"]
         for enemy in enemy_party:
             health_percentage = enemy.current_health / enemy.max_health
             health_bar = "█" * int(20 * health_percentage)
-            print(f"{enemy.name}: {health_bar} {enemy.current_health}/{enemy.max_health}")
+            lines.append(f"{enemy.name}: {health_bar} {enemy.current_health}/{enemy.max_health}")
             
-        print()
+        lines.append("")
+        
+        # Between turns usually only the health bars change, so only their rows are redrawn
+        sys.stdout.write(self.screen.frame("battle", lines))
+        self.flush()
         
     def display_shop_menu(self, shop_name, items):
         """Display a shop interface with items for sale."""
-        self.clear_screen()
-        print(f"=== {shop_name} ===")
+        lines = [f"=== {shop_name} ==="]
         
         for i, item in enumerate(items):
-            print(f"[{i+1}] {item.name} - {item.price} credits - {item.description}")
+            lines.append(f"[{i+1}] {item.name} - {item.price} credits - {item.description}")
             
-        print(f"[0] Exit shop")
-        print()
+        lines += [f"[0] Exit shop", ""]
+        sys.stdout.write(self.screen.frame("shop", lines))
+        self.flush()
         
     def display_dialogue(self, speaker, text, portrait=None):
         """Display a dialogue with a character."""
-        print(f"\n{speaker}: ", end="")
-        
-        for char in text:
-            print(char, end='', flush=True)
-            time.sleep(0.02)
-        print()
+        self.typewriter.write(f"\n{speaker}: ")
+        self.typewriter.type(f"{text}\n")
         
     def display_quest_log(self, quests):
         """Display the player's quest log."""
         self.clear_screen()
-        print("=== QUEST LOG ===")
+        self.print("=== QUEST LOG ===")
         
         active_quests = [q for q in quests if q.status == "active"]
         completed_quests = [q for q in quests if q.status == "completed"]
         
         if active_quests:
-            print("\nACTIVE QUESTS:")
+            self.print("\nACTIVE QUESTS:")
             for quest in active_quests:
-                print(f"- {quest.name}: {quest.description}")
+                self.print(f"- {quest.name}: {quest.description}")
                 
         if completed_quests:
-            print("\nCOMPLETED QUESTS:")
+            self.print("\nCOMPLETED QUESTS:")
             for quest in completed_quests:
-                print(f"- {quest.name}")
+                self.print(f"- {quest.name}")
                 
         if not quests:
-            print("No active quests.")
+            self.print("No active quests.")
             
-        print()
-        input("Press Enter to continue...") 
\ No newline at end of file
+        self.print()
+        self.input("Press Enter to continue...") 
\ No newline at end of file
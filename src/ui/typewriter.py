@@ -0,0 +1,61 @@
+import sys
+import time
+
+# Typing speed of the original per-character effect (one character every 20 ms)
+CHARS_PER_SECOND = 50
+
+# Typed text is flushed in chunks at this interval instead of once per character
+TYPING_TICK = 0.1
+
+class Typewriter:
+    """Typing effect that writes through one buffered stream in timed chunks.
+    
+    Each tick writes the characters due since the last one and flushes once,
+    so a line costs a few write calls instead of one per character. Sleeps
+    are scheduled against a deadline, so slow writes don't stretch the effect.
+    A chars_per_second of 0 or None is instant mode: text is written at once.
+    """
+    
+    def __init__(self, stream=None, chars_per_second=CHARS_PER_SECOND, tick=TYPING_TICK,
+                 sleep=time.sleep, clock=time.monotonic):
+        self.stream = stream  # None writes to whatever sys.stdout is at the time
+        self.chars_per_second = chars_per_second
+        self.tick = tick
+        self.sleep = sleep
+        self.clock = clock
+        
+    @property
+    def instant(self):
+        return not self.chars_per_second
+
+    @property
+    def output(self):
+        return self.stream or sys.stdout
+
+    def write(self, text):
+        """Write text to the buffered stream without flushing."""
+        self.output.write(text)
+
+    def flush(self):
+        self.output.flush()
+        
+    def type(self, text):
+        """Write text with the typing effect and flush it."""
+        output = self.output
+        if self.instant:
+            output.write(text)
+            output.flush()
+            return
+            
+        chunk_size = max(1, round(self.chars_per_second * self.tick))
+        deadline = self.clock()
+        
+        for start in range(0, len(text), chunk_size):
+            chunk = text[start:start + chunk_size]
+            output.write(chunk)
+            output.flush()
+            
+            deadline += len(chunk) / self.chars_per_second
+            remaining = deadline - self.clock()
+            if remaining > 0:
+                self.sleep(remaining)
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+# Dynamic strings (messages with the player's name, prices, damage) kept per process
+RECENT_LAYOUTS = 512
+
+class WrapCache:
+    """Memoized textwrap layouts per (text, width).
+    
+    Static story texts are pinned by warm() and live for the process; their
+    layouts for other widths are wrapped on first use, so a resize costs one
+    wrap per text actually shown afterwards. Every other text goes through
+    a bounded LRU. Layouts are tuples shared between callers.
+    
+    Lookups hash the text, which Python caches on the string object, and
+    compare it by identity first, so a hit on a node's own text is O(1).
+    """
+    
+    def __init__(self, max_recent=RECENT_LAYOUTS):
+        self.max_recent = max_recent
+        self.static = {}  # text -> {width: lines}
+        self.recent = OrderedDict()  # (text, width) -> lines, least recently used first
+        self.wrappers = {}  # width -> TextWrapper
+        self.hits = 0
+        self.misses = 0
+        
+    def _wrap(self, text, width):
+        self.misses += 1
+        wrapper = self.wrappers.get(width)
+        if wrapper is None:
+            # Imported on first use: textwrap brings in re, which the title screen doesn't need
+            import textwrap
+            
+            wrapper = self.wrappers[width] = textwrap.TextWrapper(width=width)
+        return tuple(wrapper.wrap(text))
+        
+    def wrap(self, text, width):
+        """Get the wrapped lines of text for a width."""
+        layouts = self.static.get(text)
+        if layouts is not None:
+            lines = layouts.get(width)
+            if lines is None:
+                lines = layouts[width] = self._wrap(text, width)
+            else:
+                self.hits += 1
+            return lines
+            
+        key = (text, width)
+        lines = self.recent.get(key)
+        if lines is not None:
+            self.hits += 1
+            self.recent.move_to_end(key)
+            return lines
+            
+        lines = self.recent[key] = self._wrap(text, width)
+        if len(self.recent) > self.max_recent:
+            self.recent.popitem(last=False)
+        return lines
+        
+    def warm(self, texts, width):
+        """Pin static texts and wrap them for a width ahead of their first render."""
+        for text in texts:
+            layouts = self.static.setdefault(text, {})
+            if width not in layouts:
+                layouts[width] = self._wrap(text, width)
+                
+    def clear(self):
+        self.static.clear()
+        self.recent.clear()
+
+# Shared by every UI in the process, so sessions reuse each other's layouts
+layout_cache = WrapCache()
+
+def warm_story_layouts(story_nodes, width):
+    """Warm layouts for every node text when the story comes from a bundle.
+    
+    Bundle records decode in about a millisecond; the fragment fallback
+    would have to import every fragment, so it is left to wrap lazily.
+    """
+    from story.bundle import StoryBundle
+    
+    if isinstance(story_nodes, StoryBundle):
+        layout_cache.warm((node.text for node in story_nodes.values()), width)